@@ -0,0 +1,9 @@
+import os
+
+import uvicorn
+
+from src.langgraphagenticai.api.server import create_app
+
+if __name__ == "__main__":
+  uvicorn.run(create_app(), host=os.getenv("API_HOST", "0.0.0.0"), port=int(os.getenv("API_PORT", "8000")),
+              log_level=os.getenv("API_LOG_LEVEL", "info"))
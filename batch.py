@@ -0,0 +1,27 @@
+import argparse
+import sys
+
+from src.langgraphagenticai.batch_runner import run_batch
+
+if __name__ == "__main__":
+  parser = argparse.ArgumentParser(description="Run a JSONL file of prompts through a use case graph")
+  parser.add_argument("input", help="JSONL file with one prompt per line")
+  parser.add_argument("-o", "--output", required=True, help="JSONL file the results are written to")
+  parser.add_argument("--usecase", default="Basic Chatbot", help="Use case of prompts that do not name one")
+  parser.add_argument("--provider", default="Groq", help="Groq, OpenAI, Gemini or Auto")
+  parser.add_argument("--model", help="Model name (default: the provider's first model option)")
+  parser.add_argument("--days", default="3 days", help="News window for AI News Summarizer prompts")
+  parser.add_argument("-c", "--concurrency", type=int, default=4, help="Prompts run at once")
+  parser.add_argument("--timeout", type=float, help="Seconds one prompt may take")
+  parser.add_argument("--resume", action="store_true", help="Append to the output and skip prompts already done")
+  parser.add_argument("--summary", help="Also write the run summary as JSON to this file")
+  parser.add_argument("--semantic-cache", action="store_true",
+                      help="Answer repeated Basic Chatbot prompts from the semantic response cache")
+  parser.add_argument("--precomputed-digests", action="store_true",
+                      help="Answer AI News Summarizer prompts from a recent stored digest")
+  args = parser.parse_args()
+  summary = run_batch(args.input, summary_path=args.summary, output_path=args.output, usecase=args.usecase,
+                      provider=args.provider, model=args.model, days=args.days, concurrency=args.concurrency,
+                      timeout=args.timeout, resume=args.resume,
+                      semantic_cache=args.semantic_cache, precomputed_digests=args.precomputed_digests)
+  sys.exit(1 if summary["failed"] else 0)
@@ -0,0 +1,68 @@
+"""
+Load test: concurrent conversations served by worker threads (graph.invoke) against one event loop (graph.ainvoke).
+
+The sync run is bounded by its thread pool, each in-flight turn holding a
+thread while it waits on the model; the async run keeps every turn in flight
+on a single thread with the native async nodes.
+
+Run from the repository root:
+    python -m benchmarks.bench_async_load --conversations 50 200 500 --threads 32
+"""
+import argparse
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from src.langgraphagenticai.graph.graph_builder import GraphBuilder
+from benchmarks.fakes import FakeChatModel, FakeTavilyClient, FakeAsyncTavilyClient, make_fake_search_tool
+from benchmarks.run_suite import make_state
+
+USECASES = ["Basic Chatbot", "Chatbot with Web", "AI News Summarizer"]
+
+
+def build_graph(usecase, args):
+    model = FakeChatModel(response=" ".join(["token"] * 20), latency=args.llm_latency)
+    news_options = {"client": FakeTavilyClient(latency=args.search_latency),
+                    "async_client": FakeAsyncTavilyClient(latency=args.search_latency), "use_cache": False,
+                    "use_article_index": False}
+    builder = GraphBuilder(model, semantic_cache=False, tools=[make_fake_search_tool(args.search_latency)],
+                           news_fetcher_options=news_options)
+    return builder.setup_graph(usecase)
+
+
+def run_threaded(graph, usecase, conversations, threads):
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        list(pool.map(lambda i: graph.invoke(make_state(usecase, i)), range(conversations)))
+    return time.perf_counter() - start
+
+
+async def run_async(graph, usecase, conversations):
+    start = time.perf_counter()
+    await asyncio.gather(*(graph.ainvoke(make_state(usecase, i)) for i in range(conversations)))
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--usecases", nargs="+", default=USECASES[:2], choices=USECASES)
+    parser.add_argument("--conversations", type=int, nargs="+", default=[50, 200, 500])
+    parser.add_argument("--threads", type=int, default=32, help="Worker threads for the sync run")
+    parser.add_argument("--llm-latency", type=float, default=0.2, help="Seconds per fake model call")
+    parser.add_argument("--search-latency", type=float, default=0.2, help="Seconds per fake search")
+    args = parser.parse_args()
+
+    print(f"{'usecase':<20}{'convs':>7}{'sync s':>9}{'sync rps':>10}{'async s':>9}{'async rps':>11}"
+          f"{'speedup':>9}")
+    for usecase in args.usecases:
+        graph = build_graph(usecase, args)
+        graph.invoke(make_state(usecase, -1))  # warm-up
+        for conversations in args.conversations:
+            threaded = run_threaded(graph, usecase, conversations, args.threads)
+            asynced = asyncio.run(run_async(graph, usecase, conversations))
+            print(f"{usecase:<20}{conversations:>7}{threaded:>9.2f}{conversations / threaded:>10.1f}"
+                  f"{asynced:>9.2f}{conversations / asynced:>11.1f}{threaded / asynced:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
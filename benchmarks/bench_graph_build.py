@@ -0,0 +1,49 @@
+"""
+Compare per-turn graph setup cost with and without the graph registry.
+
+Run from the repository root:
+    python -m benchmarks.bench_graph_build
+"""
+import argparse
+import os
+import statistics
+import time
+
+from src.langgraphagenticai.graph.graph_builder import GraphBuilder
+from src.langgraphagenticai.graph.graph_registry import GraphRegistry
+from benchmarks.fakes import FakeChatModel
+
+USECASES = ["Basic Chatbot", "Chatbot with Web", "AI News Summarizer"]
+
+
+def time_ms(fn, iterations):
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+
+    # The web search tool only needs a key to be constructed; nothing is sent
+    os.environ.setdefault("TAVILY_API_KEY", "benchmark-key")
+    model = FakeChatModel()
+    registry = GraphRegistry()
+
+    print(f"{'usecase':<22}{'rebuild (ms)':>14}{'registry (ms)':>15}{'speedup':>10}")
+    for usecase in USECASES:
+        key = GraphRegistry.make_key(usecase, "Fake", "fake-chat")
+        rebuild = time_ms(lambda: GraphBuilder(model).setup_graph(usecase), args.iterations)
+        registry.get_or_build(key, lambda: GraphBuilder(model).setup_graph(usecase))
+        cached = time_ms(lambda: registry.get_or_build(key, lambda: GraphBuilder(model).setup_graph(usecase)),
+                         args.iterations)
+        print(f"{usecase:<22}{rebuild:>14.3f}{cached:>15.4f}{rebuild / cached:>9.0f}x")
+
+
+if __name__ == "__main__":
+    main()
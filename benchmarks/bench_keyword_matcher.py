@@ -0,0 +1,72 @@
+"""
+Micro-benchmark the precompiled keyword matcher against the per-article substring loop.
+
+Run from the repository root:
+    python -m benchmarks.bench_keyword_matcher --articles 5000
+"""
+import argparse
+import random
+import time
+
+from src.langgraphagenticai.utils.keyword_matcher import KeywordMatcher
+from src.langgraphagenticai.utils.news_fetcher import NewsFetcher
+
+FILLER = ("the company said again that its quarterly results were strong and it plans to expand "
+          "into new markets while hiring more engineers for several teams across the world").split()
+TOPICAL = ["AI", "machine learning", "LLM", "startups", "neural networks", "OpenAI", "automation"]
+
+
+def substring_loop(text):
+    # The relevance check as it was written before KeywordMatcher
+    title_content = text.lower()
+    ai_keywords = ['ai', 'artificial intelligence', 'machine learning', 'ml', 'deep learning',
+                   'neural network', 'chatgpt', 'gpt', 'llm', 'gemini', 'claude', 'openai',
+                   'tech', 'technology', 'startup', 'algorithm', 'data science', 'automation']
+    return any(keyword in title_content for keyword in ai_keywords)
+
+
+def make_texts(count, seed):
+    rng = random.Random(seed)
+    texts = []
+    for i in range(count):
+        words = rng.choices(FILLER, k=160)
+        if i % 2 == 0:
+            for _ in range(3):
+                words[rng.randrange(len(words))] = rng.choice(TOPICAL)
+        texts.append(" ".join(words))
+    return texts
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--articles", type=int, default=5000)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    texts = make_texts(args.articles, args.seed)
+    matcher = KeywordMatcher(NewsFetcher.AI_KEYWORDS)
+
+    start = time.perf_counter()
+    loop_hits = sum(substring_loop(text) for text in texts)
+    loop_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    matcher_hits = sum(matcher.matches(text) for text in texts)
+    match_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    counted = sum(1 for text in texts if matcher.count(text))
+    count_time = time.perf_counter() - start
+
+    truly_relevant = (len(texts) + 1) // 2
+    print(f"{len(texts)} articles, {truly_relevant} mention AI topics, all contain 'said'/'again'")
+    print(f"{'method':<22}{'time (ms)':>10}{'us/article':>12}{'relevant':>10}{'false hits':>12}")
+    for name, elapsed, hits in [("substring loop", loop_time, loop_hits),
+                                ("matcher.matches", match_time, matcher_hits),
+                                ("matcher.count", count_time, counted)]:
+        print(f"{name:<22}{elapsed * 1000:>10.1f}{elapsed * 1e6 / len(texts):>12.1f}"
+              f"{hits:>10}{hits - truly_relevant:>12}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""
+Benchmark: web search calls and tool latency with and without the local article index.
+
+A fake news fetch indexes --articles synthetic articles about AI companies.
+Half of the questions then ask about indexed stories (in different words),
+the other half about topics the index has never seen. Every question goes
+through the local-first search tool wrapping a fake web search with
+--search-latency seconds of latency, and then once more to show that web
+results are indexed too. Time-sensitive questions (prices, weather) go to
+the web on every pass.
+
+Run from the repository root:
+    python -m benchmarks.bench_local_index --articles 200 --search-latency 0.8
+"""
+import argparse
+import random
+import time
+
+from langchain_core.tools import StructuredTool
+
+from src.langgraphagenticai.tools.local_first_tool import LocalFirstSearchTool
+from src.langgraphagenticai.utils.article_index import ArticleIndex
+from src.langgraphagenticai.utils.embeddings import HashingEmbedder
+
+COMPANIES = ["OpenAI", "Anthropic", "Google DeepMind", "Meta", "Nvidia", "Mistral", "Cohere", "xAI",
+             "Microsoft", "Amazon", "Apple", "Hugging Face", "Perplexity", "Databricks", "Stability AI"]
+EVENTS = [
+    ("released a new reasoning model", "The model scores higher on coding and math benchmarks than its predecessor.",
+     "new reasoning model release"),
+    ("raised a funding round", "The round values the company at several billion dollars and was led by venture investors.",
+     "funding round valuation"),
+    ("opened a research lab in Europe", "The lab will hire researchers to work on model safety and efficiency.",
+     "research lab Europe"),
+    ("cut API prices", "Developers now pay less per million tokens for the company's flagship models.",
+     "API price cut per million tokens"),
+    ("announced custom AI chips", "The accelerators are designed to lower the cost of training and inference.",
+     "custom AI chips accelerators"),
+]
+UNSEEN = ["weather forecast Lisbon weekend", "World Cup 2026 qualifier results", "best sourdough bread recipe",
+          "Mars rover geology findings", "interest rate decision central bank", "marathon training plan beginners"]
+
+
+def make_articles(count, rng):
+    articles = []
+    for i in range(count):
+        company, (event, detail, _) = COMPANIES[i % len(COMPANIES)], EVENTS[(i // len(COMPANIES)) % len(EVENTS)]
+        filler = " ".join(rng.sample(["Analysts expect competitors to respond soon.",
+                                      "The announcement was made at a press event on Tuesday.",
+                                      "Shares of partner companies moved after the news.",
+                                      "Customers will get access over the coming weeks.",
+                                      "The company did not disclose further details."], 3))
+        articles.append({"title": f"{company} {event}", "url": f"https://news.example.com/{i}",
+                         "content": f"{company} {event} this week. {detail} {filler}",
+                         "published_date": "2025-01-01"})
+    return articles
+
+
+def make_web_tool(latency, counter):
+    def search(query: str):
+        counter["calls"] += 1
+        time.sleep(latency)
+        results = [{"title": f"Result {i} for {query}", "url": f"https://web.example.com/{abs(hash(query))}/{i}",
+                    "content": f"{query}. This page reports on {query} in detail with the latest figures."}
+                   for i in range(2)]
+        return results, {"results": results}
+
+    return StructuredTool.from_function(search, name="tavily_search_results_json", response_format="content_and_artifact",
+                                        description="A search engine. Useful for answering questions about current events.")
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+def run(tool, queries):
+    latencies = []
+    for query in queries:
+        start = time.perf_counter()
+        tool.invoke({"query": query})
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--articles", type=int, default=200)
+    parser.add_argument("--questions", type=int, default=24)
+    parser.add_argument("--search-latency", type=float, default=0.8)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+    rng = random.Random(args.seed)
+
+    index = ArticleIndex(index_dir=None, embedder=HashingEmbedder())
+    start = time.perf_counter()
+    index.add_documents(make_articles(args.articles, rng), source="news")
+    print(f"indexed {args.articles} articles ({index.stats()['chunks']} chunks) in "
+          f"{(time.perf_counter() - start) * 1000:.0f} ms")
+
+    seen = [f"{company} {keywords}" for company in COMPANIES for _, _, keywords in EVENTS]
+    queries = rng.sample(seen, args.questions // 2) + [rng.choice(UNSEEN) for _ in range(args.questions // 2)]
+    rng.shuffle(queries)
+
+    print(f"{'setup':<28}{'web calls':>10}{'p50 ms':>9}{'p95 ms':>9}")
+    for name, wrap in (("web search only", False), ("local index first", True), ("local index, repeat", True)):
+        counter = {"calls": 0}
+        web = make_web_tool(args.search_latency, counter)
+        tool = LocalFirstSearchTool(web, index=index) if wrap else web
+        latencies = run(tool, queries)
+        if wrap:
+            # Let the background indexing of the web results finish before the repeat
+            time.sleep(0.2)
+        print(f"{name:<28}{counter['calls']:>10}" + "".join(f"{percentile(latencies, pct) * 1000:>9.0f}"
+                                                          for pct in (50, 95)))
+
+
+if __name__ == "__main__":
+    main()
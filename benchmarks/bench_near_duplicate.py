@@ -0,0 +1,78 @@
+"""
+Benchmark near-duplicate detection on a synthetic news corpus.
+
+The corpus mixes unique articles with syndicated copies (a few words edited,
+tracking parameters or a mirror URL). Reports fingerprinting and filtering
+time plus precision/recall of the dropped copies for several thresholds.
+
+Run from the repository root:
+    python -m benchmarks.bench_near_duplicate --articles 10000
+"""
+import argparse
+import random
+import time
+
+from src.langgraphagenticai.utils.near_duplicate import NearDuplicateDetector
+
+
+def make_corpus(total, duplicate_ratio, seed):
+    rng = random.Random(seed)
+    vocabulary = [f"w{i}" for i in range(20000)]
+    originals = int(total * (1 - duplicate_ratio))
+    articles = []
+    for i in range(originals):
+        words = rng.choices(vocabulary, k=160)
+        articles.append({'title': " ".join(words[:8]), 'content': " ".join(words[8:]),
+                         'url': f"https://techcrunch.com/2025/story-{i}", 'score': rng.random(),
+                         'story': i})
+    for j in range(total - originals):
+        source = articles[rng.randrange(originals)]
+        words = source['content'].split()
+        for _ in range(rng.randint(1, 6)):
+            words[rng.randrange(len(words))] = rng.choice(vocabulary)
+        url = rng.choice([source['url'] + f"?utm_source=feed{j}",
+                          f"https://medium.com/@mirror/copy-{j}",
+                          f"https://venturebeat.com/mirror/{j}"])
+        articles.append({'title': source['title'], 'content': " ".join(words), 'url': url,
+                         'score': rng.random(), 'story': source['story']})
+    rng.shuffle(articles)
+    return articles
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--articles", type=int, default=10000)
+    parser.add_argument("--duplicate-ratio", type=float, default=0.2)
+    parser.add_argument("--thresholds", type=int, nargs="+", default=[3, 6, 10, 14])
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    corpus = make_corpus(args.articles, args.duplicate_ratio, args.seed)
+    stories = len({article['story'] for article in corpus})
+    print(f"{len(corpus)} articles, {stories} distinct stories")
+
+    detector = NearDuplicateDetector()
+    start = time.perf_counter()
+    detector.fingerprints(f"{a['title']} {a['content']}" for a in corpus)
+    print(f"fingerprinting: {time.perf_counter() - start:.2f}s")
+
+    print(f"{'max distance':>12}{'time (s)':>10}{'kept':>8}{'precision':>11}{'recall':>8}")
+    for threshold in args.thresholds:
+        detector = NearDuplicateDetector(max_distance=threshold)
+        start = time.perf_counter()
+        kept = detector.deduplicate(corpus)
+        elapsed = time.perf_counter() - start
+
+        kept_ids = {id(article) for article in kept}
+        dropped = [article for article in corpus if id(article) not in kept_ids]
+        kept_stories = {article['story'] for article in kept}
+        # A drop is correct when its story is still represented by a kept copy
+        true_drops = len(corpus) - stories
+        correct = len(dropped) - (stories - len(kept_stories))
+        precision = correct / len(dropped) if dropped else 1.0
+        recall = correct / true_drops if true_drops else 1.0
+        print(f"{threshold:>12}{elapsed:>10.2f}{len(kept):>8}{precision:>11.3f}{recall:>8.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Benchmark: tail latency of a single provider against the latency router over several providers.
+
+Each fake provider follows a latency script: the primary is usually fast but
+every --tail-every-th call takes --tail seconds, a second provider is steady
+but slower, and a third always fails. The router sends calls to the fastest
+healthy provider and hedges calls that run past the primary's p95.
+
+Run from the repository root:
+    python -m benchmarks.bench_router --calls 200 --concurrency 8
+"""
+import argparse
+import asyncio
+import time
+
+from langchain_core.messages import HumanMessage
+
+from src.langgraphagenticai.LLMS.router import LatencyRouterChatModel, ProviderHealthRegistry
+from benchmarks.fakes import FakeChatModel
+
+
+def make_providers(args):
+    primary = [args.fast] * (args.tail_every - 1) + [args.tail]
+    return {
+        "Fast/tail": FakeChatModel(response="fast reply", latency_script=primary),
+        "Steady/slow": FakeChatModel(response="steady reply", latency=args.steady),
+        "Broken/down": FakeChatModel(response="never", latency_script=[None]),
+    }
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+async def measure(model, calls, concurrency, stream):
+    slots = asyncio.Semaphore(concurrency)
+    latencies = []
+
+    async def one(i):
+        async with slots:
+            start = time.perf_counter()
+            if stream:
+                async for _ in model.astream([HumanMessage(f"question {i}")]):
+                    break
+            else:
+                await model.ainvoke([HumanMessage(f"question {i}")])
+            latencies.append(time.perf_counter() - start)
+
+    await asyncio.gather(*(one(i) for i in range(calls)))
+    return latencies
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--fast", type=float, default=0.05, help="Usual latency of the primary provider")
+    parser.add_argument("--tail", type=float, default=1.5, help="Latency of the primary's slow calls")
+    parser.add_argument("--tail-every", type=int, default=10, help="Every n-th primary call is slow")
+    parser.add_argument("--steady", type=float, default=0.2, help="Latency of the backup provider")
+    parser.add_argument("--min-hedge-delay", type=float, default=0.1,
+                        help="Router's lower bound on the hedge delay, scaled down to the fake latencies")
+    args = parser.parse_args()
+
+    print(f"{'setup':<26}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'max ms':>9}")
+    for stream in (False, True):
+        mode = "first chunk" if stream else "invoke"
+        providers = make_providers(args)
+        single = providers["Fast/tail"]
+        router = LatencyRouterChatModel(models=providers, health=ProviderHealthRegistry(),
+                                        min_hedge_delay=args.min_hedge_delay)
+        for name, model in ((f"single provider ({mode})", single), (f"router ({mode})", router)):
+            latencies = asyncio.run(measure(model, args.calls, args.concurrency, stream))
+            print(f"{name:<26}" + "".join(f"{percentile(latencies, pct) * 1000:>9.0f}" for pct in (50, 95, 99))
+                  + f"{max(latencies) * 1000:>9.0f}")
+        for label, stats in router.health.stats().items():
+            print(f"  {label:<24}healthy={stats['healthy']} " + " ".join(f"{k}={v}" for k, v in stats.items()
+                                                                        if k != "healthy" and v is not None))
+
+
+if __name__ == "__main__":
+    main()
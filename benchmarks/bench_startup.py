@@ -0,0 +1,143 @@
+"""
+Benchmark: cold-start cost of the app's entry points.
+
+Every sample runs in a fresh interpreter, so nothing is cached by an earlier
+import. For each entry point module the benchmark reports the median import
+time and which heavy SDKs the import pulled in; for the Streamlit app it
+reports the time of the first script run (imports plus the first render,
+through streamlit's AppTest harness, no API keys needed) and of a rerun.
+Results are written as JSON so runs can be compared across commits, and
+--compare flags metrics that got slower by more than --tolerance.
+
+Run from the repository root:
+    python -m benchmarks.bench_startup
+    python -m benchmarks.bench_startup --runs 10 --compare benchmarks/results/startup-old.json
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+from datetime import datetime
+
+from benchmarks.run_suite import RESULTS_DIR, git_commit
+
+ENTRY_POINTS = {
+    "streamlit app": "src.langgraphagenticai.main",
+    "http api": "src.langgraphagenticai.api.server",
+    "news worker": "src.langgraphagenticai.news_worker",
+}
+# Modules a session should only load when it uses the matching provider, tool or use case
+HEAVY_MODULES = ["langchain_groq", "langchain_openai", "langchain_google_genai", "langchain_community",
+                 "langgraph.prebuilt", "tavily", "faiss", "tiktoken"]
+
+IMPORT_SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+print(json.dumps({{"seconds": time.perf_counter() - start,
+                  "loaded": [name for name in {heavy!r} if name in sys.modules]}}))
+"""
+
+RENDER_SCRIPT = """
+import json, logging, time
+logging.disable(logging.WARNING)
+from streamlit.testing.v1 import AppTest
+app = AppTest.from_file("app.py", default_timeout=120)
+start = time.perf_counter()
+app.run()
+first = time.perf_counter() - start
+start = time.perf_counter()
+app.run()
+print(json.dumps({"first_render": first, "rerun": time.perf_counter() - start,
+                  "errors": [error.value for error in app.exception]}))
+"""
+
+
+def run_python(script):
+    completed = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True)
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def bench_imports(runs):
+    results = {}
+    for name, module in ENTRY_POINTS.items():
+        samples = [run_python(IMPORT_SCRIPT.format(module=module, heavy=HEAVY_MODULES)) for _ in range(runs)]
+        results[name] = {"import_ms_p50": statistics.median(sample["seconds"] for sample in samples) * 1000,
+                         "loaded": samples[-1]["loaded"]}
+    return results
+
+
+def bench_render(runs):
+    samples = [run_python(RENDER_SCRIPT) for _ in range(runs)]
+    if samples[-1]["errors"]:
+        print(f"warning: the app raised {samples[-1]['errors']}")
+    return {"first_render_ms_p50": statistics.median(sample["first_render"] for sample in samples) * 1000,
+            "rerun_ms_p50": statistics.median(sample["rerun"] for sample in samples) * 1000}
+
+
+def flatten(results):
+    metrics = {f"{name} import_ms_p50": result["import_ms_p50"] for name, result in results["imports"].items()}
+    metrics.update({f"streamlit app {metric}": value for metric, value in results["render"].items()})
+    return metrics
+
+
+def print_comparison(results, baseline_path, tolerance, min_delta_ms):
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = json.load(f)
+    print(f"\nChange against {baseline_path} (commit {baseline['meta'].get('commit')}):")
+    old_metrics = flatten(baseline["results"])
+    regressions = 0
+    for metric, value in flatten(results).items():
+        old = old_metrics.get(metric)
+        if not old:
+            continue
+        change = (value - old) / old
+        flag = "  <-- regression" if change > tolerance and value - old > min_delta_ms else ""
+        regressions += bool(flag)
+        print(f"  {metric:<40}{old:>9.0f} -> {value:>6.0f} ms ({change * 100:+.1f}%){flag}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5, help="Fresh interpreters per measurement")
+    parser.add_argument("--output", help="Results JSON path (default: benchmarks/results/startup-<time>-<commit>.json)")
+    parser.add_argument("--compare", help="Earlier results JSON to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.15,
+                        help="Relative slowdown reported as a regression when comparing")
+    parser.add_argument("--min-delta-ms", type=float, default=10.0,
+                        help="Smallest absolute slowdown reported as a regression (ignores noise on fast reruns)")
+    args = parser.parse_args()
+
+    print("Timing imports...", flush=True)
+    results = {"imports": bench_imports(args.runs)}
+    print("Timing the first render...", flush=True)
+    results["render"] = bench_render(args.runs)
+
+    meta = {
+        "commit": git_commit(),
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "parameters": {"runs": args.runs},
+    }
+    output = args.output or os.path.join(RESULTS_DIR, f"startup-{datetime.now():%Y%m%d-%H%M%S}-{meta['commit']}.json")
+    os.makedirs(os.path.dirname(output) or ".", exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump({"meta": meta, "results": results}, f, indent=2)
+
+    print(f"\n{'entry point':<16}{'import ms':>10}  heavy modules loaded")
+    for name, result in results["imports"].items():
+        print(f"{name:<16}{result['import_ms_p50']:>10.0f}  {', '.join(result['loaded']) or '-'}")
+    print(f"\nstreamlit app first render {results['render']['first_render_ms_p50']:.0f} ms, "
+          f"rerun {results['render']['rerun_ms_p50']:.0f} ms")
+    print(f"\nResults written to {output}")
+    if args.compare and print_comparison(results, args.compare, args.tolerance, args.min_delta_ms):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
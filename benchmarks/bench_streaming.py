@@ -0,0 +1,59 @@
+"""
+Measure time to first token with token streaming against waiting for graph.invoke.
+
+Run from the repository root:
+    python -m benchmarks.bench_streaming --latency 0.3 --token-latency 0.02
+"""
+import argparse
+import os
+import statistics
+import time
+
+from langchain_core.messages import AIMessageChunk, HumanMessage
+
+from src.langgraphagenticai.graph.graph_builder import GraphBuilder
+from benchmarks.fakes import FakeChatModel
+
+USECASES = ["Basic Chatbot", "Chatbot with Web"]
+
+
+def first_token_seconds(graph, state):
+    start = time.perf_counter()
+    first_token = None
+    for mode, payload in graph.stream(state, stream_mode=["messages", "updates"]):
+        if first_token is None and mode == "messages" and isinstance(payload[0], AIMessageChunk) and payload[0].content:
+            first_token = time.perf_counter() - start
+    return first_token, time.perf_counter() - start
+
+
+def invoke_seconds(graph, state):
+    start = time.perf_counter()
+    graph.invoke(state)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=5)
+    parser.add_argument("--latency", type=float, default=0.3, help="Seconds before the fake model's first token")
+    parser.add_argument("--token-latency", type=float, default=0.02, help="Seconds between fake tokens")
+    parser.add_argument("--tokens", type=int, default=60, help="Number of tokens in the fake response")
+    args = parser.parse_args()
+
+    os.environ.setdefault("TAVILY_API_KEY", "benchmark-key")
+    model = FakeChatModel(response=" ".join(["token"] * args.tokens),
+                          latency=args.latency, token_latency=args.token_latency)
+
+    print(f"{'usecase':<20}{'invoke (s)':>12}{'stream TTFT (s)':>17}{'stream total (s)':>18}")
+    for usecase in USECASES:
+        graph = GraphBuilder(model).setup_graph(usecase)
+        state = lambda: {"messages": [HumanMessage(content="What is new in AI?")]}
+        invoked = [invoke_seconds(graph, state()) for _ in range(args.iterations)]
+        streamed = [first_token_seconds(graph, state()) for _ in range(args.iterations)]
+        print(f"{usecase:<20}{statistics.median(invoked):>12.3f}"
+              f"{statistics.median(s[0] for s in streamed):>17.3f}"
+              f"{statistics.median(s[1] for s in streamed):>18.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,169 @@
+import asyncio
+import json
+import time
+from typing import Any, Dict, Iterator, AsyncIterator, List, Optional
+
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk, BaseMessage, ToolMessage
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+from langchain_core.tools import StructuredTool
+from pydantic import PrivateAttr
+
+
+class FakeChatModel(BaseChatModel):
+    """
+    Offline chat model with configurable latency and token output, used to
+    measure this project's own overhead without calling a provider.
+
+    When bound to tools it first answers with a call to the first tool (using
+    the latest message as the query), then with the text response once a tool
+    result is in the conversation.
+    """
+
+    response: str = "This is a fake response from the benchmark chat model."
+    latency: float = 0.0
+    token_latency: float = 0.0
+    tool_call_name: Optional[str] = None
+    # Per-call latencies used in turn instead of `latency`; None makes that call fail
+    latency_script: Optional[List[Optional[float]]] = None
+    _calls: int = PrivateAttr(default=0)
+
+    @property
+    def _llm_type(self) -> str:
+        return "fake-chat"
+
+    def bind_tools(self, tools: Any, **kwargs: Any) -> "FakeChatModel":
+        names = [getattr(t, "name", None) or getattr(t, "__name__", None) for t in tools]
+        return self.model_copy(update={"tool_call_name": names[0] if names else None})
+
+    def _next_latency(self) -> float:
+        if not self.latency_script:
+            return self.latency
+        latency = self.latency_script[self._calls % len(self.latency_script)]
+        self._calls += 1
+        if latency is None:
+            raise RuntimeError("Scripted provider failure")
+        return latency
+
+    def _tokens(self) -> List[str]:
+        words = self.response.split(" ")
+        return [word if i == 0 else " " + word for i, word in enumerate(words)]
+
+    def _tool_call(self, messages: List[BaseMessage]) -> Optional[Dict[str, Any]]:
+        if not self.tool_call_name or not messages or isinstance(messages[-1], ToolMessage):
+            return None
+        return {"name": self.tool_call_name, "args": {"query": str(messages[-1].content)[:200]},
+                "id": f"call_{len(messages)}"}
+
+    def _generate(self, messages: List[BaseMessage], stop: Optional[List[str]] = None,
+                  run_manager: Any = None, **kwargs: Any) -> ChatResult:
+        latency = self._next_latency()
+        tool_call = self._tool_call(messages)
+        if tool_call:
+            time.sleep(latency)
+            return ChatResult(generations=[ChatGeneration(message=AIMessage(content="", tool_calls=[tool_call]))])
+        time.sleep(latency + self.token_latency * len(self._tokens()))
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content=self.response))])
+
+    async def _agenerate(self, messages: List[BaseMessage], stop: Optional[List[str]] = None,
+                         run_manager: Any = None, **kwargs: Any) -> ChatResult:
+        latency = self._next_latency()
+        tool_call = self._tool_call(messages)
+        if tool_call:
+            await asyncio.sleep(latency)
+            return ChatResult(generations=[ChatGeneration(message=AIMessage(content="", tool_calls=[tool_call]))])
+        await asyncio.sleep(latency + self.token_latency * len(self._tokens()))
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content=self.response))])
+
+    def _tool_call_chunk(self, tool_call: Dict[str, Any]) -> ChatGenerationChunk:
+        return ChatGenerationChunk(message=AIMessageChunk(content="", tool_call_chunks=[{
+            "name": tool_call["name"], "args": json.dumps(tool_call["args"]),
+            "id": tool_call["id"], "index": 0}]))
+
+    def _stream(self, messages: List[BaseMessage], stop: Optional[List[str]] = None,
+                run_manager: Any = None, **kwargs: Any) -> Iterator[ChatGenerationChunk]:
+        time.sleep(self._next_latency())
+        tool_call = self._tool_call(messages)
+        if tool_call:
+            yield self._tool_call_chunk(tool_call)
+            return
+        for token in self._tokens():
+            time.sleep(self.token_latency)
+            chunk = ChatGenerationChunk(message=AIMessageChunk(content=token))
+            if run_manager:
+                run_manager.on_llm_new_token(token, chunk=chunk)
+            yield chunk
+
+    async def _astream(self, messages: List[BaseMessage], stop: Optional[List[str]] = None,
+                       run_manager: Any = None, **kwargs: Any) -> AsyncIterator[ChatGenerationChunk]:
+        await asyncio.sleep(self._next_latency())
+        tool_call = self._tool_call(messages)
+        if tool_call:
+            yield self._tool_call_chunk(tool_call)
+            return
+        for token in self._tokens():
+            await asyncio.sleep(self.token_latency)
+            chunk = ChatGenerationChunk(message=AIMessageChunk(content=token))
+            if run_manager:
+                await run_manager.on_llm_new_token(token, chunk=chunk)
+            yield chunk
+
+
+class FakeTavilyClient:
+    """
+    Offline stand-in for TavilyClient returning deterministic AI news results
+    after a configurable latency
+    """
+
+    def __init__(self, latency: float = 0.0, content_words: int = 150):
+        self.latency = latency
+        self.content_words = content_words
+        self.calls = 0
+
+    def search(self, query: str, max_results: int = 5, **kwargs: Any) -> Dict[str, Any]:
+        self.calls += 1
+        time.sleep(self.latency)
+        return self._response(query, max_results)
+
+    def _response(self, query: str, max_results: int) -> Dict[str, Any]:
+        results = []
+        for i in range(max_results):
+            words = [f"{query.split()[0].lower()}{(i * 7 + j) % 97}" for j in range(self.content_words)]
+            results.append({
+                "title": f"{query} story {i}",
+                "content": f"AI and machine learning news about {query}: " + " ".join(words),
+                "url": f"https://techcrunch.com/{query.replace(' ', '-').lower()}/{i}",
+                "published_date": "2025-01-01",
+                "score": round(1.0 - i * 0.05, 3),
+            })
+        return {"query": query, "results": results}
+
+
+class FakeAsyncTavilyClient(FakeTavilyClient):
+    """
+    Offline stand-in for AsyncTavilyClient
+    """
+
+    async def search(self, query: str, max_results: int = 5, **kwargs: Any) -> Dict[str, Any]:
+        self.calls += 1
+        await asyncio.sleep(self.latency)
+        return self._response(query, max_results)
+
+
+def make_fake_search_tool(latency: float = 0.0, name: str = "tavily_search_results_json"):
+    """
+    Build an offline web search tool with the same name as the Tavily tool
+    """
+    def results(query: str) -> List[Dict[str, str]]:
+        return [{"url": f"https://example.com/{i}", "content": f"Result {i} for {query}"} for i in range(2)]
+
+    def fake_search(query: str) -> List[Dict[str, str]]:
+        time.sleep(latency)
+        return results(query)
+
+    async def afake_search(query: str) -> List[Dict[str, str]]:
+        await asyncio.sleep(latency)
+        return results(query)
+
+    return StructuredTool.from_function(fake_search, coroutine=afake_search, name=name,
+                                        description="A search engine. Useful for answering questions about current events.")
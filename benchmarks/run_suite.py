@@ -0,0 +1,202 @@
+"""
+Offline benchmark suite for every graph built by GraphBuilder.
+
+Each use case runs against a fake chat model (configurable latency and token
+output), a fake Tavily client and a fake web search tool, so nothing touches
+the network and the numbers isolate this project's own overhead. For each use
+case the suite reports graph-build time, p50/p95 latency (and time to first
+token in stream mode), throughput under concurrency and peak Python memory,
+and writes the results as JSON so runs can be compared across commits.
+
+Run from the repository root:
+    python -m benchmarks.run_suite
+    python -m benchmarks.run_suite --llm-latency 0.2 --concurrency 1 8 --compare benchmarks/results/old.json
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+from langchain_core.messages import AIMessageChunk, HumanMessage
+
+from src.langgraphagenticai.graph.graph_builder import GraphBuilder
+from benchmarks.fakes import FakeChatModel, FakeTavilyClient, make_fake_search_tool
+
+USECASES = ["Basic Chatbot", "Chatbot with Web", "AI News Summarizer"]
+RESULTS_DIR = os.path.join("benchmarks", "results")
+
+
+def percentile(samples, pct):
+    ordered = sorted(samples)
+    rank = max(0, min(len(ordered) - 1, int(round(pct / 100 * len(ordered) + 0.5)) - 1))
+    return ordered[rank]
+
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def make_builder(args):
+    model = FakeChatModel(response=" ".join(f"token{i}" for i in range(args.tokens)),
+                          latency=args.llm_latency, token_latency=args.token_latency)
+    tools = [make_fake_search_tool(args.tool_latency)]
+    news_options = {"client": FakeTavilyClient(latency=args.search_latency), "use_cache": False,
+                    "use_article_index": False}
+    return lambda: GraphBuilder(model, semantic_cache=False, tools=tools, news_fetcher_options=news_options)
+
+
+def make_state(usecase, i):
+    if usecase == "AI News Summarizer":
+        return {"messages": [HumanMessage(content="Generate AI News Summary")],
+                "user_controls": {"generate_news_summary": True, "TAVILY_API_KEY": "benchmark-key",
+                                  "selected_days": "3 days", "selected_llm": "Fake"}}
+    return {"messages": [HumanMessage(content=f"Benchmark question number {i}?")]}
+
+
+def run_once(graph, state, mode):
+    """Run one turn and return (total seconds, seconds to first token or None)"""
+    start = time.perf_counter()
+    if mode == "invoke":
+        graph.invoke(state)
+        return time.perf_counter() - start, None
+    first_token = None
+    for stream_mode, payload in graph.stream(state, stream_mode=["messages", "updates"]):
+        if first_token is None and stream_mode == "messages" \
+                and isinstance(payload[0], AIMessageChunk) and payload[0].content:
+            first_token = time.perf_counter() - start
+    return time.perf_counter() - start, first_token
+
+
+def bench_usecase(usecase, args):
+    new_builder = make_builder(args)
+
+    build_samples = []
+    for _ in range(args.build_iterations):
+        start = time.perf_counter()
+        graph = new_builder().setup_graph(usecase)
+        build_samples.append(time.perf_counter() - start)
+
+    run_once(graph, make_state(usecase, -1), args.mode)  # warm-up
+
+    latencies, first_tokens = [], []
+    for i in range(args.iterations):
+        total, first_token = run_once(graph, make_state(usecase, i), args.mode)
+        latencies.append(total)
+        if first_token is not None:
+            first_tokens.append(first_token)
+
+    tracemalloc.start()
+    for i in range(min(args.iterations, 5)):
+        run_once(graph, make_state(usecase, i), args.mode)
+    _, peak_bytes = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    throughput = {}
+    for concurrency in args.concurrency:
+        requests = concurrency * args.requests_per_worker
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            list(pool.map(lambda i: run_once(graph, make_state(usecase, i), args.mode), range(requests)))
+        throughput[str(concurrency)] = requests / (time.perf_counter() - start)
+
+    result = {
+        "build_ms_p50": statistics.median(build_samples) * 1000,
+        "latency_ms_p50": percentile(latencies, 50) * 1000,
+        "latency_ms_p95": percentile(latencies, 95) * 1000,
+        "latency_ms_mean": statistics.mean(latencies) * 1000,
+        "throughput_rps": throughput,
+        "peak_memory_kb": peak_bytes / 1024,
+    }
+    if first_tokens:
+        result["ttft_ms_p50"] = percentile(first_tokens, 50) * 1000
+        result["ttft_ms_p95"] = percentile(first_tokens, 95) * 1000
+    return result
+
+
+def print_results(results):
+    concurrency_levels = list(next(iter(results.values()))["throughput_rps"])
+    header = f"{'usecase':<20}{'build ms':>10}{'p50 ms':>10}{'p95 ms':>10}{'ttft ms':>10}{'peak KB':>10}"
+    header += "".join(f"{'rps@' + c:>10}" for c in concurrency_levels)
+    print(header)
+    for usecase, result in results.items():
+        ttft = result.get("ttft_ms_p50")
+        row = (f"{usecase:<20}{result['build_ms_p50']:>10.2f}{result['latency_ms_p50']:>10.1f}"
+               f"{result['latency_ms_p95']:>10.1f}{(f'{ttft:.1f}' if ttft is not None else '-'):>10}"
+               f"{result['peak_memory_kb']:>10.0f}")
+        row += "".join(f"{result['throughput_rps'][c]:>10.1f}" for c in concurrency_levels)
+        print(row)
+
+
+def print_comparison(results, baseline_path):
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = json.load(f)
+    print(f"\nChange against {baseline_path} (commit {baseline['meta'].get('commit')}):")
+    for usecase, result in results.items():
+        old = baseline["results"].get(usecase)
+        if not old:
+            continue
+        changes = []
+        for metric in ("build_ms_p50", "latency_ms_p50", "latency_ms_p95", "peak_memory_kb"):
+            if old.get(metric):
+                changes.append(f"{metric} {100 * (result[metric] - old[metric]) / old[metric]:+.1f}%")
+        for concurrency, rps in result["throughput_rps"].items():
+            if old["throughput_rps"].get(concurrency):
+                old_rps = old["throughput_rps"][concurrency]
+                changes.append(f"rps@{concurrency} {100 * (rps - old_rps) / old_rps:+.1f}%")
+        print(f"  {usecase}: " + ", ".join(changes))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--usecases", nargs="+", default=USECASES, choices=USECASES)
+    parser.add_argument("--mode", choices=["stream", "invoke"], default="stream",
+                        help="Run turns as the Streamlit UI does (stream) or with graph.invoke")
+    parser.add_argument("--iterations", type=int, default=20, help="Sequential turns per use case")
+    parser.add_argument("--build-iterations", type=int, default=20)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 16])
+    parser.add_argument("--requests-per-worker", type=int, default=5)
+    parser.add_argument("--llm-latency", type=float, default=0.05, help="Seconds before the first fake token")
+    parser.add_argument("--token-latency", type=float, default=0.0, help="Seconds between fake tokens")
+    parser.add_argument("--tokens", type=int, default=50, help="Tokens in each fake response")
+    parser.add_argument("--tool-latency", type=float, default=0.05, help="Seconds per fake web search")
+    parser.add_argument("--search-latency", type=float, default=0.05, help="Seconds per fake Tavily news query")
+    parser.add_argument("--output", help="Results JSON path (default: benchmarks/results/<time>-<commit>.json)")
+    parser.add_argument("--compare", help="Earlier results JSON to compare against")
+    args = parser.parse_args()
+
+    results = {}
+    for usecase in args.usecases:
+        print(f"Running {usecase}...", flush=True)
+        results[usecase] = bench_usecase(usecase, args)
+
+    meta = {
+        "commit": git_commit(),
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "parameters": {key: value for key, value in vars(args).items() if key not in ("output", "compare")},
+    }
+    output = args.output or os.path.join(RESULTS_DIR, f"{datetime.now():%Y%m%d-%H%M%S}-{meta['commit']}.json")
+    os.makedirs(os.path.dirname(output) or ".", exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump({"meta": meta, "results": results}, f, indent=2)
+
+    print()
+    print_results(results)
+    print(f"\nResults written to {output}")
+    if args.compare:
+        print_comparison(results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
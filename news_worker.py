@@ -0,0 +1,8 @@
+import argparse
+
+from src.langgraphagenticai.news_worker import run_news_worker
+
+if __name__ == "__main__":
+  parser = argparse.ArgumentParser(description="Refresh the AI news digest of every days option in the background")
+  parser.add_argument("--once", action="store_true", help="Refresh every option once and exit")
+  run_news_worker(once=parser.parse_args().once)
@@ -0,0 +1,129 @@
+import os
+from typing import Any, Dict
+
+from src.langgraphagenticai.LLMS.rate_limited import with_rate_limit
+from src.langgraphagenticai.LLMS.registry import LLM_PROVIDERS, PROVIDER_API_KEYS
+
+
+class ModelConfigError(Exception):
+    """
+    A chat model could not be configured. Subclasses tell why.
+    """
+
+    def __init__(self, message: str, provider: str = "", model: str = ""):
+        super().__init__(message)
+        self.provider = provider
+        self.model = model
+
+
+class MissingAPIKeyError(ModelConfigError):
+    """No API key was given or found in the environment"""
+
+
+class InvalidAPIKeyError(ModelConfigError):
+    """The provider rejected the API key"""
+
+
+class ModelNotFoundError(ModelConfigError):
+    """The provider does not offer the model, or none was selected"""
+
+
+class ProviderQuotaError(ModelConfigError):
+    """The provider's rate limit, quota or billing stopped the request"""
+
+
+class ProviderNetworkError(ModelConfigError):
+    """The provider could not be reached"""
+
+
+class ProviderError(ModelConfigError):
+    """Any other provider failure"""
+
+
+def provider_api_key(provider: str, user_controls: Dict[str, Any]) -> str:
+    """
+    Return the API key of provider from user_controls, falling back to its environment variable
+    """
+    control_key, env_key = PROVIDER_API_KEYS[provider]
+    return user_controls.get(control_key) or os.environ.get(env_key, '')
+
+
+def classify_error(error: Exception, provider: str, model: str) -> ModelConfigError:
+    """
+    Wrap an exception raised while configuring a provider's model in the matching ModelConfigError
+    """
+    if isinstance(error, ModelConfigError):
+        return error
+    message = str(error).lower()
+    if any(text in message for text in ('unauthorized', 'invalid api key', 'incorrect api key', 'forbidden')):
+        error_class = InvalidAPIKeyError
+    elif 'model' in message and any(text in message for text in ('not found', 'does not exist', 'not supported')):
+        error_class = ModelNotFoundError
+    elif any(text in message for text in ('rate limit', 'quota', 'billing')):
+        error_class = ProviderQuotaError
+    elif 'network' in message or 'connection' in message:
+        error_class = ProviderNetworkError
+    else:
+        error_class = ProviderError
+    return error_class(f"{provider} error: {str(error)}", provider, model)
+
+
+def _create_provider_model(provider: str, model: str, api_key: str) -> Any:
+    # Provider SDKs are imported only when their provider is used
+    if provider == 'Groq':
+        from langchain_groq import ChatGroq
+        return ChatGroq(api_key=api_key, model=model)
+    if provider == 'OpenAI':
+        from langchain_openai import ChatOpenAI
+        return ChatOpenAI(api_key=api_key, model=model)
+    from langchain_google_genai import ChatGoogleGenerativeAI
+    return ChatGoogleGenerativeAI(model=model, google_api_key=api_key, temperature=0.7)
+
+
+def _create_single(provider: str, user_controls: Dict[str, Any]) -> Any:
+    model = user_controls.get('selected_model') or ''
+    api_key = provider_api_key(provider, user_controls)
+    if not api_key:
+        raise MissingAPIKeyError(f"No {provider} API key given (set {PROVIDER_API_KEYS[provider][1]})",
+                                 provider, model)
+    if not model:
+        raise ModelNotFoundError(f"No {provider} model selected", provider, model)
+    try:
+        return with_rate_limit(_create_provider_model(provider, model, api_key), provider, api_key, model)
+    except Exception as e:
+        raise classify_error(e, provider, model) from e
+
+
+def _create_router(user_controls: Dict[str, Any]) -> Any:
+    from src.langgraphagenticai.LLMS.router import LatencyRouterChatModel
+
+    models = {}
+    for provider, model in (user_controls.get('routed_models') or {}).items():
+        if provider not in PROVIDER_API_KEYS:
+            raise ModelNotFoundError(f"Unknown provider to route to: {provider}", provider, model)
+        api_key = provider_api_key(provider, user_controls)
+        if model and api_key:
+            try:
+                models[f"{provider}/{model}"] = with_rate_limit(_create_provider_model(provider, model, api_key),
+                                                                provider, api_key, model)
+            except Exception as e:
+                raise classify_error(e, provider, model) from e
+    if not models:
+        raise MissingAPIKeyError("Auto routing needs at least one Groq, OpenAI or Google/Gemini API key", 'Auto')
+    return LatencyRouterChatModel(models=models)
+
+
+def create_chat_model(provider: str, user_controls: Dict[str, Any]) -> Any:
+    """
+    Build the rate-limited chat model of provider (Groq, OpenAI, Gemini or Auto)
+    from user_controls, without any UI. The API key comes from user_controls or
+    the provider's environment variable.
+
+    Raises:
+        ModelConfigError: A subclass telling why the model could not be configured
+    """
+    if provider not in LLM_PROVIDERS:
+        raise ProviderError(f"Unsupported LLM: {provider}", provider)
+    if provider == 'Auto':
+        return _create_router(user_controls)
+    return _create_single(provider, user_controls)
@@ -0,0 +1,182 @@
+import random
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional
+import logging
+
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+from pydantic import ConfigDict
+
+from src.langgraphagenticai.utils.rate_limiter import RateLimiter, get_rate_limiter_registry
+
+# Inner model calls must not report to the caller's callbacks, or streamed tokens would be seen twice
+_NO_CALLBACKS = {"callbacks": []}
+
+# Completion tokens reserved for a request until its real usage is known
+DEFAULT_COMPLETION_TOKENS = 512
+
+
+def is_rate_limit_error(error: Exception) -> bool:
+    """
+    Tell whether a provider error is a retryable rate limit (HTTP 429) rather
+    than an exhausted quota or any other failure
+    """
+    message = str(error).lower()
+    if "insufficient_quota" in message:
+        return False
+    status = getattr(error, "status_code", None) or getattr(error, "code", None)
+    return (status == 429 or "ratelimit" in type(error).__name__.lower()
+            or any(marker in message for marker in ("429", "rate limit", "rate_limit", "resource_exhausted")))
+
+
+def retry_after(error: Exception) -> Optional[float]:
+    """
+    Return the provider's retry-after hint in seconds, when it sent one
+    """
+    headers = getattr(getattr(error, "response", None), "headers", None) or {}
+    try:
+        return float(headers.get("retry-after"))
+    except (TypeError, ValueError):
+        return None
+
+
+class RateLimitedChatModel(BaseChatModel):
+    """
+    Chat model that waits for a shared RateLimiter budget before each call to
+    the wrapped model and retries rate limit responses.
+
+    Requests over budget queue in arrival order instead of failing. A 429
+    pauses every session on the same key for the provider's retry-after (or
+    a jittered exponential backoff) and the call is tried again, up to
+    max_retries times. Streams are only retried before their first chunk.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    model: Any
+    limiter: Any
+    max_retries: int = 5
+    base_delay: float = 1.0
+    max_delay: float = 30.0
+    completion_tokens: int = DEFAULT_COMPLETION_TOKENS
+    provider: str = ""
+    model_name: str = ""
+
+    @property
+    def _llm_type(self) -> str:
+        return "rate-limited"
+
+    @property
+    def logger(self) -> logging.Logger:
+        return logging.getLogger(__name__)
+
+    def _get_ls_params(self, stop: Optional[List[str]] = None, **kwargs: Any) -> Dict[str, Any]:
+        return {**super()._get_ls_params(stop=stop, **kwargs), "ls_provider": self.provider.lower() or "llm"}
+
+    def bind_tools(self, tools: Any, **kwargs: Any) -> "RateLimitedChatModel":
+        return self.model_copy(update={"model": self.model.bind_tools(tools, **kwargs)})
+
+    def estimate_tokens(self, messages: List[BaseMessage]) -> int:
+        """
+        Rough token count of a request: about four characters per prompt token
+        plus the completion budget
+        """
+        return sum(len(str(message.content)) for message in messages) // 4 + self.completion_tokens
+
+    def _backoff(self, error: Exception, attempt: int) -> Optional[float]:
+        """
+        Return the seconds to wait before retrying, or None when the error is final
+        """
+        if attempt >= self.max_retries or not is_rate_limit_error(error):
+            return None
+        # Full jitter keeps the sessions sharing a key from retrying in lockstep
+        delay = retry_after(error) or random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+        self.limiter.penalize(delay)
+        self.limiter.record_retry()
+        self.logger.warning(f"Rate limited by {self.provider}/{self.model_name}, retry {attempt + 1} "
+                            f"in {delay:.1f}s")
+        return delay
+
+    def _settle(self, estimate: int, message: Any) -> None:
+        usage = getattr(message, "usage_metadata", None)
+        self.limiter.settle(estimate, usage.get("total_tokens") if usage else None)
+
+    def _call_kwargs(self, stop: Optional[List[str]], kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        return {**kwargs, **({"stop": stop} if stop else {})}
+
+    def _generate(self, messages: List[BaseMessage], stop: Optional[List[str]] = None,
+                  run_manager: Any = None, **kwargs: Any) -> ChatResult:
+        estimate = self.estimate_tokens(messages)
+        for attempt in range(self.max_retries + 1):
+            self.limiter.acquire(estimate)
+            try:
+                message: AIMessage = self.model.invoke(messages, config=_NO_CALLBACKS,
+                                                       **self._call_kwargs(stop, kwargs))
+            except Exception as e:
+                if self._backoff(e, attempt) is None:
+                    raise
+                continue
+            self._settle(estimate, message)
+            return ChatResult(generations=[ChatGeneration(message=message)])
+
+    async def _agenerate(self, messages: List[BaseMessage], stop: Optional[List[str]] = None,
+                         run_manager: Any = None, **kwargs: Any) -> ChatResult:
+        estimate = self.estimate_tokens(messages)
+        for attempt in range(self.max_retries + 1):
+            await self.limiter.aacquire(estimate)
+            try:
+                message: AIMessage = await self.model.ainvoke(messages, config=_NO_CALLBACKS,
+                                                              **self._call_kwargs(stop, kwargs))
+            except Exception as e:
+                if self._backoff(e, attempt) is None:
+                    raise
+                continue
+            self._settle(estimate, message)
+            return ChatResult(generations=[ChatGeneration(message=message)])
+
+    def _stream(self, messages: List[BaseMessage], stop: Optional[List[str]] = None,
+                run_manager: Any = None, **kwargs: Any) -> Iterator[ChatGenerationChunk]:
+        estimate = self.estimate_tokens(messages)
+        for attempt in range(self.max_retries + 1):
+            self.limiter.acquire(estimate)
+            started, final = False, None
+            try:
+                for chunk in self.model.stream(messages, config=_NO_CALLBACKS, **self._call_kwargs(stop, kwargs)):
+                    started = True
+                    final = chunk if final is None else final + chunk
+                    yield ChatGenerationChunk(message=chunk)
+            except Exception as e:
+                if started or self._backoff(e, attempt) is None:
+                    raise
+                continue
+            self._settle(estimate, final)
+            return
+
+    async def _astream(self, messages: List[BaseMessage], stop: Optional[List[str]] = None,
+                       run_manager: Any = None, **kwargs: Any) -> AsyncIterator[ChatGenerationChunk]:
+        estimate = self.estimate_tokens(messages)
+        for attempt in range(self.max_retries + 1):
+            await self.limiter.aacquire(estimate)
+            started, final = False, None
+            try:
+                async for chunk in self.model.astream(messages, config=_NO_CALLBACKS,
+                                                      **self._call_kwargs(stop, kwargs)):
+                    started = True
+                    final = chunk if final is None else final + chunk
+                    yield ChatGenerationChunk(message=chunk)
+            except Exception as e:
+                if started or self._backoff(e, attempt) is None:
+                    raise
+                continue
+            self._settle(estimate, final)
+            return
+
+
+def with_rate_limit(llm: BaseChatModel, provider: str, api_key: Optional[str], model_name: str,
+                    limiter: Optional[RateLimiter] = None) -> RateLimitedChatModel:
+    """
+    Wrap llm with the process-wide rate limiter for this provider, key and model
+    """
+    limiter = limiter or get_rate_limiter_registry().get(provider, api_key, model_name)
+    return RateLimitedChatModel(model=llm, limiter=limiter, provider=provider,
+                                model_name=model_name)
@@ -0,0 +1,38 @@
+import importlib
+import threading
+import logging
+
+# Provider name -> (module, class) of its Streamlit LLM configuration wrapper.
+# The wrappers build models through model_factory.create_chat_model, which
+# imports a provider SDK only when that provider is used.
+LLM_PROVIDERS = {
+    'Groq': ('src.langgraphagenticai.LLMS.groqllm', 'GroqLLM'),
+    'OpenAI': ('src.langgraphagenticai.LLMS.Openaillm', 'OpenaiLLM'),
+    'Gemini': ('src.langgraphagenticai.LLMS.geminillm', 'GeminiLLM'),
+    'Auto': ('src.langgraphagenticai.LLMS.routerllm', 'RouterLLM'),
+}
+
+# (user control field, environment fallback) holding each provider's API key
+PROVIDER_API_KEYS = {
+    'Groq': ('GROQ_API_KEY', 'GROQ_API_KEY'),
+    'OpenAI': ('OPENAI_API_KEY', 'OPENAI_API_KEY'),
+    'Gemini': ('GEMINI_API_KEY', 'GOOGLE_API_KEY'),
+}
+
+_llm_classes = {}
+_llm_classes_lock = threading.Lock()
+
+
+def get_llm_class(provider):
+    """
+    Return the LLM configuration class of provider (e.g. GroqLLM), importing its module on first use
+
+    Raises:
+        KeyError: If provider is not in LLM_PROVIDERS
+    """
+    module_name, class_name = LLM_PROVIDERS[provider]
+    with _llm_classes_lock:
+        if provider not in _llm_classes:
+            _llm_classes[provider] = getattr(importlib.import_module(module_name), class_name)
+            logging.getLogger(__name__).debug(f"Loaded the {provider} LLM provider")
+        return _llm_classes[provider]
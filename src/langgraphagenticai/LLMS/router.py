@@ -0,0 +1,447 @@
+import asyncio
+import math
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple
+import logging
+
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+from pydantic import ConfigDict, Field
+
+# Provider calls started by the router, including hedges whose result is no longer needed
+_router_pool = ThreadPoolExecutor(max_workers=64, thread_name_prefix="llm-router")
+
+# Inner model calls must not report to the caller's callbacks, or streamed tokens would be seen twice
+_NO_CALLBACKS = {"callbacks": []}
+
+_DONE = object()
+
+
+class ProviderHealth:
+    """
+    Rolling latency and error statistics for one provider/model.
+
+    Latencies are kept separately for complete responses ("total") and for
+    the first streamed chunk ("first_token"), over the last `window` calls.
+    After `max_consecutive_errors` failures in a row the provider is
+    unhealthy for `cooldown_seconds`.
+    """
+
+    def __init__(self, window: int = 50, max_consecutive_errors: int = 3, cooldown_seconds: float = 30.0):
+        self.window = window
+        self.max_consecutive_errors = max_consecutive_errors
+        self.cooldown_seconds = cooldown_seconds
+        self._latencies = {"total": deque(maxlen=window), "first_token": deque(maxlen=window)}
+        self._outcomes = deque(maxlen=window)
+        self._consecutive_errors = 0
+        self._cooldown_until = 0.0
+        self._counts = {"calls": 0, "errors": 0, "hedges": 0, "wins": 0}
+        self._lock = threading.Lock()
+
+    def record_success(self, latency: float, kind: str = "total") -> None:
+        with self._lock:
+            self._latencies[kind].append(latency)
+            self._outcomes.append(True)
+            self._consecutive_errors = 0
+            self._counts["calls"] += 1
+
+    def record_error(self) -> None:
+        with self._lock:
+            self._outcomes.append(False)
+            self._consecutive_errors += 1
+            self._counts["calls"] += 1
+            self._counts["errors"] += 1
+            if self._consecutive_errors >= self.max_consecutive_errors:
+                self._cooldown_until = time.monotonic() + self.cooldown_seconds
+
+    def record(self, event: str) -> None:
+        with self._lock:
+            self._counts[event] += 1
+
+    def percentile(self, pct: float, kind: str = "total") -> Optional[float]:
+        with self._lock:
+            samples = sorted(self._latencies[kind])
+        if not samples:
+            return None
+        return samples[min(len(samples) - 1, max(0, math.ceil(pct / 100 * len(samples)) - 1))]
+
+    def sample_count(self, kind: str = "total") -> int:
+        with self._lock:
+            return len(self._latencies[kind])
+
+    def error_rate(self) -> float:
+        with self._lock:
+            return self._outcomes.count(False) / len(self._outcomes) if self._outcomes else 0.0
+
+    def healthy(self) -> bool:
+        with self._lock:
+            return time.monotonic() >= self._cooldown_until
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self._counts)
+        stats.update({
+            "healthy": self.healthy(),
+            "error_rate": self.error_rate(),
+            "p50": self.percentile(50),
+            "p95": self.percentile(95),
+            "first_token_p50": self.percentile(50, "first_token"),
+            "first_token_p95": self.percentile(95, "first_token"),
+        })
+        return stats
+
+
+class ProviderHealthRegistry:
+    """
+    Process-wide ProviderHealth per "provider/model" label, so every router
+    and session learns from the same calls
+    """
+
+    def __init__(self):
+        self._health: Dict[str, ProviderHealth] = {}
+        self._lock = threading.Lock()
+
+    def get(self, label: str) -> ProviderHealth:
+        with self._lock:
+            health = self._health.get(label)
+            if health is None:
+                health = self._health[label] = ProviderHealth()
+            return health
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            health = dict(self._health)
+        return {label: h.stats() for label, h in health.items()}
+
+
+_health_registry = ProviderHealthRegistry()
+
+
+def get_provider_health_registry() -> ProviderHealthRegistry:
+    """
+    Return the process-wide provider health registry
+    """
+    return _health_registry
+
+
+class LatencyRouterChatModel(BaseChatModel):
+    """
+    Chat model that routes each call to the fastest healthy of several
+    provider models and hedges slow calls.
+
+    Candidates are ordered by health, then by their rolling median latency
+    (models without samples first, so every model gets measured). When the
+    primary has not answered (or, for streams, sent its first chunk) within
+    its p95 latency times hedge_factor, the same request is sent to the next
+    candidate; the first to answer wins and the other is cancelled (async) or
+    abandoned (threaded). A failed call falls over to the next candidate.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    models: Dict[str, Any] = Field(description="Chat models keyed by 'provider/model' label")
+    hedge: bool = True
+    hedge_factor: float = 1.0
+    min_hedge_delay: float = 0.5
+    default_hedge_delay: float = 5.0
+    min_samples: int = 5
+    health: Any = Field(default_factory=get_provider_health_registry, exclude=True)
+    model_name: str = "router"
+
+    def __init__(self, **kwargs: Any):
+        super().__init__(**kwargs)
+        if not self.models:
+            raise ValueError("LatencyRouterChatModel needs at least one model")
+        if self.model_name == "router":
+            self.model_name = "router(" + ",".join(self.models) + ")"
+
+    @property
+    def _llm_type(self) -> str:
+        return "latency-router"
+
+    def _get_ls_params(self, stop: Optional[List[str]] = None, **kwargs: Any) -> Dict[str, Any]:
+        return {**super()._get_ls_params(stop=stop, **kwargs), "ls_provider": "router"}
+
+    def bind_tools(self, tools: Any, **kwargs: Any) -> "LatencyRouterChatModel":
+        return self.model_copy(update={"models": {label: model.bind_tools(tools, **kwargs)
+                                                  for label, model in self.models.items()}})
+
+    def candidates(self, kind: str = "total") -> List[str]:
+        """
+        Return the model labels in the order they would be tried
+        """
+        def rank(label: str) -> Tuple[bool, float]:
+            health = self.health.get(label)
+            return (not health.healthy(), health.percentile(50, kind) or 0.0)
+
+        return sorted(self.models, key=rank)
+
+    def hedge_delay(self, label: str, kind: str = "total") -> Optional[float]:
+        """
+        Seconds to wait on label before sending a hedged request
+        """
+        if not self.hedge:
+            return None
+        health = self.health.get(label)
+        if health.sample_count(kind) < self.min_samples:
+            return self.default_hedge_delay
+        return max(self.min_hedge_delay, health.percentile(95, kind) * self.hedge_factor)
+
+    def _invoke_kwargs(self, stop: Optional[List[str]], kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        return {**kwargs, **({"stop": stop} if stop else {})}
+
+    def _call(self, label: str, messages: List[BaseMessage], call_kwargs: Dict[str, Any]) -> AIMessage:
+        health = self.health.get(label)
+        start = time.perf_counter()
+        try:
+            message = self.models[label].invoke(messages, config=_NO_CALLBACKS, **call_kwargs)
+        except Exception:
+            health.record_error()
+            raise
+        health.record_success(time.perf_counter() - start)
+        return message
+
+    async def _acall(self, label: str, messages: List[BaseMessage], call_kwargs: Dict[str, Any]) -> AIMessage:
+        health = self.health.get(label)
+        start = time.perf_counter()
+        try:
+            message = await self.models[label].ainvoke(messages, config=_NO_CALLBACKS, **call_kwargs)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            health.record_error()
+            raise
+        health.record_success(time.perf_counter() - start)
+        return message
+
+    def _result(self, label: str, message: AIMessage) -> ChatResult:
+        self.health.get(label).record("wins")
+        message.response_metadata = {**message.response_metadata, "routed_to": label}
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    def _generate(self, messages: List[BaseMessage], stop: Optional[List[str]] = None,
+                  run_manager: Any = None, **kwargs: Any) -> ChatResult:
+        call_kwargs = self._invoke_kwargs(stop, kwargs)
+        remaining = self.candidates()
+        results: "queue.Queue" = queue.Queue()
+        started = time.monotonic()
+        in_flight, hedged, last_error = 0, False, None
+
+        def launch(label: str) -> None:
+            def run():
+                try:
+                    results.put((label, self._call(label, messages, call_kwargs), None))
+                except Exception as e:
+                    results.put((label, None, e))
+            _router_pool.submit(run)
+
+        primary = remaining.pop(0)
+        launch(primary)
+        in_flight += 1
+        while in_flight:
+            delay = self.hedge_delay(primary) if not hedged and remaining else None
+            timeout = None if delay is None else max(0.0, started + delay - time.monotonic())
+            try:
+                label, message, error = results.get(timeout=timeout)
+            except queue.Empty:
+                hedged = True
+                self._hedge(primary, remaining[0])
+                launch(remaining.pop(0))
+                in_flight += 1
+                continue
+            in_flight -= 1
+            if error is None:
+                return self._result(label, message)
+            last_error = error
+            self.logger.warning(f"Router call to {label} failed: {str(error)}")
+            if not in_flight and remaining:
+                launch(remaining.pop(0))
+                in_flight += 1
+        raise last_error
+
+    async def _agenerate(self, messages: List[BaseMessage], stop: Optional[List[str]] = None,
+                         run_manager: Any = None, **kwargs: Any) -> ChatResult:
+        call_kwargs = self._invoke_kwargs(stop, kwargs)
+        remaining = self.candidates()
+        primary = remaining.pop(0)
+        tasks = {asyncio.create_task(self._acall(primary, messages, call_kwargs)): primary}
+        started = time.monotonic()
+        hedged, last_error = False, None
+        try:
+            while tasks:
+                delay = self.hedge_delay(primary) if not hedged and remaining else None
+                timeout = None if delay is None else max(0.0, started + delay - time.monotonic())
+                done, _ = await asyncio.wait(tasks, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+                if not done:
+                    hedged = True
+                    self._hedge(primary, remaining[0])
+                    label = remaining.pop(0)
+                    tasks[asyncio.create_task(self._acall(label, messages, call_kwargs))] = label
+                    continue
+                for task in done:
+                    label = tasks.pop(task)
+                    if task.exception() is None:
+                        return self._result(label, task.result())
+                    last_error = task.exception()
+                    self.logger.warning(f"Router call to {label} failed: {str(last_error)}")
+                if not tasks and remaining:
+                    label = remaining.pop(0)
+                    tasks[asyncio.create_task(self._acall(label, messages, call_kwargs))] = label
+            raise last_error
+        finally:
+            # Cancel the losing request
+            for task in tasks:
+                task.cancel()
+
+    def _stream(self, messages: List[BaseMessage], stop: Optional[List[str]] = None,
+                run_manager: Any = None, **kwargs: Any) -> Iterator[ChatGenerationChunk]:
+        call_kwargs = self._invoke_kwargs(stop, kwargs)
+        remaining = self.candidates("first_token")
+        events: "queue.Queue" = queue.Queue()
+        cancelled: Dict[str, threading.Event] = {}
+        started = time.monotonic()
+
+        def launch(label: str) -> None:
+            cancelled[label] = threading.Event()
+
+            def run():
+                health = self.health.get(label)
+                start = time.perf_counter()
+                first = True
+                try:
+                    for chunk in self.models[label].stream(messages, config=_NO_CALLBACKS, **call_kwargs):
+                        if cancelled[label].is_set():
+                            return
+                        if first:
+                            health.record_success(time.perf_counter() - start, "first_token")
+                            first = False
+                        events.put((label, chunk, None))
+                    events.put((label, _DONE, None))
+                except Exception as e:
+                    health.record_error()
+                    events.put((label, None, e))
+            _router_pool.submit(run)
+
+        primary = remaining.pop(0)
+        launch(primary)
+        in_flight, hedged, winner, last_error = 1, False, None, None
+        try:
+            while in_flight:
+                delay = self.hedge_delay(primary, "first_token") if winner is None and not hedged and remaining else None
+                timeout = None if delay is None else max(0.0, started + delay - time.monotonic())
+                try:
+                    label, chunk, error = events.get(timeout=timeout)
+                except queue.Empty:
+                    hedged = True
+                    self._hedge(primary, remaining[0])
+                    launch(remaining.pop(0))
+                    in_flight += 1
+                    continue
+                if winner is not None and label != winner:
+                    continue
+                if error is not None:
+                    in_flight -= 1
+                    if winner is not None:
+                        raise error
+                    last_error = error
+                    self.logger.warning(f"Router stream from {label} failed: {str(error)}")
+                    if not in_flight and remaining:
+                        launch(remaining.pop(0))
+                        in_flight += 1
+                    continue
+                if chunk is _DONE:
+                    if winner is None:
+                        # Finished without output; treat as the winner with an empty answer
+                        self.health.get(label).record("wins")
+                    return
+                if winner is None:
+                    winner = label
+                    self.health.get(label).record("wins")
+                    for other, flag in cancelled.items():
+                        if other != label:
+                            flag.set()
+                yield ChatGenerationChunk(message=chunk)
+            if last_error is not None:
+                raise last_error
+        finally:
+            for flag in cancelled.values():
+                flag.set()
+
+    async def _astream(self, messages: List[BaseMessage], stop: Optional[List[str]] = None,
+                       run_manager: Any = None, **kwargs: Any) -> AsyncIterator[ChatGenerationChunk]:
+        call_kwargs = self._invoke_kwargs(stop, kwargs)
+        remaining = self.candidates("first_token")
+        streams: Dict[str, Any] = {}
+        tasks: Dict[asyncio.Task, str] = {}
+        started = time.monotonic()
+
+        def launch(label: str) -> None:
+            streams[label] = self.models[label].astream(messages, config=_NO_CALLBACKS, **call_kwargs)
+            tasks[asyncio.create_task(self._first_chunk(label, streams[label]))] = label
+
+        primary = remaining.pop(0)
+        launch(primary)
+        hedged, winner, first_chunk, last_error = False, None, None, None
+        try:
+            while tasks and winner is None:
+                delay = self.hedge_delay(primary, "first_token") if not hedged and remaining else None
+                timeout = None if delay is None else max(0.0, started + delay - time.monotonic())
+                done, _ = await asyncio.wait(tasks, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+                if not done:
+                    hedged = True
+                    self._hedge(primary, remaining[0])
+                    launch(remaining.pop(0))
+                    continue
+                for task in done:
+                    label = tasks.pop(task)
+                    if task.exception() is not None:
+                        last_error = task.exception()
+                        self.logger.warning(f"Router stream from {label} failed: {str(last_error)}")
+                    elif winner is None:
+                        winner, first_chunk = label, task.result()
+                if winner is None and not tasks and remaining:
+                    launch(remaining.pop(0))
+            if winner is None:
+                raise last_error
+        finally:
+            # Cancel the losing streams and close them once their tasks have stopped
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            for label, stream in streams.items():
+                if label != winner:
+                    await stream.aclose()
+
+        self.health.get(winner).record("wins")
+        if first_chunk is not _DONE:
+            yield ChatGenerationChunk(message=first_chunk)
+            async for chunk in streams[winner]:
+                yield ChatGenerationChunk(message=chunk)
+
+    async def _first_chunk(self, label: str, stream: AsyncIterator) -> Any:
+        health = self.health.get(label)
+        start = time.perf_counter()
+        try:
+            chunk = await stream.__anext__()
+        except StopAsyncIteration:
+            return _DONE
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            health.record_error()
+            raise
+        health.record_success(time.perf_counter() - start, "first_token")
+        return chunk
+
+    def _hedge(self, primary: str, backup: str) -> None:
+        self.health.get(backup).record("hedges")
+        self.logger.info(f"Hedging slow call to {primary} with {backup}")
+
+    @property
+    def logger(self) -> logging.Logger:
+        return logging.getLogger(__name__)
@@ -0,0 +1,23 @@
+import streamlit as st
+
+from src.langgraphagenticai.LLMS.model_factory import create_chat_model, ModelConfigError, MissingAPIKeyError
+
+class RouterLLM:
+    """
+    Build a LatencyRouterChatModel over every provider that has an API key,
+    so each call goes to the fastest healthy one.
+    user_controls_input['routed_models'] maps provider name to the model to use.
+    """
+    def __init__(self,user_controls_input):
+        self.user_controls_input=user_controls_input
+
+    def get_llm_model(self):
+        try:
+            return create_chat_model('Auto', self.user_controls_input)
+        except MissingAPIKeyError:
+            st.error("🔑 Please enter at least one Groq, OpenAI or Google/Gemini API Key to use Auto routing")
+        except ModelConfigError as e:
+            st.error(f"❌ **Router Setup Error!** \n\n"
+                    f"Something went wrong while configuring the providers: {str(e)} \n\n"
+                    f"💡 **Try**: Check your API keys or select a single provider.")
+        return None
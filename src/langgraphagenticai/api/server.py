@@ -0,0 +1,316 @@
+import asyncio
+import json
+import os
+import sys
+import time
+import uuid
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Optional
+import logging
+
+from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse, PlainTextResponse, StreamingResponse
+from starlette.routing import Route
+
+from src.langgraphagenticai.LLMS.registry import LLM_PROVIDERS, PROVIDER_API_KEYS
+from src.langgraphagenticai.LLMS.model_factory import (
+    create_chat_model, ModelConfigError, MissingAPIKeyError, InvalidAPIKeyError, ModelNotFoundError,
+)
+from src.langgraphagenticai.LLMS.router import get_provider_health_registry
+from src.langgraphagenticai.graph.graph_builder import GraphBuilder
+from src.langgraphagenticai.graph.graph_registry import GraphRegistry, get_graph_key
+from src.langgraphagenticai.graph.checkpointer import open_async_checkpointer, get_thread_config
+from src.langgraphagenticai.ui.uiconfigfile import Config
+from src.langgraphagenticai.utils.tool_cache import get_default_tool_cache
+from src.langgraphagenticai.utils.news_cache import get_default_news_cache
+from src.langgraphagenticai.utils.rate_limiter import get_rate_limiter_registry
+from src.langgraphagenticai.utils.tracing import get_trace_collector
+from src.langgraphagenticai.utils.news_digest_store import incremental_digest_enabled
+from src.langgraphagenticai.utils.history_compactor import history_compaction_enabled
+from src.langgraphagenticai.utils.news_prefetcher import peek_news_prefetcher, max_digest_age
+from src.langgraphagenticai.utils.messages import chunk_text, turn_result
+
+NEWS_USECASE = "AI News Summarizer"
+
+
+class RequestError(Exception):
+    """
+    A request the API rejects with a 4xx status
+    """
+
+    def __init__(self, message: str, status_code: int = 400):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+class AgenticAIServer:
+    """
+    Headless HTTP front end for the GraphBuilder use cases.
+
+    Every request carries its own provider, model and credentials, runs the
+    compiled graph with ainvoke/astream on the server's event loop, and is
+    scoped to a conversation by thread_id through an async SQLite checkpointer
+    on the same database as the Streamlit app. No per-session process state is
+    kept, so any number of instances can serve the same clients behind a load
+    balancer.
+    """
+
+    def __init__(self, registry: Optional[GraphRegistry] = None, max_concurrent_runs: int = 256):
+        """
+        Args:
+            registry: Compiled graph registry, a private one by default since its graphs use the async checkpointer
+            max_concurrent_runs: Graph runs allowed at once; further requests wait for a slot
+        """
+        self.registry = registry or GraphRegistry()
+        self.config = Config()
+        self.checkpointer = None
+        self._run_slots = asyncio.Semaphore(max_concurrent_runs)
+        self.logger = logging.getLogger(__name__)
+
+    @asynccontextmanager
+    async def lifespan(self, app: Starlette):
+        self.checkpointer = await open_async_checkpointer()
+        try:
+            yield
+        finally:
+            await self.checkpointer.conn.close()
+            self.checkpointer = None
+
+    def build_app(self) -> Starlette:
+        return Starlette(
+            routes=[
+                Route("/health", self.health, methods=["GET"]),
+                Route("/metrics", self.metrics, methods=["GET"]),
+                Route("/v1/usecases", self.usecases, methods=["GET"]),
+                Route("/v1/chat", self.chat, methods=["POST"]),
+                Route("/v1/chat/stream", self.chat_stream, methods=["POST"]),
+            ],
+            lifespan=self.lifespan,
+        )
+
+    async def health(self, request: Request) -> JSONResponse:
+        health = {"status": "ok", "graphs": self.registry.stats(),
+                  "tool_cache": get_default_tool_cache().stats(),
+                  # The first call opens the SQLite file, so keep it off the event loop
+                  "news_cache": await asyncio.to_thread(lambda: get_default_news_cache().stats()),
+                  "llm_providers": get_provider_health_registry().stats(),
+                  "rate_limits": get_rate_limiter_registry().stats()}
+        # The news prefetcher and article index are only reported once a graph created them,
+        # so a health check never reads their config or loads FAISS on the event loop
+        prefetcher = peek_news_prefetcher()
+        if prefetcher is not None:
+            health["news_prefetcher"] = prefetcher.stats()
+        article_index = sys.modules.get("src.langgraphagenticai.utils.article_index")
+        index = article_index.peek_default_article_index() if article_index else None
+        if index is not None:
+            health["article_index"] = index.stats()
+        return JSONResponse(health)
+
+    async def metrics(self, request: Request) -> PlainTextResponse:
+        """
+        Span counts, latency histograms, errors and token totals in the Prometheus text format
+        """
+        return PlainTextResponse(get_trace_collector().prometheus_text(), media_type="text/plain; version=0.0.4")
+
+    async def usecases(self, request: Request) -> JSONResponse:
+        return JSONResponse({
+            "usecases": self.config.get_usecase_options(),
+            "providers": {
+                "Groq": self.config.get_groq_model_options(),
+                "OpenAI": self.config.get_openai_model_options(),
+                "Gemini": self.config.get_gemini_model_options(),
+            },
+        })
+
+    async def chat(self, request: Request) -> JSONResponse:
+        """
+        Run one turn and return the new messages once the graph has finished
+        """
+        try:
+            run = await self._prepare_run(request)
+        except RequestError as e:
+            return JSONResponse({"error": str(e)}, status_code=e.status_code)
+
+        start = time.perf_counter()
+        try:
+            async with self._run_slots:
+                result = await run["graph"].ainvoke(run["state"], run["trace"].with_callbacks(run["config"]))
+        except Exception as e:
+            self.logger.exception("Graph run failed")
+            return JSONResponse({"error": str(e)}, status_code=502)
+        finally:
+            run["trace"].finish()
+
+        new_messages, reply = turn_result(result)
+        return JSONResponse({
+            "thread_id": run["thread_id"],
+            "usecase": run["usecase"],
+            "reply": reply,
+            "messages": new_messages,
+            "metrics": {"total_time": time.perf_counter() - start},
+        })
+
+    async def chat_stream(self, request: Request):
+        """
+        Run one turn and stream it as server-sent events:
+        token, tool_call, tool_result, message, then done (or error)
+        """
+        try:
+            run = await self._prepare_run(request)
+        except RequestError as e:
+            return JSONResponse({"error": str(e)}, status_code=e.status_code)
+        return StreamingResponse(self._stream_events(run), media_type="text/event-stream",
+                                 headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+
+    async def _stream_events(self, run: Dict[str, Any]) -> AsyncIterator[str]:
+        start = time.perf_counter()
+        first_token_at = None
+        yield self._sse("start", {"thread_id": run["thread_id"], "usecase": run["usecase"]})
+        try:
+            async with self._run_slots:
+                async for mode, payload in run["graph"].astream(run["state"],
+                                                                run["trace"].with_callbacks(run["config"]),
+                                                                stream_mode=["messages", "updates"],
+                                                                durability="async"):
+                    if mode == "messages":
+                        chunk, metadata = payload
+                        text = chunk_text(chunk)
+                        if text:
+                            if first_token_at is None:
+                                first_token_at = time.perf_counter()
+                            yield self._sse("token", {"text": text, "node": metadata.get("langgraph_node")})
+                        continue
+
+                    for node, node_update in payload.items():
+                        messages = (node_update or {}).get("messages", [])
+                        if not isinstance(messages, list):
+                            messages = [messages]
+                        for message in messages:
+                            if type(message) == AIMessage:
+                                for tool_call in message.tool_calls:
+                                    yield self._sse("tool_call", {"id": tool_call.get("id"),
+                                                                  "name": tool_call["name"],
+                                                                  "args": tool_call.get("args", {})})
+                                if message.content:
+                                    yield self._sse("message", {
+                                        "node": node, "content": message.content,
+                                        "tool_rounds_exhausted": bool(message.response_metadata.get("tool_rounds_exhausted")),
+                                    })
+                            elif type(message) == ToolMessage:
+                                yield self._sse("tool_result", {"id": message.tool_call_id, "name": message.name,
+                                                                "content": message.content, "status": message.status,
+                                                                "outcome": message.response_metadata.get("outcome"),
+                                                                "duration": message.response_metadata.get("duration")})
+        except asyncio.CancelledError:
+            # The client disconnected; stop the run instead of finishing it for nobody
+            self.logger.info(f"Stream for thread {run['thread_id']} cancelled by the client")
+            raise
+        except Exception as e:
+            self.logger.exception("Graph stream failed")
+            yield self._sse("error", {"error": str(e)})
+            return
+        finally:
+            run["trace"].finish()
+
+        yield self._sse("done", {
+            "thread_id": run["thread_id"],
+            "metrics": {
+                "time_to_first_token": first_token_at - start if first_token_at is not None else None,
+                "total_time": time.perf_counter() - start,
+            },
+        })
+
+    async def _prepare_run(self, request: Request) -> Dict[str, Any]:
+        """
+        Validate the request body and resolve the compiled graph, input state and run config
+        """
+        try:
+            body = await request.json()
+        except ValueError:
+            raise RequestError("Request body must be JSON")
+        if not isinstance(body, dict):
+            raise RequestError("Request body must be a JSON object")
+
+        usecase = body.get("usecase", "Basic Chatbot")
+        provider = body.get("provider", "Groq")
+        if usecase not in self.config.get_usecase_options():
+            raise RequestError(f"Unsupported use case: {usecase}")
+        if provider not in LLM_PROVIDERS:
+            raise RequestError(f"Unsupported LLM: {provider}")
+        model_name = body.get("model")
+        if provider == "Auto":
+            # "models" and "api_keys" map provider name to the model and key to route between
+            model_name = body.get("models") or {}
+            if not isinstance(model_name, dict) or not set(model_name) <= set(PROVIDER_API_KEYS):
+                raise RequestError(f"'models' must map providers ({', '.join(PROVIDER_API_KEYS)}) to model names")
+        if not model_name:
+            raise RequestError("'model' is required")
+        message = body.get("message") or ("Generate AI News Summary" if usecase == NEWS_USECASE else "")
+        if not message:
+            raise RequestError("'message' is required")
+
+        user_controls = {
+            "selected_llm": provider,
+            "selected_model": model_name,
+            "selected_usecase": usecase,
+        }
+        if provider == "Auto":
+            api_keys = body.get("api_keys") or {}
+            user_controls.update({"selected_model": "auto", "routed_models": model_name})
+            user_controls.update({PROVIDER_API_KEYS[name][0]: api_keys.get(name, "") for name in PROVIDER_API_KEYS})
+        else:
+            user_controls[PROVIDER_API_KEYS[provider][0]] = body.get("api_key", "")
+        state = {"messages": [HumanMessage(content=message)]}
+        if usecase == NEWS_USECASE:
+            user_controls.update({
+                "TAVILY_API_KEY": body.get("tavily_api_key") or os.environ.get("TAVILY_API_KEY", ""),
+                "selected_days": body.get("days", "3 days"),
+                "generate_news_summary": True,
+                "refresh_news_digest": bool(body.get("refresh")),
+            })
+            state["user_controls"] = user_controls
+
+        thread_id = body.get("thread_id") or uuid.uuid4().hex
+        config = get_thread_config(thread_id, usecase) if usecase in GraphBuilder.CONVERSATIONAL_USECASES else None
+        graph_key = get_graph_key(user_controls, provider, usecase)
+
+        def build():
+            # Only runs on a registry miss, so the build span is recorded for actual builds
+            with trace.span("build", "graph_build"):
+                try:
+                    model = create_chat_model(provider, user_controls)
+                except (MissingAPIKeyError, InvalidAPIKeyError, ModelNotFoundError) as e:
+                    # The request itself is wrong: fix the key or the model name
+                    raise RequestError(str(e)) from e
+                except ModelConfigError as e:
+                    # The provider is failing: quota, network or an unknown error
+                    raise RequestError(str(e), status_code=502) from e
+                # Cached replies are scoped to the API keys' fingerprint, the last part of the graph key
+                return GraphBuilder(model, cache_scope=graph_key[-1], news_incremental=incremental_digest_enabled(),
+                                    news_max_digest_age=max_digest_age(),
+                                    history_compaction=history_compaction_enabled()).setup_graph(usecase, checkpointer=self.checkpointer)
+
+        trace = get_trace_collector().start_trace(usecase, thread_id)
+        try:
+            # Building a graph touches disk and provider SDKs, so keep it off the event loop
+            graph = await asyncio.to_thread(self.registry.get_or_build, graph_key, build)
+        except RequestError:
+            trace.finish()
+            raise
+        except Exception as e:
+            trace.finish()
+            raise RequestError(f"Graph setup failed: {str(e)}", status_code=502)
+        return {"graph": graph, "state": state, "config": config, "thread_id": thread_id, "usecase": usecase,
+                "trace": trace}
+
+    @staticmethod
+    def _sse(event: str, data: Dict[str, Any]) -> str:
+        return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+
+def create_app(**kwargs) -> Starlette:
+    """
+    Create the ASGI application, e.g. `uvicorn "src.langgraphagenticai.api.server:create_app" --factory`
+    """
+    return AgenticAIServer(**kwargs).build_app()
@@ -0,0 +1,296 @@
+import asyncio
+import json
+import os
+import statistics
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterator, List, Optional, Set
+import logging
+
+from langchain_core.messages import HumanMessage
+
+from src.langgraphagenticai.LLMS.registry import LLM_PROVIDERS, PROVIDER_API_KEYS
+from src.langgraphagenticai.LLMS.model_factory import create_chat_model
+from src.langgraphagenticai.graph.graph_builder import GraphBuilder
+from src.langgraphagenticai.graph.graph_registry import GraphRegistry, get_graph_key
+from src.langgraphagenticai.ui.uiconfigfile import Config
+from src.langgraphagenticai.utils.messages import turn_result
+from src.langgraphagenticai.utils.news_digest_store import incremental_digest_enabled
+from src.langgraphagenticai.utils.news_prefetcher import max_digest_age
+from src.langgraphagenticai.utils.tracing import get_trace_collector
+
+NEWS_USECASE = "AI News Summarizer"
+
+
+def percentile(samples: List[float], pct: float) -> Optional[float]:
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+class BatchRunner:
+    """
+    Run a JSONL file of prompts through the GraphBuilder use cases from the command line.
+
+    Each input line is a JSON object with "message" (or "prompt") and
+    optionally "id", "usecase", "provider", "model" and, for the AI News
+    Summarizer, "days"; a line holding a JSON string is a bare message.
+    Missing fields fall back to the runner's defaults and API keys come from
+    the environment, as for the news worker. Up to concurrency prompts run at
+    once with the graphs' async API, and each result is appended to the
+    output JSONL as soon as it finishes, so an interrupted run can be resumed:
+    prompts whose id already has a successful result are skipped.
+    """
+
+    def __init__(self, output_path: str, usecase: str = "Basic Chatbot", provider: str = "Groq",
+                 model: Optional[str] = None, days: str = "3 days", concurrency: int = 4,
+                 timeout: Optional[float] = None, resume: bool = False, semantic_cache: bool = False,
+                 precomputed_digests: bool = False, config: Optional[Config] = None, registry: Optional[GraphRegistry] = None):
+        """
+        Args:
+            output_path: JSONL file results are appended to
+            usecase: Use case of prompts that do not name one
+            provider: LLM provider (Groq, OpenAI, Gemini or Auto) of prompts that do not name one
+            model: Model of prompts that do not name one, defaults to the provider's first model option
+            days: News window of AI News Summarizer prompts that do not name one
+            concurrency: Prompts run at once
+            timeout: Seconds one prompt may run before it is recorded as failed, or None for no limit
+            resume: Skip prompts that already have a successful result in output_path
+            semantic_cache: Answer Basic Chatbot prompts from the semantic response cache. Off by
+                default, so every prompt of an evaluation run reaches the model
+            precomputed_digests: Answer AI News Summarizer prompts from a stored digest younger than
+                NEWS_DIGEST_MAX_AGE_SECONDS. Off by default, so every news prompt generates its digest
+            config: UI configuration with the use case and model options
+            registry: Compiled graph registry, a private one by default
+        """
+        self.output_path = output_path
+        self.usecase = usecase
+        self.provider = provider
+        self.model = model
+        self.days = days
+        self.concurrency = concurrency
+        self.timeout = timeout
+        self.resume = resume
+        self.semantic_cache = semantic_cache
+        self.precomputed_digests = precomputed_digests
+        self.config = config or Config()
+        self.registry = registry or GraphRegistry()
+        self.logger = logging.getLogger(__name__)
+        # Graph key -> error, so a bad key or model fails its prompts without rebuilding each time
+        self._build_errors: Dict[str, str] = {}
+
+    def completed_ids(self) -> Set[str]:
+        """
+        Return the ids that already have a successful result in the output file
+        """
+        completed = set()
+        if not os.path.exists(self.output_path):
+            return completed
+        with open(self.output_path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    # A line cut short by an interrupted run
+                    continue
+                if isinstance(record, dict) and record.get("status") == "ok":
+                    completed.add(str(record.get("id")))
+        return completed
+
+    @staticmethod
+    def read_prompts(path: str) -> Iterator[Dict[str, Any]]:
+        """
+        Yield the prompts of a JSONL file, each with an "id" (its line number when it has none)
+        """
+        with open(path, encoding="utf-8") as f:
+            for line_number, line in enumerate(f, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    item = json.loads(line)
+                except ValueError as e:
+                    raise ValueError(f"{path}:{line_number} is not valid JSON: {str(e)}")
+                if isinstance(item, str):
+                    item = {"message": item}
+                if not isinstance(item, dict):
+                    raise ValueError(f"{path}:{line_number} must be a JSON object or string")
+                item["id"] = str(item.get("id", line_number))
+                yield item
+
+    def default_model(self, provider: str) -> Any:
+        options = {'Groq': self.config.get_groq_model_options(), 'OpenAI': self.config.get_openai_model_options(),
+                   'Gemini': self.config.get_gemini_model_options()}
+        if provider == 'Auto':
+            return {name: models[0] for name, models in options.items() if models}
+        return options[provider][0] if options[provider] else None
+
+    def user_controls(self, item: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Build the user controls of one prompt, as the Streamlit sidebar would
+        """
+        usecase = item.get("usecase") or self.usecase
+        provider = item.get("provider") or self.provider
+        if usecase not in self.config.get_usecase_options():
+            raise ValueError(f"Unsupported use case: {usecase}")
+        if provider not in LLM_PROVIDERS:
+            raise ValueError(f"Unsupported LLM: {provider}")
+        model = item.get("model") or (self.model if provider == self.provider else None) or self.default_model(provider)
+        if not model:
+            raise ValueError(f"No model given for {provider}")
+
+        controls = {"selected_llm": provider, "selected_model": model, "selected_usecase": usecase}
+        if provider == 'Auto':
+            controls.update({"selected_model": "auto", "routed_models": model})
+        for control_key, env_key in PROVIDER_API_KEYS.values():
+            controls[control_key] = os.environ.get(env_key, "")
+        if usecase == NEWS_USECASE:
+            controls.update({
+                "TAVILY_API_KEY": os.environ.get("TAVILY_API_KEY", ""),
+                "selected_days": item.get("days") or self.days,
+                "generate_news_summary": True,
+                "refresh_news_digest": bool(item.get("refresh")),
+            })
+        return controls
+
+    def get_graph(self, controls: Dict[str, Any]):
+        """
+        Return the compiled graph for the controls' use case, provider and model, building it once
+        """
+        provider, usecase = controls["selected_llm"], controls["selected_usecase"]
+        graph_key = get_graph_key(controls, provider, usecase)
+        if graph_key in self._build_errors:
+            raise RuntimeError(self._build_errors[graph_key])
+
+        def build():
+            model = create_chat_model(provider, controls)
+            # One-shot prompts, so no checkpointer: nothing is kept between runs
+            return GraphBuilder(model, semantic_cache=self.semantic_cache, cache_scope=graph_key[-1],
+                                news_incremental=incremental_digest_enabled(),
+                                news_max_digest_age=max_digest_age() if self.precomputed_digests else 0
+                                ).setup_graph(usecase)
+
+        try:
+            return self.registry.get_or_build(graph_key, build)
+        except Exception as e:
+            self._build_errors[graph_key] = f"Graph setup failed: {str(e)}"
+            raise RuntimeError(self._build_errors[graph_key])
+
+    async def run_prompt(self, item: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Run one prompt and return its result record; failures are recorded, not raised
+        """
+        record = {"id": item["id"], "usecase": item.get("usecase") or self.usecase,
+                  "provider": item.get("provider") or self.provider}
+        start = time.perf_counter()
+        trace = None
+        try:
+            controls = self.user_controls(item)
+            record["model"] = controls["selected_model"] if controls["selected_llm"] != 'Auto' else controls["routed_models"]
+            # Building a graph touches disk and provider SDKs, so keep it off the event loop
+            graph = await asyncio.to_thread(self.get_graph, controls)
+            message = item.get("message") or item.get("prompt") or (
+                "Generate AI News Summary" if record["usecase"] == NEWS_USECASE else "")
+            if not message:
+                raise ValueError("'message' is required")
+            state = {"messages": [HumanMessage(content=message)]}
+            if record["usecase"] == NEWS_USECASE:
+                state["user_controls"] = controls
+
+            trace = get_trace_collector().start_trace(record["usecase"], f"batch-{item['id']}")
+            result = await asyncio.wait_for(graph.ainvoke(state, trace.with_callbacks(None)), self.timeout)
+            record["messages"], record["reply"] = turn_result(result)
+            record["status"] = "ok"
+        except asyncio.TimeoutError:
+            record.update({"status": "error", "error": f"Timed out after {self.timeout}s"})
+        except Exception as e:
+            self.logger.warning(f"Prompt {item['id']} failed: {str(e)}")
+            record.update({"status": "error", "error": str(e)})
+        finally:
+            if trace is not None:
+                trace.finish()
+        record["latency"] = time.perf_counter() - start
+        record["finished_at"] = datetime.now(timezone.utc).isoformat(timespec="seconds")
+        return record
+
+    async def run(self, prompts: Iterator[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Run every prompt not completed yet, appending each result to the output
+        file as it finishes, and return the run summary
+        """
+        skip = self.completed_ids() if self.resume else set()
+        records = []
+        skipped = 0
+        start = time.perf_counter()
+
+        def pending():
+            nonlocal skipped
+            for item in prompts:
+                if item["id"] in skip:
+                    skipped += 1
+                    continue
+                yield item
+
+        queue = pending()
+        os.makedirs(os.path.dirname(self.output_path) or ".", exist_ok=True)
+        with open(self.output_path, "a" if self.resume else "w", encoding="utf-8") as output:
+            async def worker():
+                # Workers pull from the shared iterator, so the input file is read lazily
+                for item in queue:
+                    record = await self.run_prompt(item)
+                    output.write(json.dumps(record, default=str) + "\n")
+                    output.flush()
+                    records.append(record)
+                    self.logger.info(f"[{len(records)}] {record['id']}: {record['status']} "
+                                     f"in {record['latency']:.2f}s")
+
+            await asyncio.gather(*(worker() for _ in range(max(1, self.concurrency))))
+
+        return self.summarize(records, skipped, time.perf_counter() - start)
+
+    def summarize(self, records: List[Dict[str, Any]], skipped: int, wall_time: float) -> Dict[str, Any]:
+        latencies = [record["latency"] for record in records if record["status"] == "ok"]
+        succeeded = len(latencies)
+        return {
+            "prompts": len(records),
+            "succeeded": succeeded,
+            "failed": len(records) - succeeded,
+            "skipped": skipped,
+            "concurrency": self.concurrency,
+            "wall_time": wall_time,
+            "throughput_per_second": succeeded / wall_time if wall_time > 0 else 0.0,
+            "latency": {
+                "mean": statistics.mean(latencies) if latencies else None,
+                "p50": percentile(latencies, 50),
+                "p95": percentile(latencies, 95),
+                "max": max(latencies) if latencies else None,
+            },
+            "output": self.output_path,
+        }
+
+
+def format_summary(summary: Dict[str, Any]) -> str:
+    latency = summary["latency"]
+    seconds = lambda value: f"{value:.2f}s" if value is not None else "-"
+    return (f"{summary['prompts']} prompts run ({summary['succeeded']} ok, {summary['failed']} failed, "
+            f"{summary['skipped']} skipped as already done) in {summary['wall_time']:.1f}s "
+            f"at concurrency {summary['concurrency']}\n"
+            f"throughput {summary['throughput_per_second']:.2f} prompts/s, latency mean {seconds(latency['mean'])}, "
+            f"p50 {seconds(latency['p50'])}, p95 {seconds(latency['p95'])}, max {seconds(latency['max'])}\n"
+            f"results in {summary['output']}")
+
+
+def run_batch(input_path: str, summary_path: Optional[str] = None, **runner_options: Any) -> Dict[str, Any]:
+    """
+    Run a prompts JSONL file with a BatchRunner, print its summary and
+    optionally write it as JSON to summary_path
+    """
+    logging.basicConfig(level=os.getenv("BATCH_LOG_LEVEL", "INFO"),
+                        format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    runner = BatchRunner(**runner_options)
+    summary = asyncio.run(runner.run(BatchRunner.read_prompts(input_path)))
+    print(format_summary(summary))
+    if summary_path:
+        with open(summary_path, "w", encoding="utf-8") as f:
+            json.dump(summary, f, indent=2)
+    return summary
@@ -0,0 +1,92 @@
+import os
+import sqlite3
+import threading
+import zlib
+from typing import Any, Optional, Tuple
+import logging
+
+from langgraph.checkpoint.serde.base import SerializerProtocol
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+from langgraph.checkpoint.sqlite import SqliteSaver
+from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
+
+DEFAULT_CHECKPOINT_PATH = os.path.join(".cache", "checkpoints.sqlite3")
+
+
+class CompressedSerializer(SerializerProtocol):
+    """
+    Serializer that zlib-compresses payloads above a size threshold.
+
+    Message histories are mostly repetitive text, so compressing the msgpack
+    payload keeps the checkpoint table small. Small payloads are stored as-is.
+    """
+
+    def __init__(self, serde: Optional[SerializerProtocol] = None, min_size: int = 512, level: int = 6):
+        self.serde = serde or JsonPlusSerializer()
+        self.min_size = min_size
+        self.level = level
+
+    def dumps_typed(self, obj: Any) -> Tuple[str, bytes]:
+        typ, data = self.serde.dumps_typed(obj)
+        if data is not None and len(data) >= self.min_size:
+            return f"{typ}+zlib", zlib.compress(data, self.level)
+        return typ, data
+
+    def loads_typed(self, data: Tuple[str, bytes]) -> Any:
+        typ, payload = data
+        if typ.endswith("+zlib"):
+            return self.serde.loads_typed((typ[:-len("+zlib")], zlib.decompress(payload)))
+        return self.serde.loads_typed(data)
+
+
+_checkpointer: Optional[SqliteSaver] = None
+_checkpointer_lock = threading.Lock()
+
+
+def _checkpoint_db_path() -> str:
+    db_path = os.getenv("CHECKPOINT_DB_PATH", DEFAULT_CHECKPOINT_PATH)
+    directory = os.path.dirname(db_path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    return db_path
+
+
+def get_checkpointer() -> SqliteSaver:
+    """
+    Return the process-wide SQLite checkpointer shared by all compiled chat graphs.
+    Conversations are separated by the thread_id in each run's config.
+    """
+    global _checkpointer
+    with _checkpointer_lock:
+        if _checkpointer is None:
+            db_path = _checkpoint_db_path()
+            conn = sqlite3.connect(db_path, check_same_thread=False)
+            # WAL keeps readers and the background writer from blocking each other
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            _checkpointer = SqliteSaver(conn, serde=CompressedSerializer())
+            logging.getLogger(__name__).info(f"Using conversation checkpoints at {db_path}")
+        return _checkpointer
+
+
+async def open_async_checkpointer() -> AsyncSqliteSaver:
+    """
+    Open an async checkpointer on the same database as get_checkpointer().
+    Graphs run with ainvoke/astream need it; it is bound to the running event
+    loop, so the caller owns it and closes its connection on shutdown.
+    """
+    import aiosqlite
+
+    db_path = _checkpoint_db_path()
+    conn = await aiosqlite.connect(db_path)
+    await conn.execute("PRAGMA journal_mode=WAL")
+    await conn.execute("PRAGMA synchronous=NORMAL")
+    logging.getLogger(__name__).info(f"Using async conversation checkpoints at {db_path}")
+    return AsyncSqliteSaver(conn, serde=CompressedSerializer())
+
+
+def get_thread_config(thread_id: str, usecase: str) -> dict:
+    """
+    Build the run config that scopes checkpoints to one conversation
+    """
+    return {"configurable": {"thread_id": f"{thread_id}:{usecase}"}}
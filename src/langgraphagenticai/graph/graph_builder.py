@@ -1,28 +1,100 @@
+from langchain_core.runnables import RunnableLambda
 from langgraph.graph import StateGraph,START,END
 from src.langgraphagenticai.state.state import State
-from src.langgraphagenticai.nodes.basic_chatbot_node import BasicChatbotNode
-from src.langgraphagenticai.tools.search_tool import get_tools,create_tool_node
-from langgraph.prebuilt import ToolNode,tools_condition
-from src.langgraphagenticai.nodes.chatbot_with_tool_node import ChatbotWithToolNode
-from src.langgraphagenticai.nodes.news_summarizer_node import NewsSummarizerNode
+
+# Each build method imports the nodes, tools and caches of its own use case, so
+# a process only loads (e.g.) FAISS, Tavily or tiktoken for the use cases it builds
 
 class GraphBuilder:
-    def __init__(self,model):
+    # Use cases whose conversation is persisted between turns by a checkpointer
+    CONVERSATIONAL_USECASES = ("Basic Chatbot", "Chatbot with Web")
+
+    def __init__(self,model,news_map_reduce=True,semantic_cache=None,cache_scope=None,tools=None,news_fetcher_options=None,
+                 tool_timeout=20.0,max_tool_rounds=3,news_prompt_token_budget=None,news_incremental=False,
+                 news_digest_store=None,news_max_digest_age=None,history_compaction=False,history_keep_turns=None,
+                 history_token_budget=None):
+        """
+        Args:
+            model: Chat model used by every node
+            news_map_reduce: Build the map-reduce variant of the AI News Summarizer
+            semantic_cache: Answer repeated opening questions from the semantic cache, defaults to
+                semantic_cache_enabled()
+            cache_scope: Tenant the cached replies belong to, e.g. the credential fingerprint of the
+                graph registry key; replies are only served within the same scope, and the cache
+                is not used without one
+            tools: Tools for "Chatbot with Web", defaults to get_tools()
+            news_fetcher_options: Extra keyword arguments for the news summarizer's NewsFetcher
+            tool_timeout: Seconds each web search call may take before it is answered with a timeout
+            max_tool_rounds: Tool rounds per user turn before "Chatbot with Web" must answer
+            news_prompt_token_budget: Input tokens per news summarization prompt, defaults to the model's budget
+            news_incremental: Build the incremental AI News Summarizer, which only summarizes articles
+                that are new since the last digest
+            news_digest_store: Store of the incremental digest, defaults to the process-wide one
+            news_max_digest_age: Seconds a stored (e.g. prefetched) news digest is served for
+                instead of generating a new one, or None to always generate
+            history_compaction: Add a compaction stage before the chat node of the conversational
+                use cases, which summarizes older turns so each prompt stays within the model's budget
+            history_keep_turns: Latest turns kept verbatim by the compaction, defaults to HISTORY_KEEP_TURNS or 4
+            history_token_budget: Input tokens per chat prompt, defaults to the model's budget
+        """
         self.llm=model
+        self.news_map_reduce=news_map_reduce
+        self.semantic_cache=semantic_cache
+        self.cache_scope=cache_scope
+        self.tools=tools
+        self.news_fetcher_options=news_fetcher_options
+        self.tool_timeout=tool_timeout
+        self.max_tool_rounds=max_tool_rounds
+        self.news_prompt_token_budget=news_prompt_token_budget
+        self.news_incremental=news_incremental
+        self.news_digest_store=news_digest_store
+        self.news_max_digest_age=news_max_digest_age
+        self.history_compaction=history_compaction
+        self.history_keep_turns=history_keep_turns
+        self.history_token_budget=history_token_budget
         self.graph_builder=StateGraph(State)
+
+    def _history_compactor(self):
+        """
+        Return the history compactor of a chat graph, or None when compaction is off
+        """
+        if not self.history_compaction:
+            return None
+        from src.langgraphagenticai.utils.history_compactor import HistoryCompactor
+
+        return HistoryCompactor(self.llm,keep_turns=self.history_keep_turns,token_budget=self.history_token_budget)
+
+    def _add_chat_entry(self,compactor):
+        """
+        Start the graph at the chat node, through the compaction stage when there is a compactor
+        """
+        if compactor is None:
+            self.graph_builder.add_edge(START,"Chatbot")
+            return
+        self.graph_builder.add_node("CompactHistory",RunnableLambda(compactor.compact,afunc=compactor.acompact,name="CompactHistory"))
+        self.graph_builder.add_edge(START,"CompactHistory")
+        self.graph_builder.add_edge("CompactHistory","Chatbot")
         
     def basic_chatbot_build_graph(self):
         """
         Builds a basic chatbot graph using Langgraph.
         This method initializes a chatbot node using the 'BasicChatbotNode' class
         and integrates it into the graph. The chatbot is set as both the 
-        entry and exit point of the graph.
+        entry and exit point of the graph. When enabled and given a cache
+        scope, opening questions go through the shared semantic response
+        cache. With history compaction, a CompactHistory stage runs before the chatbot.
         """
-        self.basic_chatbot_node=BasicChatbotNode(self.llm)
+        from src.langgraphagenticai.nodes.basic_chatbot_node import BasicChatbotNode
+        from src.langgraphagenticai.utils.semantic_cache import get_default_semantic_cache,semantic_cache_enabled
+
+        enabled=self.semantic_cache if self.semantic_cache is not None else semantic_cache_enabled()
+        cache=get_default_semantic_cache() if enabled and self.cache_scope is not None else None
+        compactor=self._history_compactor()
+        self.basic_chatbot_node=BasicChatbotNode(self.llm,cache=cache,compactor=compactor,cache_scope=self.cache_scope)
         
         
-        self.graph_builder.add_node("Chatbot",self.basic_chatbot_node.process)
-        self.graph_builder.add_edge(START,"Chatbot")
+        self.graph_builder.add_node("Chatbot",RunnableLambda(self.basic_chatbot_node.process,afunc=self.basic_chatbot_node.aprocess,name="Chatbot"))
+        self._add_chat_entry(compactor)
         self.graph_builder.add_edge("Chatbot",END)
     
     def chatbot_with_tools_build_graph(self):
@@ -31,17 +103,23 @@ class GraphBuilder:
         This method creates a chatbot graph that includes both a chatbot node
         ND  tool node. It defines tools,initializes the Chatbot with tool
         capabilities, and sets up the graph structure accordingly.
-        The chatbot node is set as the entry point
+        The chatbot node is set as the entry point, after the CompactHistory
+        stage when history compaction is on
         """
+        from langgraph.prebuilt import tools_condition
+        from src.langgraphagenticai.nodes.chatbot_with_tool_node import ChatbotWithToolNode
+        from src.langgraphagenticai.tools.search_tool import get_tools,create_tool_node
+
         ## Define tool and toolnode
-        tools=get_tools()
+        tools=self.tools if self.tools is not None else get_tools()
             
-        tool_node=create_tool_node(tools)
+        tool_node=create_tool_node(tools,timeout=self.tool_timeout)
 
         ## Define the LLM
         llm=self.llm
         ## Define the chatbot nodes
-        obj_chatbot_with_node=ChatbotWithToolNode(llm)
+        compactor=self._history_compactor()
+        obj_chatbot_with_node=ChatbotWithToolNode(llm,max_tool_rounds=self.max_tool_rounds,compactor=compactor)
         chatbot_node=obj_chatbot_with_node.create_chatbot(tools)
 
 
@@ -50,10 +128,17 @@ class GraphBuilder:
         self.graph_builder.add_node("Chatbot",chatbot_node)
         self.graph_builder.add_node("tools",tool_node)
         ## ADD edges
-        self.graph_builder.add_edge(START,"Chatbot")
+        self._add_chat_entry(compactor)
         self.graph_builder.add_conditional_edges("Chatbot",tools_condition)
         self.graph_builder.add_edge("tools","Chatbot")
 
+    def _news_summarizer_node(self, incremental=False):
+        from src.langgraphagenticai.nodes.news_summarizer_node import NewsSummarizerNode
+
+        return NewsSummarizerNode(self.llm, fetcher_options=self.news_fetcher_options,
+                                  prompt_token_budget=self.news_prompt_token_budget, incremental=incremental,
+                                  digest_store=self.news_digest_store, max_digest_age=self.news_max_digest_age)
+
     def news_summarizer_build_graph(self):
         """
         Build an AI News Summarizer graph.
@@ -62,22 +147,94 @@ class GraphBuilder:
         The news summarizer node handles the entire workflow.
         """
         # Initialize the news summarizer node
-        self.news_summarizer_node = NewsSummarizerNode(self.llm)
+        self.news_summarizer_node = self._news_summarizer_node()
         
         # Add the node to the graph
-        self.graph_builder.add_node("NewsSummarizer", self.news_summarizer_node.process)
+        self.graph_builder.add_node("NewsSummarizer", RunnableLambda(self.news_summarizer_node.process,
+                                                                     afunc=self.news_summarizer_node.aprocess,
+                                                                     name="NewsSummarizer"))
         
         # Set up the graph flow
         self.graph_builder.add_edge(START, "NewsSummarizer")
         self.graph_builder.add_edge("NewsSummarizer", END)
 
-    def setup_graph(self,usecase:str):
-        """Sets up the graph by building the appropriate graph based on usecase."""
+    def news_summarizer_map_reduce_build_graph(self):
+        """
+        Build the map-reduce variant of the AI News Summarizer graph.
+        Articles are fetched once, split into batches that are summarized in
+        parallel through LangGraph fan-out (Send), and the batch notes are then
+        reduced into the six-section digest. Wall-clock time follows the batch
+        size rather than the total number of articles.
+        """
+        self.news_summarizer_node = self._news_summarizer_node()
+
+        node=self.news_summarizer_node
+        self.graph_builder.add_node("FetchNews", RunnableLambda(node.fetch_articles, afunc=node.afetch_articles,
+                                                                name="FetchNews"))
+        self.graph_builder.add_node("SummarizeBatch", RunnableLambda(node.summarize_batch, afunc=node.asummarize_batch,
+                                                                     name="SummarizeBatch"))
+        self.graph_builder.add_node("ReduceSummaries", RunnableLambda(node.reduce_summaries, afunc=node.areduce_summaries,
+                                                                      name="ReduceSummaries"))
+
+        self.graph_builder.add_edge(START, "FetchNews")
+        self.graph_builder.add_conditional_edges("FetchNews", self.news_summarizer_node.route_batches,
+                                                 ["SummarizeBatch", "ReduceSummaries", END])
+        self.graph_builder.add_edge("SummarizeBatch", "ReduceSummaries")
+        self.graph_builder.add_edge("ReduceSummaries", END)
+
+    def news_summarizer_incremental_build_graph(self):
+        """
+        Build the incremental variant of the AI News Summarizer graph.
+        Only articles newer than the digest store's watermark are fetched, the
+        ones not summarized yet are condensed per publication day in parallel
+        (Send), and their notes are merged into the stored per-day summaries,
+        from which the digest of the selected window is rendered. A repeat
+        digest costs one small model call per day with new articles.
+        """
+        self.news_summarizer_node = self._news_summarizer_node(incremental=True)
+
+        node=self.news_summarizer_node
+        self.graph_builder.add_node("FetchNews", RunnableLambda(node.fetch_new_articles, afunc=node.afetch_new_articles,
+                                                                name="FetchNews"))
+        self.graph_builder.add_node("SummarizeBatch", RunnableLambda(node.summarize_batch, afunc=node.asummarize_batch,
+                                                                     name="SummarizeBatch"))
+        self.graph_builder.add_node("MergeDigest", RunnableLambda(node.merge_digest, afunc=node.amerge_digest,
+                                                                  name="MergeDigest"))
+
+        self.graph_builder.add_edge(START, "FetchNews")
+        self.graph_builder.add_conditional_edges("FetchNews", node.route_day_batches,
+                                                 ["SummarizeBatch", "MergeDigest", END])
+        self.graph_builder.add_edge("SummarizeBatch", "MergeDigest")
+        self.graph_builder.add_edge("MergeDigest", END)
+
+    def setup_graph(self,usecase:str,checkpointer=None):
+        """
+        Sets up the graph by building the appropriate graph based on usecase.
+        Every node has a synchronous and an async implementation; invoke/stream
+        use the former and ainvoke/astream the latter.
+        When a checkpointer is given, the conversational use cases persist their
+        message history per thread_id so each turn only sends the new message.
+        """
         if usecase=="Basic Chatbot":
             self.basic_chatbot_build_graph()
         elif usecase=="Chatbot with Web":
             self.chatbot_with_tools_build_graph()
         elif usecase=="AI News Summarizer":
-            self.news_summarizer_build_graph()
+            if self.news_incremental:
+                self.news_summarizer_incremental_build_graph()
+            elif self.news_map_reduce:
+                self.news_summarizer_map_reduce_build_graph()
+            else:
+                self.news_summarizer_build_graph()
         
-        return self.graph_builder.compile()
+        if usecase not in self.CONVERSATIONAL_USECASES:
+            checkpointer=None
+
+        graph=self.graph_builder.compile(checkpointer=checkpointer)
+
+        if usecase=="AI News Summarizer" and (self.news_map_reduce or self.news_incremental):
+            # Batch summaries are I/O bound, so let every batch of a full fetch run at once
+            # (plus one worker that streaming runs keep busy waiting for output)
+            graph=graph.with_config(max_concurrency=self.news_summarizer_node.max_batches+1)
+
+        return graph
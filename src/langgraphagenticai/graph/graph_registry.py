@@ -0,0 +1,155 @@
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple
+import logging
+
+from src.langgraphagenticai.LLMS.registry import PROVIDER_API_KEYS
+from src.langgraphagenticai.tools.search_tool import get_tool_names
+
+
+class GraphRegistry:
+    """
+    Process-wide registry of compiled graphs.
+
+    Compiled graphs are stateless between invocations, so one compiled graph per
+    (usecase, provider, model, tool set, credentials) can be shared by every
+    Streamlit rerun and every session instead of being rebuilt per message.
+    """
+
+    def __init__(self, max_graphs: int = 32):
+        self.max_graphs = max_graphs
+        self.logger = logging.getLogger(__name__)
+        self._graphs: "OrderedDict[Tuple, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._build_locks: Dict[Tuple, threading.Lock] = {}
+        self._stats = {"hits": 0, "misses": 0, "builds": 0, "invalidations": 0}
+
+    @staticmethod
+    def make_key(usecase: str, provider: str, model_name: str, tools: Sequence[str] = (),
+                 credentials: Sequence[Optional[str]] = ()) -> Tuple:
+        """
+        Build a registry key. Credentials are reduced to a short fingerprint so
+        graphs bound to different API keys never share an entry and raw keys are
+        never kept in the registry.
+        """
+        fingerprint = hashlib.sha256("\0".join(c or "" for c in credentials).encode()).hexdigest()[:16]
+        return (usecase, provider, model_name, tuple(sorted(tools)), fingerprint)
+
+    def get(self, key: Tuple) -> Optional[Any]:
+        """
+        Return the compiled graph for key, or None if it has not been built
+        """
+        with self._lock:
+            graph = self._graphs.get(key)
+            if graph is None:
+                self._stats["misses"] += 1
+                return None
+            self._graphs.move_to_end(key)
+            self._stats["hits"] += 1
+            return graph
+
+    def peek(self, key: Tuple) -> Optional[Any]:
+        """
+        Return the compiled graph for key, or None, without counting a hit or miss
+        """
+        with self._lock:
+            return self._graphs.get(key)
+
+    def get_or_build(self, key: Tuple, build: Callable[[], Any]) -> Any:
+        """
+        Return the compiled graph for key, calling build() once if it is missing.
+        Concurrent callers for the same key wait for a single build.
+        """
+        graph = self.get(key)
+        if graph is not None:
+            return graph
+
+        with self._lock:
+            build_lock = self._build_locks.setdefault(key, threading.Lock())
+
+        with build_lock:
+            try:
+                with self._lock:
+                    graph = self._graphs.get(key)
+                if graph is None:
+                    graph = build()
+                    self.put(key, graph)
+                    with self._lock:
+                        self._stats["builds"] += 1
+            finally:
+                with self._lock:
+                    self._build_locks.pop(key, None)
+        return graph
+
+    def put(self, key: Tuple, graph: Any) -> None:
+        """
+        Register a compiled graph under key, evicting the least recently used one if full
+        """
+        with self._lock:
+            self._graphs[key] = graph
+            self._graphs.move_to_end(key)
+            while len(self._graphs) > self.max_graphs:
+                self._graphs.popitem(last=False)
+
+    def invalidate(self, usecase: Optional[str] = None, provider: Optional[str] = None,
+                   model_name: Optional[str] = None) -> int:
+        """
+        Drop every graph matching the given fields (all graphs when none are given)
+        and return how many were removed
+        """
+        with self._lock:
+            stale = [key for key in self._graphs
+                     if (usecase is None or key[0] == usecase)
+                     and (provider is None or key[1] == provider)
+                     and (model_name is None or key[2] == model_name)]
+            for key in stale:
+                del self._graphs[key]
+            self._stats["invalidations"] += len(stale)
+        if stale:
+            self.logger.info(f"Invalidated {len(stale)} compiled graphs")
+        return len(stale)
+
+    def clear(self) -> None:
+        """
+        Drop every compiled graph
+        """
+        self.invalidate()
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Return hit/miss/build counters and the number of registered graphs
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats["graphs"] = len(self._graphs)
+        return stats
+
+
+_default_registry = GraphRegistry()
+
+
+def get_graph_registry() -> GraphRegistry:
+    """
+    Return the registry shared by all sessions in this process
+    """
+    return _default_registry
+
+
+def get_graph_key(user_input: Dict[str, Any], selected_llm: str, usecase: str) -> Tuple:
+    """
+    Build the graph registry key for the selection in user_input.
+    The API keys in use are part of the key so sessions with different
+    credentials never share a compiled graph.
+    """
+    providers = list(PROVIDER_API_KEYS) if selected_llm == 'Auto' else [selected_llm]
+    credentials = []
+    for provider in providers:
+        control_key, env_key = PROVIDER_API_KEYS.get(provider, (None, None))
+        credentials.append((user_input.get(control_key) if control_key else '') or os.environ.get(env_key or '', ''))
+    tools = get_tool_names() if usecase == "Chatbot with Web" else []
+    credentials += [os.environ.get("TAVILY_API_KEY", "")] if tools else []
+    model = (tuple(sorted(user_input.get('routed_models', {}).items())) if selected_llm == 'Auto'
+             else user_input.get('selected_model'))
+    return GraphRegistry.make_key(usecase, selected_llm, model, tools, credentials)
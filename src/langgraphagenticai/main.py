@@ -1,10 +1,31 @@
+import os
+import uuid
 import streamlit as st
 from src.langgraphagenticai.ui.streamlitui.loadui import LoadStreamlitUI
-from src.langgraphagenticai.LLMS.groqllm import GroqLLM
-from src.langgraphagenticai.LLMS.Openaillm import OpenaiLLM
-from src.langgraphagenticai.LLMS.geminillm import GeminiLLM
+from src.langgraphagenticai.LLMS.registry import LLM_PROVIDERS,get_llm_class
 from src.langgraphagenticai.graph.graph_builder import GraphBuilder
+from src.langgraphagenticai.graph.graph_registry import get_graph_key,get_graph_registry
+from src.langgraphagenticai.graph.checkpointer import get_checkpointer,get_thread_config
 from src.langgraphagenticai.ui.streamlitui.display_result import DisplayResultStreamlit
+from src.langgraphagenticai.ui.streamlitui.trace_panel import TracePanelStreamlit
+from src.langgraphagenticai.ui.streamlitui.transcript import TranscriptStreamlit,get_transcript
+from src.langgraphagenticai.utils.tracing import get_trace_collector,start_metrics_server
+from src.langgraphagenticai.utils.news_digest_store import incremental_digest_enabled
+from src.langgraphagenticai.utils.history_compactor import history_compaction_enabled
+from src.langgraphagenticai.utils.news_prefetcher import max_digest_age,prefetch_enabled
+from src.langgraphagenticai.news_worker import start_app_prefetcher
+
+def get_thread_id(start_new=False):
+    """
+    Return this browser session's conversation id.
+    It is kept in the URL so a page reload or server restart resumes the same
+    checkpointed conversation.
+    """
+    thread_id = st.query_params.get("thread")
+    if start_new or not thread_id:
+        thread_id = uuid.uuid4().hex
+        st.query_params["thread"] = thread_id
+    return thread_id
 
 def load_langgraph_agenticai_app():
     """
@@ -24,6 +45,22 @@ def load_langgraph_agenticai_app():
         
     # Store user controls in session state for news summarizer
     st.session_state['user_controls'] = user_input
+
+    ## Prometheus metrics for deployments without the HTTP API
+    if os.environ.get("METRICS_PORT"):
+        start_metrics_server(int(os.environ["METRICS_PORT"]))
+
+    thread_id = get_thread_id(start_new=user_input.get('new_conversation', False))
+
+    trace_panel=TracePanelStreamlit(thread_id) if user_input.get('show_traces') else None
+    if trace_panel:
+        trace_panel.display()
+
+    ## Redraw the conversation so far from this session's transcript, without re-running any graph
+    transcript=get_transcript(thread_id,user_input.get('selected_usecase'))
+    if user_input.get('selected_usecase') in GraphBuilder.CONVERSATIONAL_USECASES:
+        transcript.hydrate(get_checkpointer(),get_thread_config(thread_id,user_input.get('selected_usecase')))
+    TranscriptStreamlit(transcript).display()
     
     # For AI News Summarizer, check if button was clicked instead of waiting for chat input
     if user_input.get('selected_usecase') == "AI News Summarizer":
@@ -41,40 +78,58 @@ def load_langgraph_agenticai_app():
     
     if user_message:
         try:
-        ## Configure LLM Model based on selected LLM
+        ## Configure LLM Model based on selected LLM; its SDK is imported on first use
            selected_llm = user_input.get('selected_llm', 'Groq')
            
-           if selected_llm == 'Groq':
-               obj_llm_config = GroqLLM(user_controls_input=user_input)
-           elif selected_llm == 'OpenAI':
-               obj_llm_config = OpenaiLLM(user_controls_input=user_input)
-           elif selected_llm == 'Gemini':
-               obj_llm_config = GeminiLLM(user_controls_input=user_input)
-           else:
+           if selected_llm not in LLM_PROVIDERS:
                st.error(f"Unsupported LLM: {selected_llm}")
                return
+           obj_llm_config = get_llm_class(selected_llm)(user_controls_input=user_input)
                
-           model = obj_llm_config.get_llm_model()
-
-           if not model:
-               st.error("Error configuring LLM Model")
-               return
-            
         ## Initialize Graph based on the usecase
            usecase=user_input['selected_usecase']
 
            if not usecase:
                st.error("Please select a valid use case")
                return
-           
-           ## Graph builder
 
-           graph_builder=GraphBuilder(model)
+           ## Reuse the compiled graph for this usecase/provider/model if one exists
+           graph_registry=get_graph_registry()
+           graph_key=get_graph_key(user_input,selected_llm,usecase)
+           model=None
+
+           ## Only configure the model when the graph still has to be built
+           if graph_registry.peek(graph_key) is None:
+               model = obj_llm_config.get_llm_model()
+
+               if not model:
+                   st.error("Error configuring LLM Model")
+                   return
+
+           ## One trace per turn: graph build, nodes, model and tool calls, and rendering
+           trace=get_trace_collector().start_trace(usecase,thread_id)
+
+           def build_graph():
+               ## The graph may have been evicted since the peek above
+               llm = model or obj_llm_config.get_llm_model()
+               if not llm:
+                   raise ValueError("Error configuring LLM Model")
+               ## Graph builder
+               ## The last part of the graph key fingerprints the API keys, so cached replies stay with their owner
+               with trace.span("build","graph_build"):
+                   return GraphBuilder(llm,cache_scope=graph_key[-1],news_incremental=incremental_digest_enabled(),news_max_digest_age=max_digest_age(),history_compaction=history_compaction_enabled()).setup_graph(usecase,checkpointer=get_checkpointer())
 
            try:
-               graph=graph_builder.setup_graph(usecase)
-               DisplayResultStreamlit(usecase,graph,user_message).display_result_on_ui()
+               graph=graph_registry.get_or_build(graph_key,build_graph)
+               ## Opt-in: keep the digest of every days option fresh in the background with the operator's environment keys
+               if usecase=="AI News Summarizer" and prefetch_enabled():
+                   start_app_prefetcher()
+               config=get_thread_config(thread_id,usecase) if usecase in GraphBuilder.CONVERSATIONAL_USECASES else None
+               DisplayResultStreamlit(usecase,graph,user_message,config=config,trace=trace,transcript=transcript).display_result_on_ui()
+               if trace_panel:
+                   trace_panel.display()
            except Exception as e:
+               trace.finish()
                # Handle cross-provider API key errors with user-friendly messages
                error_str = str(e).lower()
                
@@ -0,0 +1,92 @@
+import os
+import threading
+import logging
+
+from src.langgraphagenticai.LLMS.registry import LLM_PROVIDERS,PROVIDER_API_KEYS
+from src.langgraphagenticai.LLMS.model_factory import create_chat_model
+from src.langgraphagenticai.graph.graph_builder import GraphBuilder
+from src.langgraphagenticai.ui.uiconfigfile import Config
+from src.langgraphagenticai.utils.news_digest_store import incremental_digest_enabled
+from src.langgraphagenticai.utils.news_prefetcher import NewsPrefetcher,get_news_prefetcher,max_digest_age,prefetch_interval
+
+
+def get_worker_controls(config=None):
+    """
+    Build the user controls of the news worker from the environment:
+    NEWS_WORKER_LLM (Groq, OpenAI, Gemini or Auto), NEWS_WORKER_MODEL (defaults
+    to the provider's first model option) and the provider and Tavily API keys
+    """
+    config = config or Config()
+    provider = os.getenv("NEWS_WORKER_LLM", "Groq")
+    model_options = {'Groq': config.get_groq_model_options(), 'OpenAI': config.get_openai_model_options(),
+                     'Gemini': config.get_gemini_model_options()}
+    controls = {'selected_llm': provider, 'TAVILY_API_KEY': os.environ.get("TAVILY_API_KEY", "")}
+    for control_key, env_key in PROVIDER_API_KEYS.values():
+        controls[control_key] = os.environ.get(env_key, "")
+    if provider == 'Auto':
+        controls['routed_models'] = {name: options[0] for name, options in model_options.items() if options}
+        controls['selected_model'] = 'auto'
+    else:
+        controls['selected_model'] = os.getenv("NEWS_WORKER_MODEL") or model_options[provider][0]
+    return controls
+
+def build_worker_graph(controls):
+    """
+    Compile the AI News Summarizer graph for controls built by get_worker_controls
+
+    Raises:
+        ValueError: If the provider is unsupported or the Tavily API key is missing
+        ModelConfigError: If the model could not be configured, telling why
+    """
+    if controls['selected_llm'] not in LLM_PROVIDERS:
+        raise ValueError(f"Unsupported NEWS_WORKER_LLM: {controls['selected_llm']}")
+    if not controls['TAVILY_API_KEY']:
+        raise ValueError("TAVILY_API_KEY is required for the news worker")
+    model = create_chat_model(controls['selected_llm'], controls)
+    return GraphBuilder(model, news_incremental=incremental_digest_enabled(),
+                        news_max_digest_age=max_digest_age()).setup_graph("AI News Summarizer")
+
+
+_app_prefetch_lock = threading.Lock()
+_app_prefetch_started = False
+
+
+def start_app_prefetcher():
+    """
+    Start the process-wide news prefetcher inside the app (NEWS_PREFETCH=1).
+    It runs with the operator's environment keys only, never with a session's,
+    and is set up once per process; returns whether it is running.
+    """
+    global _app_prefetch_started
+    with _app_prefetch_lock:
+        if not _app_prefetch_started:
+            _app_prefetch_started = True
+            try:
+                controls = get_worker_controls()
+                prefetcher = get_news_prefetcher()
+                prefetcher.configure(build_worker_graph(controls), controls)
+                prefetcher.start()
+            except Exception as e:
+                logging.getLogger(__name__).warning(f"News prefetcher not started: {str(e)}")
+    return get_news_prefetcher().stats()["running"]
+
+def run_news_worker(once=False):
+    """
+    Keep the stored digest of every days option fresh from a separate process,
+    so the app serves "Generate" clicks from the shared digest store.
+    With once=True every option is refreshed a single time.
+    """
+    logging.basicConfig(level=os.getenv("NEWS_WORKER_LOG_LEVEL", "INFO"),
+                        format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    logger = logging.getLogger(__name__)
+
+    controls = get_worker_controls()
+    graph = build_worker_graph(controls)
+    prefetcher = NewsPrefetcher(interval_seconds=prefetch_interval())
+    prefetcher.configure(graph, controls)
+    logger.info(f"News worker using {controls['selected_llm']}/{controls['selected_model']}")
+    if once:
+        for option in prefetcher.days_options:
+            prefetcher.refresh(option)
+    else:
+        prefetcher.run_forever()
@@ -1,3 +1,5 @@
+import asyncio
+from langchain_core.messages import AIMessage, HumanMessage
 from src.langgraphagenticai.state.state import State
 
 
@@ -5,11 +7,65 @@ class BasicChatbotNode:
     """
     Basic Chatbot login implementation
     """
-    def __init__(self,model):
+    def __init__(self,model,cache=None,compactor=None,cache_scope=""):
         self.llm=model
+        self.cache=cache
+        self.cache_scope=cache_scope
+        self.compactor=compactor
+        self.model_name=getattr(model,"model_name",None) or getattr(model,"model",None) or type(model).__name__
     
     def process(self,state:State)->dict:
         """"
-        Processes the input state and genereates a chatbiot response
+        Processes the input state and genereates a chatbiot response.
+        Opening questions are answered from the semantic cache when a similar
+        one was already answered by the same model for the same credentials.
         """
-        return{"messages":self.llm.invoke(state["messages"])}
\ No newline at end of file
+        prompt=self._cacheable_prompt(state)
+
+        if prompt is not None:
+            cached_response=self.cache.lookup(prompt,self.model_name,self.cache_scope)
+            if cached_response is not None:
+                return {"messages":AIMessage(content=cached_response)}
+
+        response=self.llm.invoke(self._messages(state))
+
+        if prompt is not None and isinstance(response.content,str) and response.content:
+            self.cache.store(prompt,self.model_name,response.content,self.cache_scope)
+        return{"messages":response}
+
+    async def aprocess(self,state:State)->dict:
+        """
+        Async variant of process, used when the graph runs with ainvoke/astream.
+        The cache embeds on the CPU, so it runs on a worker thread.
+        """
+        prompt=self._cacheable_prompt(state)
+
+        if prompt is not None:
+            cached_response=await asyncio.to_thread(self.cache.lookup,prompt,self.model_name,self.cache_scope)
+            if cached_response is not None:
+                return {"messages":AIMessage(content=cached_response)}
+
+        response=await self.llm.ainvoke(self._messages(state))
+
+        if prompt is not None and isinstance(response.content,str) and response.content:
+            await asyncio.to_thread(self.cache.store,prompt,self.model_name,response.content,self.cache_scope)
+        return{"messages":response}
+
+    def _messages(self,state:State):
+        """
+        Return the messages to send to the model, compacted to its token budget when a compactor is set
+        """
+        return self.compactor.prompt(state) if self.compactor is not None else state["messages"]
+
+    def _cacheable_prompt(self,state:State):
+        """
+        Return the prompt text when the reply can be cached. Only the opening
+        turn of a conversation qualifies, since later replies depend on history
+        (including history compacted into the summary).
+        """
+        messages=state["messages"]
+        if (self.cache is None or len(messages)!=1 or not isinstance(messages[0],HumanMessage)
+                or state.get("history_summary")):
+            return None
+        content=messages[0].content
+        return content if isinstance(content,str) and content.strip() else None
@@ -1,16 +1,58 @@
+from langchain_core.messages import AIMessage, HumanMessage
+from langchain_core.runnables import RunnableLambda
 from src.langgraphagenticai.state.state import State
 
+# Sent (not stored) once the tool budget is spent so the model answers instead of searching again
+FINAL_ANSWER_INSTRUCTION = ("You have used all the tool calls available for this question. "
+							"Answer now using only the information you already have.")
+
 class ChatbotWithToolNode:
 	"""
 	Chatbot logic enhanced with tool integration.
 	"""
-	def __init__(self, model):
+	def __init__(self, model, max_tool_rounds=3, compactor=None):
+		"""
+		Args:
+			model: Chat model that calls the tools
+			max_tool_rounds: Tool rounds allowed per user turn before the model must answer, or None for no limit
+			compactor: HistoryCompactor that keeps each prompt within the model's token budget, or None
+		"""
 		self.llm = model
+		self.max_tool_rounds = max_tool_rounds
+		self.compactor = compactor
+
+	def tool_rounds(self, messages):
+		"""
+		Count the tool rounds (AI messages with tool calls) since the last user message
+		"""
+		rounds = 0
+		for message in reversed(messages):
+			if isinstance(message, HumanMessage):
+				break
+			if isinstance(message, AIMessage) and message.tool_calls:
+				rounds += 1
+		return rounds
+
+	def _messages(self, state):
+		return self.compactor.prompt(state) if self.compactor is not None else state["messages"]
 
+	def _budget_spent(self, messages):
+		return self.max_tool_rounds is not None and self.tool_rounds(messages) >= self.max_tool_rounds
+
+	def _final_answer(self, response):
+		"""
+		Mark a reply forced by the tool budget and drop any tool calls it still makes
+		"""
+		response.tool_calls = []
+		response.response_metadata = {**response.response_metadata, "tool_rounds_exhausted": True}
+		return response
 	
 	def create_chatbot(self,tools):
 		"""
-		Returns a chatbot node function.
+		Returns a chatbot node runnable. It calls the model with invoke when the
+		graph runs synchronously and with ainvoke under ainvoke/astream. Once
+		max_tool_rounds is reached the model is called without tools, which
+		ends the tool loop with a final answer.
 		"""
 		llm_with_tools = self.llm.bind_tools(tools)
 
@@ -18,7 +60,18 @@ class ChatbotWithToolNode:
 			"""
 			Chatbot logic for processing the input state and returning a response.
 			"""
-			return {"messages":[llm_with_tools.invoke(state["messages"])]}
+			messages = self._messages(state)
+			if self._budget_spent(state["messages"]):
+				return {"messages":[self._final_answer(self.llm.invoke(messages + [HumanMessage(content=FINAL_ANSWER_INSTRUCTION)]))]}
+			return {"messages":[llm_with_tools.invoke(messages)]}
+
+		async def achatbot_node(state: State):
+			"""
+			Async variant of chatbot_node.
+			"""
+			messages = self._messages(state)
+			if self._budget_spent(state["messages"]):
+				return {"messages":[self._final_answer(await self.llm.ainvoke(messages + [HumanMessage(content=FINAL_ANSWER_INSTRUCTION)]))]}
+			return {"messages":[await llm_with_tools.ainvoke(messages)]}
 		
-		return chatbot_node
- 
\ No newline at end of file
+		return RunnableLambda(chatbot_node, afunc=achatbot_node, name="Chatbot")
@@ -1,25 +1,98 @@
 from langchain_core.messages import HumanMessage, AIMessage
-from src.langgraphagenticai.state.state import State
+from langgraph.constants import TAG_NOSTREAM
+from langgraph.graph import END
+from langgraph.types import Send
+from src.langgraphagenticai.state.state import State, NewsBatchState
 from src.langgraphagenticai.utils.news_fetcher import NewsFetcher
+from src.langgraphagenticai.utils.news_digest_store import (NewsDigestStore, article_day,
+                                                             get_default_news_digest_store)
+from src.langgraphagenticai.utils.prompt_packer import (PromptPacker, TokenCounter, MODEL_PROMPT_BUDGETS,
+                                                        is_context_overflow, lead_text, model_names, prompt_budget)
+import asyncio
 import logging
-from typing import Dict, Any
+import re
+import time
+from datetime import datetime, timezone
+from typing import Dict, Any, List, Optional, Tuple
 
 class NewsSummarizerNode:
     """
     Node for processing and summarizing AI/ML/Tech news articles
     """
     
-    def __init__(self, llm):
+    # Headings of the digest, in order, with their emoji
+    DIGEST_SECTIONS = (("🚀", "Major AI Developments"), ("🔬", "Research & Innovation"),
+                       ("💼", "Business & Funding"), ("🛠️", "Tools & Applications"),
+                       ("🌟", "Notable Mentions"), ("📊", "Market Trends"))
+    
+    # Bullets per section of an incremental digest, newest days first
+    MAX_SECTION_BULLETS = 8
+    
+    # Widest days option; bounds the per-day batches of an incremental run
+    MAX_WINDOW_DAYS = 15
+    
+    def __init__(self, llm, batch_size: int = 10, max_articles: int = 60, fetcher_options: Dict[str, Any] = None,
+                 prompt_token_budget: Optional[int] = None, incremental: bool = False,
+                 digest_store: Optional[NewsDigestStore] = None, max_digest_age: Optional[float] = None):
+        """
+        Args:
+            llm: Chat model used for summarization
+            batch_size: Articles per map step in the map-reduce variant
+            max_articles: Articles fetched for the map-reduce variant
+            fetcher_options: Extra keyword arguments for NewsFetcher (e.g. a search client)
+            prompt_token_budget: Input tokens an article prompt may use, defaults to the
+                model's entry in MODEL_PROMPT_BUDGETS
+            incremental: Summarize only the articles that are new since the last digest and
+                merge them into the per-day summaries kept in digest_store
+            digest_store: Store of the incremental digest and of the last digest per days
+                option, defaults to the process-wide one
+            max_digest_age: Seconds a stored digest is served for instead of generating a new
+                one, or None to always generate
+        """
         self.llm = llm
+        self.batch_size = batch_size
+        self.max_articles = max_articles
+        self.fetcher_options = fetcher_options or {}
+        self.incremental = incremental
+        self.max_digest_age = max_digest_age
+        self.digest_store = digest_store or (get_default_news_digest_store()
+                                             if incremental or max_digest_age else None)
         self.logger = logging.getLogger(__name__)
+        
+        # Behind the router a prompt may go to any of its models, so size it for the smallest
+        names = model_names(llm)
+        self.prompt_token_budget = prompt_budget(names, prompt_token_budget)
+        self.token_counter = TokenCounter(min(names, key=lambda name: MODEL_PROMPT_BUDGETS.get(name, float('inf'))))
     
-    def _create_summarization_prompt(self, articles: list, time_period: str) -> str:
+    def _response_format(self, time_period: str) -> str:
         """
-        Create a comprehensive prompt for news summarization
+        Six-section markdown layout shared by the single-call and map-reduce prompts
         """
-        articles_text = ""
-        for i, article in enumerate(articles[:15], 1):  # Limit to top 15 articles
-            articles_text += f"""
+        return f"""**FORMAT YOUR RESPONSE AS:**
+
+# 📰 AI & Tech News Summary ({time_period})
+
+## 🚀 Major AI Developments
+[Key developments in AI technology, model releases, etc.]
+
+## 🔬 Research & Innovation  
+[New research papers, breakthroughs, technical innovations]
+
+## 💼 Business & Funding
+[Company news, funding rounds, acquisitions, partnerships]
+
+## 🛠️ Tools & Applications
+[New AI tools, applications, product launches]
+
+## 🌟 Notable Mentions
+[Other interesting developments worth noting]
+
+## 📊 Market Trends
+[Industry trends, adoption patterns, market analysis]
+"""
+    
+    def _render_article(self, i: int, article: Dict[str, Any]) -> str:
+        return f"""
 Article {i}:
 Title: {article.get('title', 'N/A')}
 Content: {article.get('content', 'N/A')}
@@ -27,7 +100,21 @@ URL: {article.get('url', 'N/A')}
 Published: {article.get('published_date', 'N/A')}
 ---
 """
-        
+    
+    def _pack_articles(self, articles: list, prompt_template: str, budget: Optional[int]) -> str:
+        """
+        Fill prompt_template's {articles_text} slot with as many of the best
+        articles as fit the token budget, compressing them where needed
+        """
+        packer = PromptPacker(self.token_counter, budget or self.prompt_token_budget)
+        _, articles_text = packer.pack(articles, self._render_article,
+                                       overhead=prompt_template.replace("{articles_text}", ""))
+        return prompt_template.replace("{articles_text}", articles_text)
+    
+    def _create_summarization_prompt(self, articles: list, time_period: str, budget: Optional[int] = None) -> str:
+        """
+        Create a comprehensive prompt for news summarization, packed to the model's token budget
+        """
         prompt = f"""
 You are an expert AI/ML/Tech news analyst. Please provide a comprehensive summary of the latest AI, Machine Learning, and Technology news from the past {time_period}.
 
@@ -41,34 +128,688 @@ You are an expert AI/ML/Tech news analyst. Please provide a comprehensive summar
 7. **Use bullet points and clear headings for readability**
 8. **Include relevant URLs for the most important stories**
 
-**FORMAT YOUR RESPONSE AS:**
+{self._response_format(time_period)}
+**NEWS ARTICLES TO ANALYZE:**
+{{articles_text}}
 
-# 📰 AI & Tech News Summary ({time_period})
+Please provide a comprehensive yet concise summary that would be valuable for someone wanting to stay updated on the latest AI/ML/Tech developments.
+"""
+        return self._pack_articles(articles, prompt, budget)
+    
+    def _create_batch_prompt(self, articles: list, time_period: str, budget: Optional[int] = None) -> str:
+        """
+        Create the map-step prompt that condenses one batch of articles
+        """
+        return self._pack_articles(articles, f"""
+You are an expert AI/ML/Tech news analyst. Below is one batch of AI, Machine Learning, and Technology news articles from the past {time_period}.
 
-## 🚀 Major AI Developments
-[Key developments in AI technology, model releases, etc.]
+Extract the noteworthy developments as short bullet points, grouped under these headings:
+Major AI Developments, Research & Innovation, Business & Funding, Tools & Applications, Notable Mentions, Market Trends.
+Omit headings with nothing to report. Keep each bullet to one or two sentences and include the URL of each story you mention.
 
-## 🔬 Research & Innovation  
-[New research papers, breakthroughs, technical innovations]
+**NEWS ARTICLES:**
+{{articles_text}}
+""", budget)
+    
+    def _compress_notes(self, notes: str, max_chars: int) -> str:
+        """
+        Shorten one batch's notes to max_chars: every bullet to its lead first,
+        then the last bullets are dropped
+        """
+        if len(notes) <= max_chars:
+            return notes
+        lines = [lead_text(line, 240) for line in notes.splitlines() if line.strip()]
+        kept, length = [], 0
+        for line in lines:
+            if length + len(line) + 1 > max_chars:
+                break
+            kept.append(line)
+            length += len(line) + 1
+        return "\n".join(kept) or lead_text(notes, max_chars)
+    
+    def _fill_notes(self, prompt: str, blocks: List[Tuple[str, str]], budget: Optional[int]) -> str:
+        """
+        Fill prompt's {notes_text} slot with the labelled blocks of notes, each
+        compressed to an equal share of the token budget
+        """
+        budget = budget or self.prompt_token_budget
+        render = lambda max_chars: prompt.replace("{notes_text}", "".join(f"""
+{label}:
+{self._compress_notes(notes, max_chars)}
+---
+""" for label, notes in blocks))
+        
+        remaining = budget - self.token_counter.count(prompt.replace("{notes_text}", ""))
+        max_chars = max(1, int(remaining / max(1, len(blocks)) * self.token_counter.chars_per_token))
+        text = render(max_chars)
+        # The share is estimated in characters, so shrink it until the prompt is within budget
+        while self.token_counter.count(text) > budget and max_chars > 100:
+            max_chars = int(max_chars * 0.8)
+            text = render(max_chars)
+        return text
+    
+    def _create_reduce_prompt(self, partial_summaries: List[Dict[str, Any]], time_period: str, article_count: int,
+                              budget: Optional[int] = None) -> str:
+        """
+        Create the reduce-step prompt that merges batch summaries into the final
+        digest, packed to the token budget
+        """
+        return self._fill_notes(f"""
+You are an expert AI/ML/Tech news analyst. The notes below were extracted from {article_count} AI, Machine Learning, and Technology news articles from the past {time_period}, one batch at a time.
 
-## 💼 Business & Funding
-[Company news, funding rounds, acquisitions, partnerships]
+**INSTRUCTIONS:**
+1. **Merge the notes into one structured summary**, combining items that describe the same story
+2. **Prioritise the most significant developments** and drop minor repeats
+3. **Keep the URLs** for the most important stories
+4. **Use bullet points and clear headings for readability**
 
-## 🛠️ Tools & Applications
-[New AI tools, applications, product launches]
+{self._response_format(time_period)}
+**BATCH NOTES TO MERGE:**
+{{notes_text}}
 
-## 🌟 Notable Mentions
-[Other interesting developments worth noting]
+Please provide a comprehensive yet concise summary that would be valuable for someone wanting to stay updated on the latest AI/ML/Tech developments.
+""", [(f"Batch {i}", partial['summary']) for i, partial in enumerate(partial_summaries, 1)], budget)
+    
+    def _create_merge_prompt(self, digest: str, new_partials: List[Dict[str, Any]], time_period: str,
+                             budget: Optional[int] = None) -> str:
+        """
+        Create the incremental merge prompt: the stored digest of the window
+        plus the notes of the articles summarized since, packed to the token budget
+        """
+        blocks = [("Current digest", digest)] if digest else []
+        blocks += [(f"New notes ({partial['day']})", partial['summary']) for partial in new_partials]
+        return self._fill_notes(f"""
+You are an expert AI/ML/Tech news analyst keeping a digest of the AI, Machine Learning, and Technology news from the past {time_period} up to date. Below is the current digest, followed by notes on the articles published since, by day.
 
-## 📊 Market Trends
-[Industry trends, adoption patterns, market analysis]
+**INSTRUCTIONS:**
+1. **Add the new stories to the digest** under the heading that fits them best, combining items that describe the same story
+2. **Keep the most significant developments**, newest first, with at most {self.MAX_SECTION_BULLETS} bullets per heading
+3. **Keep the URLs** of the stories
+4. **Use the headings below and omit a heading with nothing to report**
 
-**NEWS ARTICLES TO ANALYZE:**
-{articles_text}
+{self._response_format(time_period)}
+**CURRENT DIGEST AND NEW NOTES:**
+{{notes_text}}
+""", blocks, budget)
+    
+    def _invoke_packed(self, llm, build_prompt):
+        """
+        Invoke llm on build_prompt(budget). A prompt rejected as too long is
+        rebuilt once at half the token budget, e.g. when the model's context or
+        its per-minute token limit is smaller than configured.
+        """
+        try:
+            return llm.invoke([HumanMessage(content=build_prompt(None))])
+        except Exception as e:
+            if not is_context_overflow(e):
+                raise
+            self.logger.warning(f"Prompt too long for the model, retrying at half the token budget: {str(e)}")
+            return llm.invoke([HumanMessage(content=build_prompt(self.prompt_token_budget // 2))])
+    
+    async def _ainvoke_packed(self, llm, build_prompt):
+        """
+        Async variant of _invoke_packed
+        """
+        try:
+            return await llm.ainvoke([HumanMessage(content=build_prompt(None))])
+        except Exception as e:
+            if not is_context_overflow(e):
+                raise
+            self.logger.warning(f"Prompt too long for the model, retrying at half the token budget: {str(e)}")
+            return await llm.ainvoke([HumanMessage(content=build_prompt(self.prompt_token_budget // 2))])
+    
+    def _create_footer(self, article_count: int, days_selection: str, fetched_at: str, selected_llm: str) -> str:
+        """
+        Create the metadata footer appended to every summary
+        """
+        return f"""
 
-Please provide a comprehensive yet concise summary that would be valuable for someone wanting to stay updated on the latest AI/ML/Tech developments.
+---
+**📊 Summary Statistics:**
+- **Total Articles Analyzed:** {article_count}
+- **Time Period:** {days_selection}
+- **Generated At:** {fetched_at[:19].replace('T', ' ')} UTC
+- **Powered By:** Tavily API + {selected_llm} Model
+
+*💡 Stay informed about the latest AI/ML/Tech developments!*
 """
-        return prompt
+    
+    def _check_news_request(self, state: State):
+        """
+        Validate the user controls of a map-reduce run.
+        Returns (user_controls, days_selection, tavily_api_key) and None, or
+        None and the state update to finish with.
+        """
+        user_controls = state.get('user_controls') or {}
+        
+        if not user_controls:
+            error_msg = "❌ No user controls found in state"
+            self.logger.error(error_msg)
+            return None, {"messages": [AIMessage(content=error_msg)]}
+        
+        # Check if generate news summary button was clicked
+        if not user_controls.get('generate_news_summary', False):
+            return None, {}
+        
+        days_selection = user_controls.get('selected_days', '3 days')
+        tavily_api_key = user_controls.get('TAVILY_API_KEY')
+        
+        if not tavily_api_key:
+            error_msg = "❌ TAVILY_API_KEY is required for news summarization"
+            self.logger.error(error_msg)
+            return None, {"messages": [AIMessage(content=error_msg)]}
+        
+        return (user_controls, days_selection, tavily_api_key), None
+    
+    @staticmethod
+    def _format_age(seconds: float) -> str:
+        minutes = int(seconds // 60)
+        if minutes < 1:
+            return "less than a minute"
+        if minutes < 120:
+            return f"{minutes} minute{'s' if minutes != 1 else ''}"
+        return f"{minutes // 60} hours"
+    
+    def _precomputed_update(self, user_controls: Dict[str, Any], days_selection: str) -> Optional[dict]:
+        """
+        Return the state update serving the stored digest of days_selection
+        when it is younger than max_digest_age, or None to generate a new one
+        (no stored digest, a stale one, or a refresh was asked for)
+        """
+        if not self.max_digest_age or user_controls.get('refresh_news_digest'):
+            return None
+        digest = self.digest_store.get_digest(days_selection)
+        if digest is None:
+            return None
+        age = time.time() - digest['created_at']
+        if age > self.max_digest_age:
+            self.logger.info(f"Stored {days_selection} digest is {age:.0f}s old, generating a new one")
+            return None
+        self.logger.info(f"Serving the precomputed {days_selection} digest ({age:.0f}s old)")
+        return {"messages": [
+            AIMessage(content=f"🕒 Precomputed digest from {self._format_age(age)} ago "
+                              f"({digest['article_count']} articles), refreshed in the background"),
+            AIMessage(content=digest['content'])]}
+    
+    def _save_digest(self, time_period: str, content: str, article_count: int) -> None:
+        """
+        Keep the finished digest for its days option so it can be served precomputed
+        """
+        if self.digest_store is None:
+            return
+        try:
+            self.digest_store.save_digest(time_period, content, article_count)
+        except Exception as e:
+            self.logger.warning(f"Could not store the {time_period} digest: {str(e)}")
+    
+    def _progress_message(self, days_selection: str) -> str:
+        return f"🔍 Fetching AI/ML/Tech news for the past {days_selection}... This may take a moment."
+    
+    def _fetched_articles_update(self, news_data: Dict[str, Any], user_controls: Dict[str, Any],
+                                 days_selection: str) -> dict:
+        """
+        Build the state update that hands the fetched articles to the map step
+        """
+        progress_msg = self._progress_message(days_selection)
+        if not news_data['summary_ready']:
+            error_msg = f"❌ Unable to fetch news articles for the past {days_selection}. Please check your API key and try again."
+            self.logger.error(error_msg)
+            return {"messages": [AIMessage(content=progress_msg), AIMessage(content=error_msg)]}
+        
+        articles = news_data['articles']
+        batch_count = len(self._split_batches(articles))
+        self.logger.info(f"Fetched {len(articles)} articles for summarization in {batch_count} batches")
+        
+        summary_progress_msg = f"🤖 Analyzing {len(articles)} articles in {batch_count} parallel batches and generating comprehensive summary..."
+        return {
+            "messages": [AIMessage(content=progress_msg), AIMessage(content=summary_progress_msg)],
+            "news_articles": articles,
+            "news_metadata": {
+                'time_period': days_selection,
+                'fetched_at': news_data['fetched_at'],
+                'selected_llm': user_controls.get('selected_llm', 'AI')
+            }
+        }
+    
+    def _fetch_error_update(self, days_selection: str, error: Exception) -> dict:
+        error_msg = f"❌ Error in news summarization: {str(error)}"
+        self.logger.error(error_msg)
+        return {"messages": [AIMessage(content=self._progress_message(days_selection)), AIMessage(content=error_msg)]}
+    
+    def fetch_articles(self, state: State) -> dict:
+        """
+        Map-reduce variant, step 1: validate the controls and fetch the articles
+        """
+        self.logger.info("Starting map-reduce news summarization")
+        request, update = self._check_news_request(state)
+        if request is None:
+            return update
+        user_controls, days_selection, tavily_api_key = request
+        precomputed = self._precomputed_update(user_controls, days_selection)
+        if precomputed is not None:
+            return precomputed
+        
+        try:
+            news_fetcher = NewsFetcher(api_key=tavily_api_key, **self.fetcher_options)
+            news_data = news_fetcher.get_news_summary_data(days_selection, max_results=self.max_articles)
+        except Exception as e:
+            return self._fetch_error_update(days_selection, e)
+        return self._fetched_articles_update(news_data, user_controls, days_selection)
+    
+    async def afetch_articles(self, state: State) -> dict:
+        """
+        Async variant of fetch_articles, querying Tavily from the event loop
+        """
+        self.logger.info("Starting map-reduce news summarization")
+        request, update = self._check_news_request(state)
+        if request is None:
+            return update
+        user_controls, days_selection, tavily_api_key = request
+        precomputed = await asyncio.to_thread(self._precomputed_update, user_controls, days_selection)
+        if precomputed is not None:
+            return precomputed
+        
+        try:
+            news_fetcher = NewsFetcher(api_key=tavily_api_key, **self.fetcher_options)
+            news_data = await news_fetcher.aget_news_summary_data(days_selection, max_results=self.max_articles)
+        except Exception as e:
+            return self._fetch_error_update(days_selection, e)
+        return self._fetched_articles_update(news_data, user_controls, days_selection)
+    
+    def _split_batches(self, articles: list) -> List[list]:
+        """
+        Split the articles into consecutive batches of batch_size
+        """
+        return [articles[i:i + self.batch_size] for i in range(0, len(articles), self.batch_size)]
+    
+    def route_batches(self, state: State):
+        """
+        Map-reduce variant, fan-out: send each batch to its own summarization step.
+        A set that fits in one batch goes straight to the final summary.
+        """
+        articles = state.get('news_articles') or []
+        if not articles:
+            return END
+        if len(articles) <= self.batch_size:
+            return "ReduceSummaries"
+        
+        time_period = (state.get('news_metadata') or {}).get('time_period', '')
+        return [
+            Send("SummarizeBatch", {"batch": batch, "batch_index": index, "time_period": time_period})
+            for index, batch in enumerate(self._split_batches(articles))
+        ]
+    
+    def _batch_prompt_builder(self, state: NewsBatchState):
+        return lambda budget: self._create_batch_prompt(state['batch'], state['time_period'], budget)
+    
+    def _batch_update(self, state: NewsBatchState, llm_response) -> dict:
+        summary = llm_response.content if hasattr(llm_response, 'content') else str(llm_response)
+        partial = {"index": state['batch_index'], "summary": summary, "article_count": len(state['batch'])}
+        if state.get('day'):
+            # Incremental runs record which articles each day's notes cover
+            partial.update(day=state['day'], articles=[
+                {key: article.get(key, '') for key in ('title', 'url', 'published_date')}
+                for article in state['batch']])
+        return {"partial_summaries": [partial]}
+    
+    def summarize_batch(self, state: NewsBatchState) -> dict:
+        """
+        Map-reduce variant, map step: condense one batch of articles into notes
+        """
+        try:
+            # Batch notes are intermediate output, keep their tokens out of the chat stream
+            llm_response = self._invoke_packed(self.llm.with_config(tags=[TAG_NOSTREAM]),
+                                               self._batch_prompt_builder(state))
+            return self._batch_update(state, llm_response)
+        except Exception as e:
+            self.logger.warning(f"Error summarizing news batch {state['batch_index']}: {str(e)}")
+            return {"partial_summaries": []}
+    
+    async def asummarize_batch(self, state: NewsBatchState) -> dict:
+        """
+        Async variant of summarize_batch
+        """
+        try:
+            llm_response = await self._ainvoke_packed(self.llm.with_config(tags=[TAG_NOSTREAM]),
+                                                      self._batch_prompt_builder(state))
+            return self._batch_update(state, llm_response)
+        except Exception as e:
+            self.logger.warning(f"Error summarizing news batch {state['batch_index']}: {str(e)}")
+            return {"partial_summaries": []}
+    
+    def _reduce_prompt(self, state: State):
+        """
+        Build the reduce step prompt. Returns a function of the token budget
+        that builds the prompt and None, or None and the error update when
+        every batch failed.
+        """
+        articles = state.get('news_articles') or []
+        days_selection = (state.get('news_metadata') or {}).get('time_period', '')
+        partial_summaries = sorted(state.get('partial_summaries') or [], key=lambda p: p['index'])
+        
+        if partial_summaries:
+            return lambda budget: self._create_reduce_prompt(partial_summaries, days_selection, len(articles),
+                                                              budget), None
+        if len(articles) <= self.batch_size:
+            return lambda budget: self._create_summarization_prompt(articles, days_selection, budget), None
+        
+        error_msg = "❌ Error generating summary with LLM: every article batch failed to summarize"
+        self.logger.error(error_msg)
+        return None, {"messages": [AIMessage(content=error_msg)]}
+    
+    def _reduce_update(self, state: State, llm_response) -> dict:
+        articles = state.get('news_articles') or []
+        metadata = state.get('news_metadata') or {}
+        summary_content = llm_response.content if hasattr(llm_response, 'content') else str(llm_response)
+        footer = self._create_footer(len(articles), metadata.get('time_period', ''), metadata.get('fetched_at', ''),
+                                     metadata.get('selected_llm', 'AI'))
+        self._save_digest(metadata.get('time_period', ''), summary_content + footer, len(articles))
+        self.logger.info("News summarization completed successfully")
+        return {"messages": [AIMessage(content=summary_content + footer)]}
+    
+    def _llm_error_update(self, error: Exception) -> dict:
+        error_msg = f"❌ Error generating summary with LLM: {str(error)}"
+        self.logger.error(error_msg)
+        return {"messages": [AIMessage(content=error_msg)]}
+    
+    def reduce_summaries(self, state: State) -> dict:
+        """
+        Map-reduce variant, reduce step: merge the batch notes (or summarize a
+        single-batch article set directly) into the six-section digest
+        """
+        prompt, update = self._reduce_prompt(state)
+        if prompt is None:
+            return update
+        try:
+            return self._reduce_update(state, self._invoke_packed(self.llm, prompt))
+        except Exception as llm_error:
+            return self._llm_error_update(llm_error)
+    
+    async def areduce_summaries(self, state: State) -> dict:
+        """
+        Async variant of reduce_summaries
+        """
+        prompt, update = self._reduce_prompt(state)
+        if prompt is None:
+            return update
+        try:
+            llm_response = await self._ainvoke_packed(self.llm, prompt)
+            # Storing the digest touches local disk, so it runs off the event loop
+            return await asyncio.to_thread(self._reduce_update, state, llm_response)
+        except Exception as llm_error:
+            return self._llm_error_update(llm_error)
+    
+    @property
+    def max_batches(self) -> int:
+        """
+        Upper bound on the batches one run fans out to
+        """
+        batches = -(-self.max_articles // self.batch_size)
+        # Incremental batches never span two publication days
+        return batches + self.MAX_WINDOW_DAYS if self.incremental else batches
+    
+    def _day_batches(self, articles: list) -> List[Tuple[str, list]]:
+        """
+        Group articles by publication day, newest first, and split each day into batches
+        """
+        by_day: Dict[str, list] = {}
+        for article in articles:
+            by_day.setdefault(article_day(article), []).append(article)
+        return [(day, batch) for day in sorted(by_day, reverse=True) for batch in self._split_batches(by_day[day])]
+    
+    def _new_articles_update(self, news_data: Dict[str, Any], user_controls: Dict[str, Any],
+                             days_selection: str) -> dict:
+        """
+        Build the state update that hands the new articles of an incremental
+        fetch to the map step
+        """
+        articles = news_data['articles']
+        if articles:
+            batch_count = len(self._day_batches(articles))
+            status_msg = (f"🗂️ {len(articles)} new articles since the last digest, summarizing them in "
+                          f"{batch_count} batches and merging them into the stored summary...")
+        else:
+            status_msg = "🗂️ No new articles since the last digest, reusing the stored summary..."
+        self.logger.info(f"Incremental digest: {len(articles)} new articles to summarize")
+        return {
+            "messages": [AIMessage(content=self._progress_message(days_selection)), AIMessage(content=status_msg)],
+            "news_articles": articles,
+            "news_metadata": {
+                'time_period': days_selection,
+                'fetched_at': news_data['fetched_at'],
+                'selected_llm': user_controls.get('selected_llm', 'AI'),
+                'incremental': news_data['incremental']
+            }
+        }
+    
+    def fetch_new_articles(self, state: State) -> dict:
+        """
+        Incremental variant, step 1: validate the controls and fetch the
+        articles that are newer than the digest store's watermark
+        """
+        self.logger.info("Starting incremental news summarization")
+        request, update = self._check_news_request(state)
+        if request is None:
+            return update
+        user_controls, days_selection, tavily_api_key = request
+        precomputed = self._precomputed_update(user_controls, days_selection)
+        if precomputed is not None:
+            return precomputed
+        
+        try:
+            news_fetcher = NewsFetcher(api_key=tavily_api_key, **self.fetcher_options)
+            news_data = news_fetcher.get_incremental_news_data(days_selection, self.digest_store,
+                                                               max_results=self.max_articles)
+        except Exception as e:
+            return self._fetch_error_update(days_selection, e)
+        return self._new_articles_update(news_data, user_controls, days_selection)
+    
+    async def afetch_new_articles(self, state: State) -> dict:
+        """
+        Async variant of fetch_new_articles
+        """
+        self.logger.info("Starting incremental news summarization")
+        request, update = self._check_news_request(state)
+        if request is None:
+            return update
+        user_controls, days_selection, tavily_api_key = request
+        precomputed = await asyncio.to_thread(self._precomputed_update, user_controls, days_selection)
+        if precomputed is not None:
+            return precomputed
+        
+        try:
+            news_fetcher = NewsFetcher(api_key=tavily_api_key, **self.fetcher_options)
+            news_data = await news_fetcher.aget_incremental_news_data(days_selection, self.digest_store,
+                                                                      max_results=self.max_articles)
+        except Exception as e:
+            return self._fetch_error_update(days_selection, e)
+        return self._new_articles_update(news_data, user_controls, days_selection)
+    
+    def route_day_batches(self, state: State):
+        """
+        Incremental variant, fan-out: send each day's new articles to their own
+        summarization steps, or go straight to the merge when nothing is new
+        """
+        metadata = state.get('news_metadata') or {}
+        if not metadata.get('incremental'):
+            return END
+        articles = state.get('news_articles') or []
+        if not articles:
+            return "MergeDigest"
+        return [
+            Send("SummarizeBatch", {"batch": batch, "batch_index": index, "day": day,
+                                    "time_period": metadata.get('time_period', '')})
+            for index, (day, batch) in enumerate(self._day_batches(articles))
+        ]
+    
+    # Words that place a renamed heading of the batch notes under a digest section
+    SECTION_KEYWORDS = (("Major AI Developments", ("development", "major", "model", "release")),
+                        ("Research & Innovation", ("research", "innovation", "paper", "breakthrough")),
+                        ("Business & Funding", ("business", "funding", "acquisition", "partnership", "investment")),
+                        ("Tools & Applications", ("tool", "application", "product", "launch")),
+                        ("Market Trends", ("market", "trend", "industry", "adoption")),
+                        ("Notable Mentions", ("notable", "mention", "other")))
+    
+    def _section_of_heading(self, heading: str) -> str:
+        heading = heading.lower()
+        for name, keywords in self.SECTION_KEYWORDS:
+            if heading == name.lower() or any(keyword in heading for keyword in keywords):
+                return name
+        return "Notable Mentions"
+    
+    def _parse_sections(self, notes: str) -> Dict[str, List[str]]:
+        """
+        Split batch notes into bullets per digest section. A heading is placed
+        by its words, so a renamed one ("## AI Research Papers") keeps its
+        bullets; text under no or an unknown heading goes to Notable Mentions.
+        """
+        sections: Dict[str, List[str]] = {}
+        current = "Notable Mentions"
+        for line in notes.splitlines():
+            line = line.strip()
+            if not line:
+                continue
+            bullet = re.match(r"^(?:[-*•]|\d+[.)])\s+(.*)$", line)
+            if not bullet and (line.startswith('#') or re.fullmatch(r"\*\*[^*]+\*\*:?|[^.!?]{1,60}:", line)):
+                current = self._section_of_heading(re.sub(r"[^a-z& ]", "", line.lower()).strip())
+                continue
+            # Short lines without a bullet are titles, not notes
+            if not bullet and len(line) < 20:
+                continue
+            sections.setdefault(current, []).append(bullet.group(1).strip() if bullet else line)
+        return sections
+    
+    def _render_digest(self, partials: List[Dict[str, Any]], time_period: str) -> str:
+        """
+        Merge the per-day partial summaries, newest day first, into the
+        six-section digest. A story already listed (same URL or text) is not
+        repeated, and each section keeps its MAX_SECTION_BULLETS newest bullets.
+        """
+        lines = [f"# 📰 AI & Tech News Summary ({time_period})"]
+        seen = set()
+        for emoji, name in self.DIGEST_SECTIONS:
+            bullets = []
+            for partial in partials:
+                for bullet in partial['sections'].get(name, []):
+                    url = re.search(r"https?://[^\s)\]>]+", bullet)
+                    key = url.group(0).rstrip('.,') if url else re.sub(r"\W+", " ", bullet.lower()).strip()
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                    bullets.append(bullet)
+            if bullets:
+                lines += ["", f"## {emoji} {name}"] + [f"- {bullet}" for bullet in bullets[:self.MAX_SECTION_BULLETS]]
+        return "\n".join(lines)
+    
+    def _prepare_merge(self, state: State):
+        """
+        Merge the new notes into the stored per-day summaries. Returns the
+        merge to finish and None, or None and the state update to finish with.
+        The watermark only advances when every batch was summarized, so failed
+        days are fetched again next time.
+        """
+        metadata = state.get('news_metadata') or {}
+        plan = metadata.get('incremental') or {}
+        time_period = metadata.get('time_period', '')
+        articles = state.get('news_articles') or []
+        partial_summaries = sorted(state.get('partial_summaries') or [], key=lambda p: p['index'])
+        store = self.digest_store
+        window_start = plan.get('window_start', '')
+        
+        stored = store.partials(window_start)
+        for partial in partial_summaries:
+            store.merge_partial(partial['day'], self._parse_sections(partial['summary']), partial['articles'])
+        if plan.get('fetched_count') and len(partial_summaries) == len(self._day_batches(articles)):
+            store.set_watermark(plan['watermark'], plan['covered_since'])
+        
+        partials = store.partials(window_start)
+        if not partials:
+            error_msg = (f"❌ Unable to fetch news articles for the past {time_period}. "
+                         "Please check your API key and try again.")
+            self.logger.error(error_msg)
+            return None, {"messages": [AIMessage(content=error_msg)]}
+        
+        if not partial_summaries:
+            # Nothing new: today's digest of this window is still current
+            digest = store.get_digest(time_period)
+            today = datetime.now(timezone.utc).date()
+            if digest is not None and datetime.fromtimestamp(digest['created_at'], timezone.utc).date() == today:
+                self.logger.info(f"No new articles, reusing today's {time_period} digest")
+                return None, {"messages": [AIMessage(content=digest['content'])]}
+        
+        article_count = sum(partial['article_count'] for partial in partials)
+        return {
+            "time_period": time_period,
+            "article_count": article_count,
+            "new_articles": len(articles),
+            "days": len(partials),
+            "footer": self._create_footer(article_count, time_period, metadata.get('fetched_at', ''),
+                                          metadata.get('selected_llm', 'AI')),
+            # Rendered without the model, used when the merge call fails
+            "fallback": self._render_digest(partials, time_period),
+            "build_prompt": lambda budget: self._create_merge_prompt(
+                self._render_digest(stored, time_period) if stored else "", partial_summaries, time_period, budget),
+        }, None
+    
+    def _finish_merge(self, merge: Dict[str, Any], llm_response) -> dict:
+        content = llm_response.content if llm_response is not None else ""
+        if not isinstance(content, str) or not content.strip():
+            content = merge['fallback']
+        content += merge['footer']
+        self._save_digest(merge['time_period'], content, merge['article_count'])
+        self.digest_store.prune()
+        self.logger.info(f"Incremental digest merged {merge['new_articles']} new articles into {merge['days']} days")
+        return {"messages": [AIMessage(content=content)]}
+    
+    def _merge_error_update(self, error: Exception) -> dict:
+        error_msg = f"❌ Error in news summarization: {str(error)}"
+        self.logger.error(error_msg)
+        return {"messages": [AIMessage(content=error_msg)]}
+    
+    def merge_digest(self, state: State) -> dict:
+        """
+        Incremental variant, reduce step: merge the new notes into the stored
+        per-day summaries, then update the digest of the selected window with
+        one model call over the stored digest and the new notes. When that call
+        fails, the digest is rendered from the per-day summaries instead.
+        """
+        try:
+            merge, update = self._prepare_merge(state)
+        except Exception as e:
+            return self._merge_error_update(e)
+        if merge is None:
+            return update
+        
+        try:
+            llm_response = self._invoke_packed(self.llm, merge['build_prompt'])
+        except Exception as e:
+            self.logger.warning(f"Digest merge call failed, rendering the stored notes instead: {str(e)}")
+            llm_response = None
+        try:
+            return self._finish_merge(merge, llm_response)
+        except Exception as e:
+            return self._merge_error_update(e)
+    
+    async def amerge_digest(self, state: State) -> dict:
+        """
+        Async variant of merge_digest; the store lives on local disk, so it is read and written off the event loop
+        """
+        try:
+            merge, update = await asyncio.to_thread(self._prepare_merge, state)
+        except Exception as e:
+            return self._merge_error_update(e)
+        if merge is None:
+            return update
+        
+        try:
+            llm_response = await self._ainvoke_packed(self.llm, merge['build_prompt'])
+        except Exception as e:
+            self.logger.warning(f"Digest merge call failed, rendering the stored notes instead: {str(e)}")
+            llm_response = None
+        try:
+            return await asyncio.to_thread(self._finish_merge, merge, llm_response)
+        except Exception as e:
+            return self._merge_error_update(e)
     
     def process(self, state: State) -> State:
         """
@@ -112,8 +853,17 @@ Please provide a comprehensive yet concise summary that would be valuable for so
                     state.messages = messages
                 return state
             
+            precomputed = self._precomputed_update(user_controls, days_selection)
+            if precomputed is not None:
+                messages.extend(precomputed["messages"])
+                if isinstance(state, dict):
+                    state['messages'] = messages
+                else:
+                    state.messages = messages
+                return state
+            
             # Initialize news fetcher
-            news_fetcher = NewsFetcher(api_key=tavily_api_key)
+            news_fetcher = NewsFetcher(api_key=tavily_api_key, **self.fetcher_options)
             
             # Show progress message
             progress_msg = f"🔍 Fetching AI/ML/Tech news for the past {days_selection}... This may take a moment."
@@ -144,33 +894,23 @@ Please provide a comprehensive yet concise summary that would be valuable for so
                     state.messages = messages
                 return state
             
-            # Create summarization prompt
-            summarization_prompt = self._create_summarization_prompt(articles, days_selection)
-            
             # Generate summary using LLM
             summary_progress_msg = f"🤖 Analyzing {len(articles)} articles and generating comprehensive summary..."
             messages.append(AIMessage(content=summary_progress_msg))
             
             try:
                 # Invoke LLM for summarization
-                llm_response = self.llm.invoke([HumanMessage(content=summarization_prompt)])
+                llm_response = self._invoke_packed(
+                    self.llm, lambda budget: self._create_summarization_prompt(articles, days_selection, budget))
                 
                 summary_content = llm_response.content if hasattr(llm_response, 'content') else str(llm_response)
                 
                 # Add metadata footer
-                footer = f"""
-
----
-**📊 Summary Statistics:**
-- **Total Articles Analyzed:** {len(articles)}
-- **Time Period:** {days_selection}
-- **Generated At:** {news_data['fetched_at'][:19].replace('T', ' ')} UTC
-- **Powered By:** Tavily API + {user_controls.get('selected_llm', 'AI')} Model
-
-*💡 Stay informed about the latest AI/ML/Tech developments!*
-"""
+                footer = self._create_footer(len(articles), days_selection, news_data['fetched_at'],
+                                             user_controls.get('selected_llm', 'AI'))
                 
                 final_summary = summary_content + footer
+                self._save_digest(days_selection, final_summary, len(articles))
                 
                 # Add the final summary to messages
                 messages.append(AIMessage(content=final_summary))
@@ -199,3 +939,61 @@ Please provide a comprehensive yet concise summary that would be valuable for so
             state.messages = messages
             
         return state
+    
+    async def aprocess(self, state: State) -> dict:
+        """
+        Async variant of process for the single-call graph. It returns only the
+        new messages, which the messages reducer appends like process's result.
+        """
+        self.logger.info("Starting news summarization process")
+        user_controls = state.get('user_controls') or {}
+        if not user_controls:
+            error_msg = "❌ No user controls found in state"
+            self.logger.error(error_msg)
+            return {"messages": [AIMessage(content=error_msg)]}
+        if not user_controls.get('generate_news_summary', False):
+            return {}
+        
+        days_selection = user_controls.get('selected_days', '3 days')
+        tavily_api_key = user_controls.get('TAVILY_API_KEY')
+        if not tavily_api_key:
+            error_msg = "❌ TAVILY_API_KEY is required for news summarization"
+            self.logger.error(error_msg)
+            return {"messages": [AIMessage(content=error_msg)]}
+        
+        precomputed = await asyncio.to_thread(self._precomputed_update, user_controls, days_selection)
+        if precomputed is not None:
+            return precomputed
+        
+        messages = [AIMessage(content=self._progress_message(days_selection))]
+        try:
+            news_fetcher = NewsFetcher(api_key=tavily_api_key, **self.fetcher_options)
+            news_data = await news_fetcher.aget_news_summary_data(days_selection)
+        except Exception as e:
+            error_msg = f"❌ Error in news summarization: {str(e)}"
+            self.logger.error(error_msg)
+            return {"messages": messages + [AIMessage(content=error_msg)]}
+        
+        if not news_data['summary_ready']:
+            error_msg = f"❌ Unable to fetch news articles for the past {days_selection}. Please check your API key and try again."
+            self.logger.error(error_msg)
+            return {"messages": messages + [AIMessage(content=error_msg)]}
+        
+        articles = news_data['articles']
+        self.logger.info(f"Fetched {len(articles)} articles for summarization")
+        messages.append(AIMessage(content=f"🤖 Analyzing {len(articles)} articles and generating comprehensive summary..."))
+        
+        try:
+            llm_response = await self._ainvoke_packed(
+                self.llm, lambda budget: self._create_summarization_prompt(articles, days_selection, budget))
+            summary_content = llm_response.content if hasattr(llm_response, 'content') else str(llm_response)
+            footer = self._create_footer(len(articles), days_selection, news_data['fetched_at'],
+                                         user_controls.get('selected_llm', 'AI'))
+            messages.append(AIMessage(content=summary_content + footer))
+            await asyncio.to_thread(self._save_digest, days_selection, summary_content + footer, len(articles))
+            self.logger.info("News summarization completed successfully")
+        except Exception as llm_error:
+            error_msg = f"❌ Error generating summary with LLM: {str(llm_error)}"
+            self.logger.error(error_msg)
+            messages.append(AIMessage(content=error_msg))
+        return {"messages": messages}
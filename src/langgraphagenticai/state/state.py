@@ -1,4 +1,5 @@
 
+import operator
 from typing_extensions import TypedDict,Annotated,List
 from langgraph.graph.message import add_messages
 from typing import Dict, Any, Optional
@@ -8,4 +9,19 @@ class State(TypedDict):
     Represent the structure of the state used in graph
     """
     messages:Annotated[List,add_messages]
+    # Rolling summary of the turns compacted out of messages
+    history_summary: Optional[str]
     user_controls: Optional[Dict[str, Any]]
+    news_articles: Optional[List[Dict[str, Any]]]
+    news_metadata: Optional[Dict[str, Any]]
+    partial_summaries: Annotated[List[Dict[str, Any]], operator.add]
+
+class NewsBatchState(TypedDict):
+    """
+    Input of one map step of the news summarizer: a batch of articles to summarize
+    and, in incremental runs, the publication day they share
+    """
+    batch: List[Dict[str, Any]]
+    batch_index: int
+    time_period: str
+    day: Optional[str]
@@ -0,0 +1,68 @@
+import json
+import uuid
+from typing import Any, Dict, Optional, Tuple
+
+from langchain_core.callbacks import AsyncCallbackManagerForToolRun, CallbackManagerForToolRun
+from langchain_core.messages import ToolMessage
+from langchain_core.tools import BaseTool
+
+from src.langgraphagenticai.utils.tool_cache import ToolResultCache, get_default_tool_cache
+
+
+class CachedTool(BaseTool):
+    """
+    Wrap a tool so repeated calls with the same normalized arguments are served
+    from a shared ToolResultCache.
+
+    The wrapper has the wrapped tool's name, description and argument schema,
+    so the model sees the same tool. The cache key includes the wrapped tool's
+    own settings (e.g. max_results), and failed calls are not cached.
+    """
+
+    tool: BaseTool
+    cache: Any = None
+    namespace: str = ""
+    response_format: str = "content_and_artifact"
+
+    def __init__(self, tool: BaseTool, cache: Optional[ToolResultCache] = None, **kwargs: Any):
+        super().__init__(tool=tool, cache=cache or get_default_tool_cache(), name=tool.name,
+                         description=tool.description, args_schema=tool.args_schema,
+                         namespace=self._namespace(tool), **kwargs)
+
+    @staticmethod
+    def _namespace(tool: BaseTool) -> str:
+        """
+        Identify the tool and the settings that change its results
+        """
+        settings = {name: getattr(tool, name) for name in type(tool).model_fields
+                    if name not in BaseTool.model_fields and name != "api_wrapper"}
+        return json.dumps([tool.name, settings], sort_keys=True, default=str)
+
+    def _tool_call(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        return {"type": "tool_call", "id": f"cached-{uuid.uuid4().hex}", "name": self.tool.name, "args": arguments}
+
+    def _cacheable(self, result: Tuple[Any, Any, str]) -> bool:
+        content, artifact, status = result
+        # Tavily reports API errors as a normal result with an empty artifact
+        return status != "error" and (self.tool.response_format != "content_and_artifact" or bool(artifact))
+
+    def _run(self, run_manager: Optional[CallbackManagerForToolRun] = None, **kwargs: Any) -> Tuple[Any, Any]:
+        def call():
+            message: ToolMessage = self.tool.invoke(
+                self._tool_call(kwargs), config={"callbacks": run_manager.get_child() if run_manager else None})
+            return message.content, message.artifact, message.status
+
+        content, artifact, _ = self.cache.get_or_compute(ToolResultCache.make_key(self.namespace, kwargs),
+                                                         call, self._cacheable)
+        return content, artifact
+
+    async def _arun(self, run_manager: Optional[AsyncCallbackManagerForToolRun] = None,
+                    **kwargs: Any) -> Tuple[Any, Any]:
+        async def call():
+            message: ToolMessage = await self.tool.ainvoke(
+                self._tool_call(kwargs), config={"callbacks": run_manager.get_child() if run_manager else None})
+            return message.content, message.artifact, message.status
+
+        content, artifact, _ = await self.cache.aget_or_compute(ToolResultCache.make_key(self.namespace, kwargs),
+                                                                call, self._cacheable)
+        return content, artifact
@@ -0,0 +1,158 @@
+import asyncio
+import re
+import threading
+import uuid
+from typing import Any, Dict, List, Optional, Tuple
+import logging
+
+from langchain_core.callbacks import AsyncCallbackManagerForToolRun, CallbackManagerForToolRun
+from langchain_core.messages import ToolMessage
+from langchain_core.tools import BaseTool
+
+from src.langgraphagenticai.utils.article_index import ArticleIndex, get_default_article_index, query_terms
+
+# Questions whose answer changes by the hour; the index can be days old, so they always go to the web
+_TIME_SENSITIVE = re.compile(
+    r"\b(today|tonight|tomorrow|yesterday|now|current|currently|latest|live|breaking|this (morning|week|month)"
+    r"|prices?|stocks?|shares|scores?|weather|forecast|exchange rates?)\b", re.IGNORECASE)
+
+
+def is_time_sensitive(query: str) -> bool:
+    """
+    Tell whether query asks for something that changes by the hour (prices, scores, "today", ...)
+    """
+    return _TIME_SENSITIVE.search(query) is not None
+
+
+def entity_terms(query: str) -> List[str]:
+    """
+    Return the query terms written as names: capitalized, acronyms or containing digits
+    """
+    return query_terms(" ".join(word for word in query.split()
+                                if word[:1].isupper() or any(char.isdigit() for char in word)))
+
+
+class LocalFirstSearchTool(BaseTool):
+    """
+    Wrap a web search tool so each query is first answered from the local
+    ArticleIndex of fetched news articles and past search results.
+
+    The local results are used when enough of them are similar to the query
+    (min_score), together they contain most of its content words
+    (min_coverage) and every name of it, as well as every rare word that the
+    index holds elsewhere (one in fewer than rare_share of the indexed
+    chunks), so "AMD earnings" is not answered from an Nvidia article. Time-sensitive queries ("today", prices, scores, ...)
+    always go to the web. Otherwise the wrapped tool is called and its results
+    are added to the index. The wrapper has the wrapped tool's name,
+    description and argument schema, so the model sees the same tool.
+    """
+
+    tool: BaseTool
+    index: Any = None
+    k: int = 3
+    min_score: float = 0.35
+    min_coverage: float = 0.6
+    rare_share: float = 0.05
+    min_results: int = 1
+    response_format: str = "content_and_artifact"
+
+    def __init__(self, tool: BaseTool, index: Optional[ArticleIndex] = None, **kwargs: Any):
+        super().__init__(tool=tool, index=index or get_default_article_index(), name=tool.name,
+                         description=tool.description, args_schema=tool.args_schema, **kwargs)
+
+    @property
+    def logger(self) -> logging.Logger:
+        return logging.getLogger(__name__)
+
+    def _local_results(self, query: str) -> Tuple[Optional[List[Dict[str, Any]]], List[Dict[str, Any]]]:
+        """
+        Search the index. Returns the results when local recall is good enough
+        (else None), and every result found for use if the web search fails.
+        """
+        results = self.index.search(query, k=self.k)
+        if is_time_sensitive(query):
+            return None, results
+        relevant = [result for result in results if result["score"] >= self.min_score]
+        terms = query_terms(query)
+        found = set(query_terms(" ".join(f"{result['title']} {result['content']}" for result in relevant)))
+        missing = [term for term in terms if term not in found]
+        coverage = 1 - len(missing) / len(terms) if terms else 0.0
+        names = set(entity_terms(query))
+        shares = self.index.term_shares(missing)
+        # A rare word the index has, but not in these results, means they are about something else;
+        # words the index has never seen (often paraphrases) only count against the coverage
+        uncovered = [term for term in missing if term in names or 0 < shares[term] < self.rare_share]
+        if len(relevant) >= self.min_results and coverage >= self.min_coverage and not uncovered:
+            self.logger.info(f"Answered '{query}' from the local index ({len(relevant)} results, "
+                             f"coverage {coverage:.0%})")
+            return relevant, results
+        return None, results
+
+    @staticmethod
+    def _content(results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        # The date lets the model tell how old a locally served article is
+        return [{"title": result["title"], "url": result["url"], "content": result["content"],
+                 "published_date": result.get("published_date", ""), "score": result["score"]}
+                for result in results]
+
+    def _tool_call(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        return {"type": "tool_call", "id": f"local-first-{uuid.uuid4().hex}", "name": self.tool.name,
+                "args": arguments}
+
+    def _web_documents(self, message: ToolMessage) -> List[Dict[str, Any]]:
+        """
+        Return the search results of a successful web search, for the index
+        """
+        artifact = message.artifact
+        if message.status == "error" or not isinstance(artifact, dict):
+            return []
+        return [result for result in artifact.get("results") or [] if result.get("url") and result.get("content")]
+
+    def _index_in_background(self, documents: List[Dict[str, Any]]) -> None:
+        # Indexing is off the answer's critical path
+        if documents:
+            threading.Thread(target=self.index.add_documents, args=(documents, "web"),
+                             name="article-index", daemon=True).start()
+
+    def _fallback(self, error: Exception, results: List[Dict[str, Any]]) -> Tuple[Any, Any]:
+        """
+        Answer with the weaker local results when the web search failed, or re-raise
+        """
+        if not results:
+            raise error
+        self.logger.warning(f"Web search failed, answering from the local index: {str(error)}")
+        return self._content(results), {"source": "local_index", "results": results}
+
+    def _web_result(self, message: ToolMessage, results: List[Dict[str, Any]]) -> Tuple[Any, Any]:
+        documents = self._web_documents(message)
+        # Tavily reports API errors as a normal result with an empty artifact
+        if not documents and not message.artifact and results:
+            return self._fallback(RuntimeError(str(message.content)), results)
+        self._index_in_background(documents)
+        return message.content, message.artifact
+
+    def _run(self, run_manager: Optional[CallbackManagerForToolRun] = None, **kwargs: Any) -> Tuple[Any, Any]:
+        query = str(kwargs.get("query", ""))
+        local, results = self._local_results(query)
+        if local is not None:
+            return self._content(local), {"source": "local_index", "results": local}
+        try:
+            message: ToolMessage = self.tool.invoke(
+                self._tool_call(kwargs), config={"callbacks": run_manager.get_child() if run_manager else None})
+        except Exception as e:
+            return self._fallback(e, results)
+        return self._web_result(message, results)
+
+    async def _arun(self, run_manager: Optional[AsyncCallbackManagerForToolRun] = None,
+                    **kwargs: Any) -> Tuple[Any, Any]:
+        query = str(kwargs.get("query", ""))
+        # Embedding and the index search are CPU work, so they run off the event loop
+        local, results = await asyncio.to_thread(self._local_results, query)
+        if local is not None:
+            return self._content(local), {"source": "local_index", "results": local}
+        try:
+            message: ToolMessage = await self.tool.ainvoke(
+                self._tool_call(kwargs), config={"callbacks": run_manager.get_child() if run_manager else None})
+        except Exception as e:
+            return self._fallback(e, results)
+        return self._web_result(message, results)
@@ -1,15 +1,41 @@
-from langchain_community.tools.tavily_search import TavilySearchResults
-from langgraph.prebuilt import ToolNode
+import os
+from src.langgraphagenticai.tools.tool_executor import ParallelToolExecutor
 
-def get_tools():
+# Name of TavilySearchResults, the tool get_tools returns
+TAVILY_TOOL_NAME="tavily_search_results_json"
+
+def get_tools(cache=True,local_index=None):
     """
-    Return the list of tools to be used in the chatbot
+    Return the list of tools to be used in the chatbot.
+    Unless disabled, search results are shared across sessions through the
+    process-wide tool result cache, and each search is first tried against the
+    local index of fetched articles and past results (ARTICLE_INDEX), calling
+    Tavily only when local recall is too low.
     """
+    # Imported here so graph keys can be built without loading langchain_community or FAISS
+    from langchain_community.tools.tavily_search import TavilySearchResults
+    from src.langgraphagenticai.tools.cached_tool import CachedTool
+    from src.langgraphagenticai.tools.local_first_tool import LocalFirstSearchTool
+    from src.langgraphagenticai.utils.article_index import article_index_enabled
+
     tools=[TavilySearchResults(max_results=2)]
+    if cache:
+        tools=[CachedTool(tool) for tool in tools]
+    if local_index if local_index is not None else article_index_enabled():
+        tools=[LocalFirstSearchTool(tool,min_score=float(os.getenv("ARTICLE_INDEX_MIN_SCORE","0.35")),
+                                    min_coverage=float(os.getenv("ARTICLE_INDEX_MIN_COVERAGE","0.6")))
+               for tool in tools]
     return tools
 
-def create_tool_node(tools):
+def get_tool_names():
+    """
+    Return the names of the tools returned by get_tools without instantiating them
+    """
+    return [TAVILY_TOOL_NAME]
+
+def create_tool_node(tools,timeout=20.0):
     """
-    Create and returns a tool node for the graph
+    Create and returns a tool node for the graph.
+    Tool calls from one AI message run in parallel, each limited to timeout seconds.
     """
-    return ToolNode(tools=tools)
\ No newline at end of file
+    return ParallelToolExecutor(tools,timeout=timeout).as_node()
\ No newline at end of file
@@ -0,0 +1,117 @@
+import asyncio
+import contextvars
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Any, Dict, List, Optional, Sequence
+import logging
+
+from langchain_core.messages import AIMessage, ToolMessage
+from langchain_core.runnables import RunnableConfig, RunnableLambda
+from langchain_core.tools import BaseTool
+
+from src.langgraphagenticai.state.state import State
+
+# Shared by every graph; a call that times out keeps its worker until the tool returns
+_tool_pool = ThreadPoolExecutor(max_workers=32, thread_name_prefix="tool-call")
+
+
+class ParallelToolExecutor:
+    """
+    Graph node that runs every tool call of the last AI message in parallel,
+    each under its own timeout.
+
+    A call that fails or runs past the timeout is answered with an error
+    ToolMessage telling the model to continue with what it has, so one slow
+    search never stalls the turn and the other results are still used. Each
+    ToolMessage carries its duration and outcome in response_metadata.
+    """
+
+    def __init__(self, tools: Sequence[BaseTool], timeout: Optional[float] = 20.0):
+        """
+        Args:
+            tools: Tools the model may call
+            timeout: Seconds each tool call may take, or None for no limit
+        """
+        self.tools_by_name = {tool.name: tool for tool in tools}
+        self.timeout = timeout
+        self.logger = logging.getLogger(__name__)
+
+    def as_node(self) -> RunnableLambda:
+        return RunnableLambda(self.run, afunc=self.arun, name="tools")
+
+    def _tool_calls(self, state: State) -> List[Dict[str, Any]]:
+        messages = state["messages"] if isinstance(state, dict) else state
+        message = messages[-1] if messages else None
+        return list(message.tool_calls) if isinstance(message, AIMessage) else []
+
+    def _unknown_tool(self, tool_call: Dict[str, Any]) -> Optional[ToolMessage]:
+        if tool_call["name"] in self.tools_by_name:
+            return None
+        return self._error_message(tool_call, f"Error: {tool_call['name']} is not a valid tool, "
+                                              f"try one of [{', '.join(self.tools_by_name)}].", 0.0, "invalid")
+
+    def _error_message(self, tool_call: Dict[str, Any], content: str, duration: float, outcome: str) -> ToolMessage:
+        return ToolMessage(content=content, name=tool_call["name"], tool_call_id=tool_call["id"], status="error",
+                           response_metadata={"duration": duration, "outcome": outcome})
+
+    def _timeout_message(self, tool_call: Dict[str, Any]) -> ToolMessage:
+        self.logger.warning(f"Tool call {tool_call['name']} timed out after {self.timeout}s")
+        return self._error_message(tool_call, f"Error: {tool_call['name']} did not respond within {self.timeout:g}s. "
+                                              "Continue with the information already available.",
+                                   self.timeout, "timeout")
+
+    def _failure_message(self, tool_call: Dict[str, Any], error: Exception, duration: float) -> ToolMessage:
+        self.logger.warning(f"Tool call {tool_call['name']} failed: {str(error)}")
+        return self._error_message(tool_call, f"Error: {repr(error)}\n Please fix your mistakes.", duration, "error")
+
+    def _result_message(self, message: Any, tool_call: Dict[str, Any], duration: float) -> ToolMessage:
+        if not isinstance(message, ToolMessage):
+            message = ToolMessage(content=str(message), name=tool_call["name"], tool_call_id=tool_call["id"])
+        message.response_metadata = {**message.response_metadata, "duration": duration,
+                                     "outcome": "error" if message.status == "error" else "success"}
+        return message
+
+    def _call(self, tool_call: Dict[str, Any], config: Optional[RunnableConfig]) -> ToolMessage:
+        start = time.perf_counter()
+        try:
+            result = self.tools_by_name[tool_call["name"]].invoke({**tool_call, "type": "tool_call"}, config)
+        except Exception as e:
+            return self._failure_message(tool_call, e, time.perf_counter() - start)
+        return self._result_message(result, tool_call, time.perf_counter() - start)
+
+    async def _acall(self, tool_call: Dict[str, Any], config: Optional[RunnableConfig]) -> ToolMessage:
+        start = time.perf_counter()
+        try:
+            result = await asyncio.wait_for(
+                self.tools_by_name[tool_call["name"]].ainvoke({**tool_call, "type": "tool_call"}, config),
+                self.timeout)
+        except asyncio.TimeoutError:
+            return self._timeout_message(tool_call)
+        except Exception as e:
+            return self._failure_message(tool_call, e, time.perf_counter() - start)
+        return self._result_message(result, tool_call, time.perf_counter() - start)
+
+    def run(self, state: State, config: RunnableConfig) -> dict:
+        """
+        Run the pending tool calls on the shared worker pool
+        """
+        tool_calls = self._tool_calls(state)
+        results: List[Optional[ToolMessage]] = [self._unknown_tool(call) for call in tool_calls]
+        futures = {
+            # Each call gets its own copy of the context so callbacks and streaming keep working
+            _tool_pool.submit(contextvars.copy_context().run, self._call, call, config): index
+            for index, call in enumerate(tool_calls) if results[index] is None
+        }
+        done, _ = wait(futures, timeout=self.timeout)
+        for future, index in futures.items():
+            results[index] = future.result() if future in done else self._timeout_message(tool_calls[index])
+        return {"messages": results}
+
+    async def arun(self, state: State, config: RunnableConfig) -> dict:
+        """
+        Async variant of run, with the calls gathered on the event loop
+        """
+        async def run_one(tool_call: Dict[str, Any]) -> ToolMessage:
+            return self._unknown_tool(tool_call) or await self._acall(tool_call, config)
+
+        return {"messages": list(await asyncio.gather(*(run_one(call) for call in self._tool_calls(state))))}
@@ -1,68 +1,140 @@
 import streamlit as st
-from langchain_core.messages import HumanMessage, AIMessage, ToolMessage
-import json
+from langchain_core.messages import HumanMessage
+import logging
+import time
+
+from src.langgraphagenticai.ui.streamlitui.transcript import entries_from_messages, render_entry
+from src.langgraphagenticai.utils.messages import chunk_text
+from src.langgraphagenticai.utils.tracing import get_trace_collector
 
 class DisplayResultStreamlit:
-    def __init__(self, usecase, graph, user_message):
+    def __init__(self, usecase, graph, user_message, config=None, trace=None, transcript=None):
         self.usecase = usecase
         self.graph = graph
         self.user_message = user_message
+        self.config = config
+        self.trace = trace or get_trace_collector().start_trace(usecase)
+        # Everything drawn for this turn is also appended here, so later reruns redraw it without the graph
+        self.transcript = transcript
+        self.metrics = {}
+        self.logger = logging.getLogger(__name__)
+
+    def _record(self, entry):
+        if self.transcript is not None:
+            self.transcript.add(entry)
+
+    def _show(self, entry):
+        render_entry(entry)
+        self._record(entry)
 
     def display_result_on_ui(self):
         usecase = self.usecase
-        graph = self.graph
         user_message = self.user_message
         if usecase == "Basic Chatbot":
-            for event in graph.stream({'messages': ("user", user_message)}):
-                print(event.values())
-                for value in event.values():
-                    print(value['messages'])
-                    with st.chat_message("user"):
-                        st.write(user_message)
-                    with st.chat_message("assistant"):
-                        st.write(value["messages"].content)
-       
-       
+            self._show({"kind": "user", "content": user_message})
+            self.stream_to_ui({"messages": [HumanMessage(content=user_message)]})
+
+
         elif usecase=="Chatbot with Web":
-            # Prepare state and invoke the graph
+            # Prepare state and stream the graph
             initial_state = {"messages": [HumanMessage(content=user_message)]}
-            res = graph.invoke(initial_state)
-            for message in res['messages']:
-                if type(message) == HumanMessage:
-                    with st.chat_message("user"):
-                        st.write(message.content)
-                elif type(message)==ToolMessage:
-                    with st.chat_message("ai"):
-                        st.write("Tool Call Start")
-                        st.write(message.content)
-                        st.write("Tool Call End")
-                elif type(message)==AIMessage and message.content:
-                    with st.chat_message("assistant"):
-                        st.write(message.content)
-        
+            self._show({"kind": "user", "content": user_message})
+            self.stream_to_ui(initial_state)
+
         elif usecase == "AI News Summarizer":
             # Special handling for AI News Summarizer
             # Get user controls from session state to pass to the graph
             user_controls = st.session_state.get('user_controls', {})
-            
-            # Prepare state with user controls and invoke the graph
+
+            # Prepare state with user controls and stream the graph
             initial_state = {
                 "messages": [HumanMessage(content=user_message or "Generate AI News Summary")],
                 "user_controls": user_controls
             }
-            
+
             try:
-                res = graph.invoke(initial_state)
-                
-                # Display messages
-                for message in res['messages']:
-                    if type(message) == HumanMessage:
-                        with st.chat_message("user"):
-                            st.write(message.content)
-                    elif type(message) == AIMessage and message.content:
-                        with st.chat_message("assistant"):
-                            # Use markdown for better formatting of the news summary
-                            st.markdown(message.content)
-                            
+                self._show({"kind": "user", "content": initial_state["messages"][0].content})
+                # Use markdown for better formatting of the news summary
+                self.stream_to_ui(initial_state, use_markdown=True)
+
             except Exception as e:
                 st.error(f"❌ Error generating news summary: {str(e)}")
+
+    def stream_to_ui(self, initial_state, use_markdown=False):
+        """
+        Run the graph and render its output as it is produced.
+        LLM tokens arrive through the "messages" stream mode and are written into
+        the open assistant bubble; node results arrive through "updates" and carry
+        tool calls, tool results and the final content of each message.
+        Time to first token and total time are recorded in self.metrics.
+        With a checkpointed graph only the new message is sent; earlier turns
+        are loaded from the thread's checkpoint.
+        Node, model and tool spans go to self.trace, with the time spent
+        writing to the page recorded as one "render" span.
+        """
+        try:
+            self._stream_to_ui(initial_state, use_markdown)
+        finally:
+            self.trace.finish()
+
+    def _stream_to_ui(self, initial_state, use_markdown):
+        render = st.markdown if use_markdown else st.write
+        start = time.perf_counter()
+        first_token_at = None
+        placeholder = None
+        streamed_text = ""
+        render_time = 0.0
+
+        # Checkpoints are written in the background while the next step runs
+        for mode, payload in self.graph.stream(initial_state, self.trace.with_callbacks(self.config),
+                                               stream_mode=["messages", "updates"], durability="async"):
+            render_start = time.perf_counter()
+            if mode == "messages":
+                chunk, _ = payload
+                text = chunk_text(chunk)
+                if not text:
+                    continue
+                if first_token_at is None:
+                    first_token_at = time.perf_counter()
+                if placeholder is None:
+                    with st.chat_message("assistant"):
+                        placeholder = st.empty()
+                streamed_text += text
+                placeholder.markdown(streamed_text + "▌")
+                render_time += time.perf_counter() - render_start
+                continue
+
+            for node_update in payload.values():
+                messages = (node_update or {}).get("messages", [])
+                if not isinstance(messages, list):
+                    messages = [messages]
+
+                entries = [entry for entry in entries_from_messages(messages, markdown=use_markdown)
+                           if entry["kind"] != "user"]
+                replies = [entry for entry in entries if entry["kind"] == "assistant"]
+                if placeholder is not None and replies:
+                    # Swap the streamed text for the node's final message
+                    with placeholder.container():
+                        render(replies[-1]["content"])
+                    self._record(replies[-1])
+                    entries = [entry for entry in entries if entry["kind"] != "assistant"]
+
+                for entry in entries:
+                    self._show(entry)
+
+                placeholder = None
+                streamed_text = ""
+            render_time += time.perf_counter() - render_start
+
+        total_time = time.perf_counter() - start
+        self.trace.add_span("render", "streamlit", render_time)
+        self.metrics = {
+            "time_to_first_token": first_token_at - start if first_token_at is not None else None,
+            "total_time": total_time,
+        }
+        self.logger.info(f"{self.usecase} turn metrics: {self.metrics}")
+        if first_token_at is not None:
+            self._show({"kind": "caption",
+                        "content": f"⚡ First token in {self.metrics['time_to_first_token']:.2f}s · completed in {total_time:.2f}s"})
+        else:
+            self._show({"kind": "caption", "content": f"⏱️ Completed in {total_time:.2f}s"})
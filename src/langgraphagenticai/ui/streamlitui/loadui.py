@@ -49,6 +49,23 @@ class LoadStreamlitUI:
                ## Validate API key
                if not self.user_control["GEMINI_API_KEY"]:
                    st.warning("Please enter your Google/Gemini API Key")
+
+           if self.user_control['selected_llm']=='Auto':
+               ## Each call goes to the fastest healthy provider that has a key
+               st.caption("Routes each call to the fastest healthy provider and retries slow calls on another one")
+               routed_options = {
+                   'Groq': (self.config.get_groq_model_options(), "GROQ_API_KEY", 'Groq API Key'),
+                   'OpenAI': (self.config.get_openai_model_options(), "OPENAI_API_KEY", 'OpenAI API Key'),
+                   'Gemini': (self.config.get_gemini_model_options(), "GEMINI_API_KEY", 'Google/Gemini API Key'),
+               }
+               self.user_control['routed_models']={}
+               for provider,(model_options,key_name,key_label) in routed_options.items():
+                   self.user_control['routed_models'][provider]=st.selectbox(f"{provider} Model",model_options)
+                   self.user_control[key_name]=st.session_state[key_name]=st.text_input(key_label,type="password")
+               self.user_control['selected_model']='auto'
+               ## Validate API keys
+               if not any(self.user_control[key_name] for _,key_name,_ in routed_options.values()):
+                   st.warning("Please enter at least one API Key")
             ## Usecase selection
            self.user_control['selected_usecase']=st.selectbox("Select Use Case",usecase_options)
 
@@ -58,6 +75,13 @@ class LoadStreamlitUI:
                if not self.user_control["TAVILY_API_KEY"]:
                    st.warning("Please enter your Tavily API Key")
 
+           if self.user_control['selected_usecase'] in ("Basic Chatbot", "Chatbot with Web"):
+               self.user_control['new_conversation'] = st.button(
+                   "🧹 New Conversation",
+                   help="Start a fresh conversation; the current one stays saved under its link",
+                   use_container_width=True
+               )
+
            if self.user_control['selected_usecase'] == "AI News Summarizer":
                os.environ["TAVILY_API_KEY"]=self.user_control["TAVILY_API_KEY"]=st.session_state["TAVILY_API_KEY"]=st.text_input('TAVILY_API_KEY',type="password")
 
@@ -68,19 +92,31 @@ class LoadStreamlitUI:
                st.subheader("📰 News Summary Settings")
                
                # Days selection dropdown
-               days_options = ["3 days", "6 days", "10-15 days"]
+               days_options = self.config.get_news_days_options()
                self.user_control['selected_days'] = st.selectbox(
                    "Select Days", 
                    days_options,
                    help="Choose the time range for news articles"
                )
                
+               # Precomputed digests are served while fresh unless a new one is asked for
+               self.user_control['refresh_news_digest'] = st.checkbox(
+                   "🔄 Skip the precomputed digest",
+                   help="Generate the summary now instead of using the one refreshed in the background"
+               )
+               
                # Generate summary button
                self.user_control['generate_news_summary'] = st.button(
                    "🚀 Generate AI News Summary",
                    help="Click to generate AI/ML/Tech news summary for the selected time period",
                    use_container_width=True
                )
+
+           ## Tracing
+           self.user_control['show_traces'] = st.checkbox(
+               "📊 Show recent turn traces",
+               help="Where the time of the last turns went: graph build, nodes, model and tool calls, rendering"
+           )
             
             
             
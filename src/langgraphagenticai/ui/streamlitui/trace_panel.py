@@ -0,0 +1,42 @@
+import streamlit as st
+from datetime import datetime
+
+from src.langgraphagenticai.utils.tracing import get_trace_collector
+
+class TracePanelStreamlit:
+    """
+    Sidebar panel listing where the time of this conversation's last few
+    turns went, from the spans recorded by the process-wide trace collector
+    """
+    def __init__(self, thread_id, turns=5):
+        self.thread_id = thread_id
+        self.turns = turns
+        self.collector = get_trace_collector()
+        with st.sidebar:
+            self.placeholder = st.empty()
+
+    def display(self):
+        with self.placeholder.container():
+            st.subheader("📊 Recent Turns")
+            traces = self.collector.recent(self.turns, thread_id=self.thread_id)
+            if not traces:
+                st.caption("No turns traced yet")
+                return
+            for trace in traces:
+                summary = trace.summary()
+                by_kind = summary["duration_by_kind"]
+                started = datetime.fromtimestamp(summary["started_at"]).strftime("%H:%M:%S")
+                title = f"{started} · {trace.usecase} · {by_kind.get('graph', 0.0):.2f}s"
+                if summary["errors"]:
+                    title += f" · ⚠️ {summary['errors']}"
+                with st.expander(title):
+                    st.caption(" · ".join(f"{kind} {seconds:.2f}s" for kind, seconds in by_kind.items())
+                               + (f" · {summary['total_tokens']} tokens" if summary["total_tokens"] else ""))
+                    st.dataframe(
+                        [{"kind": span["kind"], "name": span["name"],
+                          "ms": round((span["duration"] or 0.0) * 1000, 1),
+                          "tokens": span.get("total_tokens"),
+                          "status": span["status"] if not span["error"] else f"{span['status']}: {span['error'][:80]}"}
+                         for span in sorted(trace.spans, key=lambda span: span["start"])],
+                        hide_index=True, use_container_width=True
+                    )
@@ -0,0 +1,144 @@
+import json
+import streamlit as st
+from langchain_core.messages import HumanMessage, AIMessage, ToolMessage
+import logging
+
+# Transcripts kept per browser session; older conversations are reloaded from their checkpoint when reopened
+MAX_SESSION_TRANSCRIPTS = 4
+
+
+def tool_result_label(message):
+    """
+    Describe how a tool call ended, with its duration when the executor recorded one
+    """
+    metadata = message.response_metadata or {}
+    duration = metadata.get("duration")
+    took = f" ({duration:.2f}s)" if duration is not None else ""
+    if metadata.get("outcome") == "timeout":
+        return f"⏱️ Tool Call Timed Out{took}"
+    if message.status == "error":
+        return f"⚠️ Tool Call Failed{took}"
+    return f"Tool Call End{took}"
+
+
+def entries_from_messages(messages, markdown=False):
+    """
+    Convert graph messages into transcript entries, in the form the live turn renders them
+    """
+    entries = []
+    for message in messages:
+        if type(message) == HumanMessage:
+            entries.append({"kind": "user", "content": message.content})
+        elif type(message) == AIMessage:
+            if message.content:
+                entries.append({"kind": "assistant", "content": message.content, "markdown": markdown})
+            for tool_call in message.tool_calls:
+                entries.append({"kind": "tool_call", "name": tool_call["name"], "args": tool_call.get("args", {})})
+            if message.response_metadata.get("tool_rounds_exhausted"):
+                entries.append({"kind": "caption",
+                                "content": "🔁 Tool call limit reached, answered with the results gathered so far"})
+        elif type(message) == ToolMessage:
+            entries.append({"kind": "tool_result", "content": message.content, "label": tool_result_label(message)})
+    return entries
+
+
+def render_entry(entry):
+    """
+    Write one transcript entry to the page
+    """
+    kind = entry["kind"]
+    if kind == "user":
+        with st.chat_message("user"):
+            st.write(entry["content"])
+    elif kind == "assistant":
+        with st.chat_message("assistant"):
+            (st.markdown if entry.get("markdown") else st.write)(entry["content"])
+    elif kind == "tool_call":
+        with st.chat_message("ai"):
+            st.write(f"Tool Call Start: `{entry['name']}`")
+            st.code(json.dumps(entry["args"], indent=2), language="json")
+    elif kind == "tool_result":
+        with st.chat_message("ai"):
+            st.write(entry["content"])
+            st.write(entry["label"])
+    elif kind == "caption":
+        st.caption(entry["content"])
+
+
+class Transcript:
+    """
+    Rendered history of one conversation in this browser session.
+
+    Entries are appended as a turn is rendered, so later reruns redraw the
+    history from memory instead of re-running the graph. A conversation that
+    is not in the session yet (page reload, shared link) is loaded once from
+    its checkpoint.
+    """
+    def __init__(self, key):
+        self.key = key
+        self.entries = []
+        self.hydrated = False
+
+    def add(self, entry):
+        self.entries.append(entry)
+
+    def hydrate(self, checkpointer, config):
+        """
+        Load the conversation's messages from its latest checkpoint, once
+        """
+        if self.hydrated:
+            return
+        self.hydrated = True
+        if checkpointer is None or config is None:
+            return
+        try:
+            checkpoint = checkpointer.get_tuple(config)
+        except Exception as e:
+            logging.getLogger(__name__).warning(f"Could not load the transcript of {self.key}: {str(e)}")
+            return
+        if checkpoint is not None:
+            values = checkpoint.checkpoint.get("channel_values", {})
+            entries = entries_from_messages(values.get("messages") or [])
+            if values.get("history_summary"):
+                # Compacted turns are no longer in the checkpoint, only in the summary
+                entries.insert(0, {"kind": "caption", "content": "🗜️ Earlier messages were summarized"})
+            self.entries = entries + self.entries
+
+
+def get_transcript(thread_id, usecase):
+    """
+    Return this session's transcript of the usecase's conversation on thread_id
+    """
+    transcripts = st.session_state.setdefault("transcripts", {})
+    key = f"{thread_id}:{usecase}"
+    transcript = transcripts.pop(key, None) or Transcript(key)
+    # Most recently used last; the oldest beyond the limit are dropped
+    transcripts[key] = transcript
+    while len(transcripts) > MAX_SESSION_TRANSCRIPTS:
+        transcripts.pop(next(iter(transcripts)))
+    return transcript
+
+
+class TranscriptStreamlit:
+    """
+    Draw the latest page_size entries of a transcript, with a button that
+    reveals earlier ones a page at a time, so long chats do not send their
+    whole history to the browser on every rerun
+    """
+    def __init__(self, transcript, page_size=30):
+        self.transcript = transcript
+        self.page_size = page_size
+        self.visible_key = f"transcript_visible:{transcript.key}"
+
+    def _show_more(self):
+        st.session_state[self.visible_key] = st.session_state.get(self.visible_key, self.page_size) + self.page_size
+
+    def display(self):
+        entries = self.transcript.entries
+        visible = st.session_state.get(self.visible_key, self.page_size)
+        hidden = max(0, len(entries) - visible)
+        if hidden:
+            st.button(f"⬆️ Show earlier messages ({hidden} more)", key=f"more:{self.transcript.key}",
+                      on_click=self._show_more)
+        for entry in entries[hidden:]:
+            render_entry(entry)
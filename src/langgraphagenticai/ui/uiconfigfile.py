@@ -1,9 +1,33 @@
+import os
+import threading
 from configparser import ConfigParser
 
+# config file path -> (modification time, parsed ConfigParser)
+_parsed_configs = {}
+_parsed_configs_lock = threading.Lock()
+
+def _read_config(config_file):
+    """
+    Parse config_file once and return the cached parser on later calls,
+    re-reading it only when the file has been modified since
+    """
+    path = os.path.abspath(config_file)
+    try:
+        mtime = os.path.getmtime(path)
+    except OSError:
+        mtime = None
+    with _parsed_configs_lock:
+        cached = _parsed_configs.get(path)
+        if cached is None or cached[0] != mtime:
+            config = ConfigParser()
+            config.read(path)
+            cached = _parsed_configs[path] = (mtime, config)
+        return cached[1]
+
 class Config:
     def __init__(self,config_file='./src/langgraphagenticai/ui/uiconfigfile.ini'):
-        self.config = ConfigParser()
-        self.config.read(config_file)
+        # Streamlit builds a Config on every rerun, so the file is parsed once per process
+        self.config = _read_config(config_file)
         
     def get_llm_options(self):
         llm_options = self.config["DEFAULT"].get("LLM_OPTIONS")
@@ -25,6 +49,10 @@ class Config:
        model_options = self.config["DEFAULT"].get("GEMINI_MODEL_OPTIONS")
        return [opt.strip() for opt in model_options.split(",")] if model_options else []
 
+    def get_news_days_options(self):
+       days_options = self.config["DEFAULT"].get("NEWS_DAYS_OPTIONS")
+       return [opt.strip() for opt in days_options.split(",")] if days_options else []
+
     def get_page_title(self):
         return self.config["DEFAULT"].get("PAGE_TITLE")
     
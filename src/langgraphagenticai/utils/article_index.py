@@ -0,0 +1,334 @@
+import json
+import os
+import re
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+import logging
+
+import faiss
+import numpy as np
+
+from src.langgraphagenticai.utils.embeddings import get_default_embedder
+from src.langgraphagenticai.utils.news_digest_store import article_id
+from src.langgraphagenticai.utils.prompt_packer import clean_text, split_sentences
+
+DEFAULT_INDEX_DIR = os.path.join(".cache", "article_index")
+
+# Saves run off the indexing path, one at a time, and a burst of additions is written once
+_save_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="article-index-save")
+
+_TERM = re.compile(r"[a-z0-9][a-z0-9.+-]*[a-z0-9]|[a-z0-9]")
+_STOPWORDS = frozenset(
+    "a an and are as at be by can did do does for from has have how i in is it its latest me new news of on or "
+    "the this to was were what when where which who why will with about tell today recent".split())
+
+
+def query_terms(text: str) -> List[str]:
+    """
+    Return the distinct content words of a search query
+    """
+    return list(dict.fromkeys(term for term in _TERM.findall(text.lower())
+                              if term not in _STOPWORDS and len(term) > 1))
+
+
+def article_index_enabled() -> bool:
+    """
+    Tell whether fetched articles and search results feed the local index (ARTICLE_INDEX, on by default)
+    """
+    return os.getenv("ARTICLE_INDEX", "1").lower() not in ("0", "false", "no")
+
+
+class ArticleIndex:
+    """
+    Local retrieval index over fetched news articles and past web search results.
+
+    Documents are cleaned, split into sentence-aligned chunks, embedded and
+    stored in a FAISS inner-product index. Chunks expire retention_seconds
+    after they were added, the oldest ones are evicted beyond max_chunks, and
+    the index is persisted to disk in the background so it survives restarts.
+    """
+
+    def __init__(self, index_dir: Optional[str] = DEFAULT_INDEX_DIR, embedder: Any = None,
+                 retention_seconds: float = 7 * 86400, max_chunks: int = 20000, chunk_chars: int = 600):
+        """
+        Args:
+            index_dir: Directory holding the persisted index, or None to keep it in memory only
+            embedder: Object with embed(texts) -> unit vectors, defaults to the process-wide embedder
+            retention_seconds: How long an indexed document stays searchable
+            max_chunks: Chunks kept before the oldest ones are evicted
+            chunk_chars: Target length of one chunk
+        """
+        self.index_dir = index_dir
+        self.embedder = embedder or get_default_embedder()
+        self.retention_seconds = retention_seconds
+        self.max_chunks = max_chunks
+        self.chunk_chars = chunk_chars
+        self.logger = logging.getLogger(__name__)
+
+        self._lock = threading.Lock()
+        # Serializes disk writes; a change made while a save is queued is written by that save
+        self._save_lock = threading.Lock()
+        self._save_pending = False
+        self._index = faiss.IndexIDMap2(faiss.IndexFlatIP(self.embedder.dimensions))
+        # chunk id -> chunk, in insertion order
+        self._chunks: Dict[int, Dict[str, Any]] = {}
+        self._vectors: Dict[int, np.ndarray] = {}
+        self._documents: Dict[str, List[int]] = {}
+        # term -> chunks containing it, to tell rare query terms from common ones
+        self._term_counts: Counter = Counter()
+        self._next_id = 0
+        self._stats = {"searches": 0, "documents_added": 0, "evictions": 0}
+        self._load()
+
+    def chunk(self, text: str) -> List[str]:
+        """
+        Split text into chunks of about chunk_chars, cut at sentence boundaries
+        """
+        chunks, current = [], ""
+        for sentence in split_sentences(text):
+            if current and len(current) + len(sentence) + 1 > self.chunk_chars:
+                chunks.append(current)
+                current = ""
+            current = f"{current} {sentence}" if current else sentence[:self.chunk_chars * 2]
+        if current:
+            chunks.append(current)
+        return chunks
+
+    def add_documents(self, documents: List[Dict[str, Any]], source: str = "news") -> int:
+        """
+        Index documents with title, content, url and optionally published_date.
+        Documents already indexed are kept and their retention is renewed.
+
+        Returns:
+            Number of new documents indexed
+        """
+        now = time.time()
+        pending = []
+        with self._lock:
+            for document in documents:
+                doc_id = article_id(document)
+                if doc_id in self._documents:
+                    for chunk_id in self._documents[doc_id]:
+                        self._chunks[chunk_id]["expires_at"] = now + self.retention_seconds
+                    continue
+                content = clean_text(document.get('content', '')) or (document.get('content') or '')
+                texts = self.chunk(content)
+                if texts:
+                    pending.append((doc_id, document, texts))
+        if not pending:
+            return 0
+
+        # Embed outside the lock so searches are not held up
+        vectors = self.embedder.embed([f"{document.get('title', '')}. {text}"
+                                       for _, document, texts in pending for text in texts])
+        added, row = 0, 0
+        with self._lock:
+            for doc_id, document, texts in pending:
+                if doc_id in self._documents:
+                    row += len(texts)
+                    continue
+                self._documents[doc_id] = []
+                for text in texts:
+                    self._add_chunk(doc_id, {
+                        "doc_id": doc_id, "title": document.get('title', ''), "url": document.get('url', ''),
+                        "published_date": document.get('published_date', ''), "text": text, "source": source,
+                        "expires_at": now + self.retention_seconds}, vectors[row])
+                    row += 1
+                added += 1
+            self._stats["documents_added"] += added
+            self._purge(now)
+            self._evict_oldest()
+            self._schedule_save()
+        self.logger.info(f"Indexed {added} {source} documents ({len(self._chunks)} chunks in the index)")
+        return added
+
+    def search(self, query: str, k: int = 3, candidates: int = 20) -> List[Dict[str, Any]]:
+        """
+        Return up to k documents most similar to query, best first, each as
+        title, url, content (its best matching chunk), published_date, source
+        and score (cosine similarity)
+        """
+        vector = self.embedder.embed([query])
+        now = time.time()
+        with self._lock:
+            self._stats["searches"] += 1
+            if self._index.ntotal == 0:
+                return []
+            scores, ids = self._index.search(vector, min(candidates, self._index.ntotal))
+            results, seen = [], set()
+            for chunk_id, score in zip(ids[0], scores[0]):
+                chunk = self._chunks.get(int(chunk_id))
+                if chunk is None or chunk["expires_at"] <= now or chunk["doc_id"] in seen:
+                    continue
+                seen.add(chunk["doc_id"])
+                results.append({"title": chunk["title"], "url": chunk["url"], "content": chunk["text"],
+                                "published_date": chunk["published_date"], "source": chunk["source"],
+                                "score": round(float(score), 4)})
+                if len(results) >= k:
+                    break
+        return results
+
+    def term_shares(self, terms: List[str]) -> Dict[str, float]:
+        """
+        Return the share of indexed chunks that contain each of terms (0 for unseen terms)
+        """
+        with self._lock:
+            total = len(self._chunks)
+            return {term: self._term_counts[term] / total if total else 0.0 for term in terms}
+
+    def purge_expired(self) -> int:
+        """
+        Drop expired documents and return how many chunks were removed
+        """
+        with self._lock:
+            removed = self._purge(time.time())
+            if removed:
+                self._schedule_save()
+        return removed
+
+    def clear(self) -> None:
+        with self._lock:
+            self._index.reset()
+            self._chunks.clear()
+            self._vectors.clear()
+            self._documents.clear()
+            self._term_counts.clear()
+            self._schedule_save()
+
+    def flush(self) -> None:
+        """
+        Write the index to disk now, e.g. before shutting down
+        """
+        self._save()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self._stats)
+            stats["documents"] = len(self._documents)
+            stats["chunks"] = len(self._chunks)
+        return stats
+
+    def _add_chunk(self, doc_id: str, chunk: Dict[str, Any], vector: np.ndarray) -> None:
+        chunk_id = self._next_id
+        self._next_id += 1
+        self._index.add_with_ids(vector.reshape(1, -1).astype(np.float32), np.array([chunk_id], dtype=np.int64))
+        self._chunks[chunk_id] = chunk
+        self._vectors[chunk_id] = vector
+        self._documents.setdefault(doc_id, []).append(chunk_id)
+        self._term_counts.update(self._chunk_terms(chunk))
+
+    @staticmethod
+    def _chunk_terms(chunk: Dict[str, Any]) -> List[str]:
+        return query_terms(f"{chunk['title']} {chunk['text']}")
+
+    def _remove_documents(self, doc_ids) -> int:
+        # remove_ids scans the whole FAISS index, so it is called once for all the documents
+        chunk_ids = []
+        for doc_id in doc_ids:
+            chunk_ids.extend(self._documents.pop(doc_id, []))
+        for chunk_id in chunk_ids:
+            chunk = self._chunks.pop(chunk_id, None)
+            self._vectors.pop(chunk_id, None)
+            if chunk is not None:
+                self._term_counts.subtract(self._chunk_terms(chunk))
+        if chunk_ids:
+            self._index.remove_ids(np.array(chunk_ids, dtype=np.int64))
+        self._stats["evictions"] += len(chunk_ids)
+        return len(chunk_ids)
+
+    def _purge(self, now: float) -> int:
+        return self._remove_documents({chunk["doc_id"] for chunk in self._chunks.values()
+                                       if chunk["expires_at"] <= now})
+
+    def _evict_oldest(self) -> int:
+        # Chunks are kept in insertion order, so the first documents met are the oldest
+        excess = len(self._chunks) - self.max_chunks
+        evicted = set()
+        for chunk in self._chunks.values():
+            if excess <= 0:
+                break
+            if chunk["doc_id"] not in evicted:
+                evicted.add(chunk["doc_id"])
+                excess -= len(self._documents[chunk["doc_id"]])
+        return self._remove_documents(evicted)
+
+    def _paths(self):
+        return (os.path.join(self.index_dir, "chunks.json"), os.path.join(self.index_dir, "vectors.npy"))
+
+    def _schedule_save(self) -> None:
+        # Called with the lock held; a save already queued will pick up this change
+        if self.index_dir and not self._save_pending:
+            self._save_pending = True
+            _save_pool.submit(self._save)
+
+    def _save(self) -> None:
+        if not self.index_dir:
+            return
+        with self._save_lock:
+            # Snapshot under the lock and write outside it, so searches are not held up by the disk
+            with self._lock:
+                self._save_pending = False
+                chunks = [dict(chunk) for chunk in self._chunks.values()]
+                vectors = (np.stack([self._vectors[chunk_id] for chunk_id in self._chunks])
+                           if chunks else np.zeros((0, self.embedder.dimensions), dtype=np.float32))
+            try:
+                os.makedirs(self.index_dir, exist_ok=True)
+                chunks_path, vectors_path = self._paths()
+                # Write to temporary files and swap them in so a crash never leaves a torn index
+                with open(chunks_path + ".tmp", "w", encoding="utf-8") as f:
+                    json.dump({"embedder": self.embedder.name, "chunks": chunks}, f)
+                with open(vectors_path + ".tmp", "wb") as f:
+                    np.save(f, vectors)
+                os.replace(vectors_path + ".tmp", vectors_path)
+                os.replace(chunks_path + ".tmp", chunks_path)
+            except (OSError, ValueError) as e:
+                self.logger.warning(f"Article index save failed: {str(e)}")
+
+    def _load(self) -> None:
+        if not self.index_dir:
+            return
+        chunks_path, vectors_path = self._paths()
+        if not (os.path.exists(chunks_path) and os.path.exists(vectors_path)):
+            return
+        try:
+            with open(chunks_path, encoding="utf-8") as f:
+                data = json.load(f)
+            vectors = np.load(vectors_path)
+            if data.get("embedder") != self.embedder.name or len(vectors) != len(data["chunks"]):
+                self.logger.info("Discarding article index built with a different embedder")
+                return
+            now = time.time()
+            for chunk, vector in zip(data["chunks"], vectors):
+                if chunk["expires_at"] > now:
+                    self._add_chunk(chunk["doc_id"], chunk, vector)
+        except (OSError, ValueError, KeyError) as e:
+            self.logger.warning(f"Article index load failed: {str(e)}")
+
+
+_default_index: Optional[ArticleIndex] = None
+_default_index_lock = threading.Lock()
+
+
+def get_default_article_index() -> ArticleIndex:
+    """
+    Return the process-wide article index shared by the news fetcher and the web search tool
+    """
+    global _default_index
+    with _default_index_lock:
+        if _default_index is None:
+            _default_index = ArticleIndex(
+                index_dir=os.getenv("ARTICLE_INDEX_DIR", DEFAULT_INDEX_DIR),
+                retention_seconds=float(os.getenv("ARTICLE_INDEX_RETENTION_DAYS", "7")) * 86400
+            )
+        return _default_index
+
+
+def peek_default_article_index() -> Optional[ArticleIndex]:
+    """
+    Return the process-wide article index if it was created, without creating it
+    """
+    with _default_index_lock:
+        return _default_index
@@ -0,0 +1,94 @@
+import hashlib
+import os
+import re
+import threading
+from typing import List, Optional
+import logging
+
+import numpy as np
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+
+
+class HashingEmbedder:
+    """
+    Deterministic offline text embedder.
+
+    Words, word bigrams and character trigrams are feature-hashed into a fixed
+    number of signed buckets and L2-normalised, so the inner product of two
+    vectors is a lexical cosine similarity. It needs no model download or
+    network access and produces the same vector for the same text on every run.
+    Being lexical, it scores texts that differ in a single name as near
+    duplicates, so callers that must tell them apart check lexical.
+    """
+    lexical = True
+
+    def __init__(self, dimensions: int = 512):
+        self.dimensions = dimensions
+        self.name = f"hashing-{dimensions}"
+
+    def _features(self, text: str) -> List[str]:
+        tokens = _TOKEN.findall(text.lower())
+        features = list(tokens)
+        features.extend(f"{a} {b}" for a, b in zip(tokens, tokens[1:]))
+        for token in tokens:
+            padded = f"#{token}#"
+            features.extend(padded[i:i + 3] for i in range(len(padded) - 2))
+        return features
+
+    def embed(self, texts: List[str]) -> np.ndarray:
+        """
+        Embed texts into an (n, dimensions) float32 matrix of unit vectors
+        """
+        vectors = np.zeros((len(texts), self.dimensions), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for feature in self._features(text):
+                digest = int.from_bytes(hashlib.blake2b(feature.encode(), digest_size=8).digest(), "little")
+                vectors[row, digest % self.dimensions] += 1.0 if digest >> 63 else -1.0
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        return vectors / np.where(norms == 0, 1.0, norms)
+
+
+class SentenceTransformerEmbedder:
+    """
+    Local neural embedder backed by the optional sentence-transformers package
+    """
+    lexical = False
+
+    def __init__(self, model_name: str):
+        from sentence_transformers import SentenceTransformer
+
+        self.model = SentenceTransformer(model_name)
+        self.dimensions = self.model.get_sentence_embedding_dimension()
+        self.name = f"sentence-transformers/{model_name}"
+
+    def embed(self, texts: List[str]) -> np.ndarray:
+        """
+        Embed texts into an (n, dimensions) float32 matrix of unit vectors
+        """
+        return np.asarray(self.model.encode(texts, normalize_embeddings=True), dtype=np.float32)
+
+
+_default_embedder = None
+_default_embedder_lock = threading.Lock()
+
+
+def get_default_embedder():
+    """
+    Return the process-wide embedder.
+    Uses the sentence-transformers model named by LOCAL_EMBEDDING_MODEL when that
+    package is installed and the model loads, and the hashing embedder otherwise.
+    """
+    global _default_embedder
+    with _default_embedder_lock:
+        if _default_embedder is None:
+            model_name: Optional[str] = os.getenv("LOCAL_EMBEDDING_MODEL")
+            if model_name:
+                try:
+                    _default_embedder = SentenceTransformerEmbedder(model_name)
+                except Exception as e:
+                    logging.getLogger(__name__).warning(
+                        f"Falling back to hashing embeddings, could not load '{model_name}': {str(e)}")
+            if _default_embedder is None:
+                _default_embedder = HashingEmbedder()
+        return _default_embedder
@@ -0,0 +1,218 @@
+import json
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+import logging
+
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, RemoveMessage, SystemMessage, ToolMessage
+
+from src.langgraphagenticai.utils.prompt_packer import (TokenCounter, MODEL_PROMPT_BUDGETS, lead_text, model_names,
+                                                        prompt_budget)
+
+# Summaries are written off the turn's critical path, between turns
+_compaction_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="history-compaction")
+
+SUMMARY_PROMPT = """You maintain a running summary of a conversation between a user and an AI assistant.
+
+Summary so far:
+{summary}
+
+Conversation to add to it:
+{transcript}
+
+Write the updated summary in at most {words} words. Keep the user's goals, preferences and open questions,
+facts and figures the assistant found (with their sources), and decisions or answers already given.
+Drop greetings and repetition. Reply with the summary only."""
+
+
+def history_compaction_enabled() -> bool:
+    """
+    Tell whether long chat histories are compacted into a rolling summary (HISTORY_COMPACTION, on by default)
+    """
+    return os.getenv("HISTORY_COMPACTION", "1").lower() not in ("0", "false", "no")
+
+
+def message_text(message: BaseMessage) -> str:
+    """
+    Return the text of a message as the model sees it, including the arguments of its tool calls
+    """
+    content = message.content
+    if not isinstance(content, str):
+        content = " ".join(part.get("text", "") if isinstance(part, dict) else str(part) for part in content)
+    if isinstance(message, AIMessage) and message.tool_calls:
+        content += " " + json.dumps([{"name": call["name"], "args": call.get("args", {})}
+                                     for call in message.tool_calls], default=str)
+    return content
+
+
+def split_turns(messages: List[BaseMessage]) -> List[List[BaseMessage]]:
+    """
+    Split a conversation into turns, each starting at a user message, so a
+    tool call is never separated from its results
+    """
+    turns = []
+    for message in messages:
+        if isinstance(message, HumanMessage) or not turns:
+            turns.append([])
+        turns[-1].append(message)
+    return turns
+
+
+class HistoryCompactor:
+    """
+    Keep the prompt of a checkpointed conversation within the model's token budget.
+
+    The compaction stage runs before the chat node on every turn. Once the
+    history passes compact_at of the budget, the turns older than the last
+    keep_turns are summarized in the background, into a rolling summary kept
+    in the state's history_summary. The next turn applies the finished summary
+    and removes the summarized messages from the checkpoint. The turn never
+    waits for the summary: until it is ready, prompt() keeps the model call
+    within budget by shortening older tool results and leaving out the
+    oldest turns.
+    """
+
+    def __init__(self, llm: Any, keep_turns: Optional[int] = None, token_budget: Optional[int] = None,
+                 compact_at: float = 0.5, max_tool_chars: int = 1500, max_pending: int = 1000):
+        """
+        Args:
+            llm: Chat model of the conversation, also used to write the summaries
+            keep_turns: Latest turns always kept verbatim, defaults to HISTORY_KEEP_TURNS or 4
+            token_budget: Input tokens per chat prompt, defaults to HISTORY_TOKEN_BUDGET or the
+                model's entry in MODEL_PROMPT_BUDGETS
+            compact_at: Share of the budget the history may use before older turns are summarized
+            max_tool_chars: Length older tool results are cut to when a prompt is over budget
+            max_pending: Conversations whose summary may be in progress at once
+        """
+        self.llm = llm
+        self.keep_turns = max(1, keep_turns or int(os.getenv("HISTORY_KEEP_TURNS", "4")))
+        names = model_names(llm)
+        self.token_budget = prompt_budget(names, token_budget, env_var="HISTORY_TOKEN_BUDGET")
+        self.counter = TokenCounter(min(names, key=lambda name: MODEL_PROMPT_BUDGETS.get(name, float('inf'))))
+        self.compact_at = compact_at
+        self.max_tool_chars = max_tool_chars
+        self.max_pending = max_pending
+        # The summary may use up to a quarter of the budget
+        self.max_summary_chars = int(self.token_budget // 4 * self.counter.chars_per_token)
+        self.logger = logging.getLogger(__name__)
+
+        self._lock = threading.Lock()
+        # thread_id -> future of (summary it extends, ids of the summarized messages, new summary)
+        self._pending: "OrderedDict[str, Future]" = OrderedDict()
+
+    def count_tokens(self, messages: List[BaseMessage]) -> int:
+        # A few tokens per message for the role and separators
+        return sum(self.counter.count(message_text(message)) + 4 for message in messages)
+
+    @staticmethod
+    def summary_message(summary: str) -> SystemMessage:
+        return SystemMessage(content=f"Summary of the earlier conversation:\n{summary}")
+
+    def compact(self, state: Dict[str, Any], config: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Graph node: apply the summary finished since the last turn, then start
+        summarizing the turns that are now too old
+        """
+        thread_id = ((config or {}).get("configurable") or {}).get("thread_id")
+        if thread_id is None:
+            # Without a checkpointer there is no history to compact
+            return {}
+        update = self._apply_pending(thread_id, state)
+        removed = {message.id for message in update.get("messages", [])}
+        messages = [message for message in state["messages"] if message.id not in removed]
+        self._schedule(thread_id, messages, update.get("history_summary", state.get("history_summary") or ""))
+        return update
+
+    async def acompact(self, state: Dict[str, Any], config: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Async variant of compact; it only hands work to the background pool, so it does not block the loop
+        """
+        return self.compact(state, config)
+
+    def prompt(self, state: Dict[str, Any]) -> List[BaseMessage]:
+        """
+        Return the messages to send to the chat model: the rolling summary and
+        the kept turns, cut down to the token budget when a summary is still pending
+        """
+        messages = list(state["messages"])
+        summary = state.get("history_summary")
+        prefix = [self.summary_message(summary)] if summary else []
+        if self.count_tokens(prefix + messages) <= self.token_budget:
+            return prefix + messages
+
+        # Older tool results go first, then the oldest turns; the current turn is always sent
+        turns = split_turns(messages)
+        turns = [[self._shorten(message) for message in turn] for turn in turns[:-1]] + turns[-1:]
+        while len(turns) > 1 and self.count_tokens(prefix + [m for turn in turns for m in turn]) > self.token_budget:
+            turns.pop(0)
+        kept = [message for turn in turns for message in turn]
+        if self.count_tokens(prefix + kept) > self.token_budget:
+            kept = [self._shorten(message) for message in kept]
+        self.logger.info(f"History over the {self.token_budget}-token budget, sending {len(kept)} of "
+                         f"{len(messages)} messages")
+        return prefix + kept
+
+    def summarize(self, summary: str, messages: List[BaseMessage]) -> str:
+        """
+        Fold messages into the rolling summary with one model call
+        """
+        lines = []
+        for message in messages:
+            if isinstance(message, HumanMessage):
+                lines.append(f"User: {lead_text(message_text(message), 1500)}")
+            elif isinstance(message, ToolMessage):
+                lines.append(f"Tool result ({message.name}): {lead_text(message_text(message), 800)}")
+            elif isinstance(message, AIMessage):
+                lines.append(f"Assistant: {lead_text(message_text(message), 1500)}")
+        words = max(50, int(self.max_summary_chars / 6))
+        prompt = SUMMARY_PROMPT.format(summary=summary or "(none yet)", transcript="\n".join(lines), words=words)
+        response = self.llm.invoke([HumanMessage(content=prompt)])
+        return lead_text(message_text(response).strip(), self.max_summary_chars)
+
+    def _summarize_job(self, summary: str, messages: List[BaseMessage]) -> Tuple[str, List[str], str]:
+        return summary, [message.id for message in messages], self.summarize(summary, messages)
+
+    def _shorten(self, message: BaseMessage) -> BaseMessage:
+        if isinstance(message, ToolMessage) and len(message_text(message)) > self.max_tool_chars:
+            return message.model_copy(update={"content": lead_text(message_text(message), self.max_tool_chars)
+                                                         + " [truncated]"})
+        return message
+
+    def _apply_pending(self, thread_id: str, state: Dict[str, Any]) -> Dict[str, Any]:
+        with self._lock:
+            future = self._pending.get(thread_id)
+            if future is None or not future.done():
+                return {}
+            del self._pending[thread_id]
+        try:
+            base_summary, summarized_ids, summary = future.result()
+        except Exception as e:
+            self.logger.warning(f"History summary for {thread_id} failed, will retry: {str(e)}")
+            return {}
+
+        present = {message.id for message in state["messages"]}
+        # The conversation changed under the summary (e.g. a concurrent turn already applied one)
+        if base_summary != (state.get("history_summary") or "") or not set(summarized_ids) <= present or not summary:
+            return {}
+        self.logger.info(f"Compacted {len(summarized_ids)} messages of {thread_id} into the summary")
+        return {"messages": [RemoveMessage(id=message_id) for message_id in summarized_ids],
+                "history_summary": summary}
+
+    def _schedule(self, thread_id: str, messages: List[BaseMessage], summary: str) -> None:
+        turns = split_turns(messages)
+        if len(turns) <= self.keep_turns:
+            return
+        prefix = [self.summary_message(summary)] if summary else []
+        if self.count_tokens(prefix + messages) < self.compact_at * self.token_budget:
+            return
+        old = [message for turn in turns[:-self.keep_turns] for message in turn]
+        if any(message.id is None for message in old):
+            return
+        with self._lock:
+            if thread_id in self._pending:
+                return
+            self._pending[thread_id] = _compaction_pool.submit(self._summarize_job, summary, old)
+            while len(self._pending) > self.max_pending:
+                self._pending.popitem(last=False)
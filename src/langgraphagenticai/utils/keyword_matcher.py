@@ -0,0 +1,69 @@
+import re
+from collections import Counter
+from typing import Dict, Iterable
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+
+
+class KeywordMatcher:
+    """
+    Precompiled, word-boundary-aware keyword matcher.
+
+    The keyword list is compiled once into a hash set of single words (with
+    their plural forms) and a tuple of space-padded phrases. Matching an
+    article tokenizes its text once and does set lookups, so keywords only
+    match whole words ("ai" matches "AI" but not "said") and multi-word
+    keywords tolerate any whitespace or punctuation between words.
+    """
+
+    def __init__(self, keywords: Iterable[str]):
+        normalised = {" ".join(_TOKEN.findall(keyword.lower())) for keyword in keywords}
+        self.keywords = sorted(keyword for keyword in normalised if keyword)
+        if not self.keywords:
+            raise ValueError("At least one keyword is required")
+
+        # Plural forms map back to their keyword so counts() reports the keyword
+        self._words: Dict[str, str] = {}
+        phrases = []
+        for keyword in self.keywords:
+            if " " in keyword:
+                phrases.append(keyword)
+            else:
+                self._words[keyword + "s"] = keyword
+                self._words[keyword] = keyword
+        self._phrases = tuple((keyword, f" {keyword} ", f" {keyword}s ") for keyword in phrases)
+
+    def counts(self, text: str) -> Dict[str, int]:
+        """
+        Return occurrences per keyword (plural matches are counted under the keyword)
+        """
+        tokens = _TOKEN.findall(text.lower())
+        counts = Counter()
+        token_counts = Counter(tokens)
+        for token in token_counts.keys() & self._words.keys():
+            counts[self._words[token]] += token_counts[token]
+        if self._phrases:
+            padded = f" {' '.join(tokens)} "
+            for keyword, phrase, plural in self._phrases:
+                occurrences = padded.count(phrase) + padded.count(plural)
+                if occurrences:
+                    counts[keyword] += occurrences
+        return dict(counts)
+
+    def count(self, text: str) -> int:
+        """
+        Return the number of keyword occurrences in text
+        """
+        return sum(self.counts(text).values())
+
+    def matches(self, text: str) -> bool:
+        """
+        Return True if text contains at least one keyword
+        """
+        tokens = _TOKEN.findall(text.lower())
+        if not self._words.keys().isdisjoint(tokens):
+            return True
+        if self._phrases:
+            padded = f" {' '.join(tokens)} "
+            return any(phrase in padded or plural in padded for _, phrase, plural in self._phrases)
+        return False
@@ -0,0 +1,44 @@
+from typing import Any, Dict, List, Tuple
+
+from langchain_core.messages import AIMessage, AIMessageChunk, HumanMessage, ToolMessage
+
+
+def chunk_text(chunk: Any) -> str:
+    """
+    Extract the text of a streamed AI message chunk (providers may send a list of parts)
+    """
+    if not isinstance(chunk, AIMessageChunk):
+        return ""
+    content = chunk.content
+    if isinstance(content, str):
+        return content
+    return "".join(part.get("text", "") if isinstance(part, dict) else str(part) for part in content)
+
+
+def serialize_message(message) -> Dict[str, Any]:
+    """
+    Return a graph message as JSON-serializable data, with its tool calls or tool result details
+    """
+    data = {"type": message.type, "content": message.content}
+    if isinstance(message, AIMessage) and message.tool_calls:
+        data["tool_calls"] = [{"id": c.get("id"), "name": c["name"], "args": c.get("args", {})}
+                              for c in message.tool_calls]
+    if isinstance(message, ToolMessage):
+        data["name"] = message.name
+        data["tool_call_id"] = message.tool_call_id
+        data["status"] = message.status
+        data["outcome"] = message.response_metadata.get("outcome")
+        data["duration"] = message.response_metadata.get("duration")
+    return data
+
+
+def turn_result(result: Dict[str, Any]) -> Tuple[List[Dict[str, Any]], str]:
+    """
+    Return the serialized messages of a run's last turn and its final reply.
+    With a checkpointer the result holds the whole conversation; only this turn is returned.
+    """
+    messages = result.get("messages", [])
+    turn_start = max((i for i, m in enumerate(messages) if isinstance(m, HumanMessage)), default=-1)
+    new_messages = [serialize_message(m) for m in messages[turn_start + 1:]]
+    replies = [m["content"] for m in new_messages if m["type"] == "ai" and m["content"]]
+    return new_messages, replies[-1] if replies else ""
@@ -0,0 +1,156 @@
+import hashlib
+import re
+from typing import Any, Dict, Iterable, List, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+import logging
+
+import numpy as np
+
+# Query parameters that only track where a click came from
+TRACKING_PARAMS = {"fbclid", "gclid", "dclid", "msclkid", "mc_cid", "mc_eid", "igshid",
+                   "ref", "ref_src", "ref_url", "source", "sk", "cmpid", "ncid", "guccounter"}
+
+_MEDIUM_POST_ID = re.compile(r"-([0-9a-f]{8,12})$")
+_TOKEN = re.compile(r"[a-z0-9]+")
+
+_MASK64 = np.uint64(0xFFFFFFFFFFFFFFFF)
+_SHINGLE_MULTIPLIERS = np.array([0x9E3779B97F4A7C15, 0xC2B2AE3D27D4EB4F, 0x165667B19E3779F9,
+                                 0xD6E8FEB86659FD93, 0xFF51AFD7ED558CCD], dtype=np.uint64)
+_BIT_POSITIONS = np.arange(64, dtype=np.uint64)
+
+
+def canonicalize_url(url: str) -> str:
+    """
+    Reduce a URL to a canonical form so tracking-parameter, mobile and "www"
+    variants of the same page compare equal
+    """
+    if not url:
+        return ""
+    parts = urlsplit(url.strip())
+    host = parts.netloc.lower()
+    for prefix in ("www.", "m.", "amp."):
+        if host.startswith(prefix):
+            host = host[len(prefix):]
+    path = re.sub(r"/(amp/?)?$", "", parts.path) or "/"
+
+    # Medium serves the same post under many paths; the trailing post id identifies it
+    if host == "medium.com" or host.endswith(".medium.com"):
+        match = _MEDIUM_POST_ID.search(path)
+        if match:
+            return f"medium.com/p/{match.group(1)}"
+
+    query = sorted((key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+                   if not key.lower().startswith("utm_") and key.lower() not in TRACKING_PARAMS)
+    return urlunsplit(("", host, path, urlencode(query), "")).lstrip("/")
+
+
+def _popcount(values: np.ndarray) -> np.ndarray:
+    if hasattr(np, "bitwise_count"):
+        return np.bitwise_count(values)
+    return np.unpackbits(values.view(np.uint8).reshape(-1, 8), axis=1).sum(axis=1)
+
+
+class NearDuplicateDetector:
+    """
+    Near-duplicate detection for news articles using shingled SimHash.
+
+    Each article's title and content are split into word shingles and folded
+    into a 64-bit SimHash fingerprint. Two articles are near-duplicates when
+    their canonical URLs match or their fingerprints differ in at most
+    max_distance bits.
+    """
+
+    def __init__(self, max_distance: int = 10, shingle_size: int = 3):
+        """
+        Args:
+            max_distance: Largest Hamming distance (out of 64 bits) treated as a duplicate
+            shingle_size: Number of consecutive words per shingle
+        """
+        if not 1 <= shingle_size <= len(_SHINGLE_MULTIPLIERS):
+            raise ValueError(f"shingle_size must be between 1 and {len(_SHINGLE_MULTIPLIERS)}")
+        self.max_distance = max_distance
+        self.shingle_size = shingle_size
+        self._token_hashes: Dict[str, int] = {}
+        self.logger = logging.getLogger(__name__)
+
+    def _hash_tokens(self, tokens: List[str]) -> np.ndarray:
+        cache = self._token_hashes
+        hashes = []
+        for token in tokens:
+            value = cache.get(token)
+            if value is None:
+                value = int.from_bytes(hashlib.blake2b(token.encode(), digest_size=8).digest(), "little")
+                cache[token] = value
+            hashes.append(value)
+        return np.array(hashes, dtype=np.uint64)
+
+    def fingerprint(self, text: str) -> np.uint64:
+        """
+        Compute the 64-bit SimHash of a text
+        """
+        tokens = _TOKEN.findall(text.lower())
+        if not tokens:
+            return np.uint64(0)
+        token_hashes = self._hash_tokens(tokens)
+        size = min(self.shingle_size, len(token_hashes))
+        count = len(token_hashes) - size + 1
+
+        # Combine each window of token hashes into a shingle hash, then mix its bits
+        with np.errstate(over="ignore"):
+            shingles = np.zeros(count, dtype=np.uint64)
+            for offset in range(size):
+                shingles = shingles + token_hashes[offset:offset + count] * _SHINGLE_MULTIPLIERS[offset]
+            shingles ^= shingles >> np.uint64(33)
+            shingles = (shingles * np.uint64(0xFF51AFD7ED558CCD)) & _MASK64
+            shingles ^= shingles >> np.uint64(33)
+
+        bits = (shingles[:, None] >> _BIT_POSITIONS) & np.uint64(1)
+        votes = bits.sum(axis=0, dtype=np.int64) * 2 - count
+        return np.uint64(int(((votes > 0).astype(np.uint64) << _BIT_POSITIONS).sum()))
+
+    def fingerprints(self, texts: Iterable[str]) -> np.ndarray:
+        """
+        Compute SimHash fingerprints for many texts
+        """
+        return np.array([self.fingerprint(text) for text in texts], dtype=np.uint64)
+
+    def deduplicate(self, articles: List[Dict[str, Any]], limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Drop near-duplicate articles, keeping the highest-scoring copy of each story.
+
+        Articles are visited in descending score order (ties keep their input
+        order), and each one is compared against every article kept so far
+        with a single vectorised XOR/popcount.
+
+        Args:
+            articles: Articles with 'title', 'content', 'url' and 'score'
+            limit: Stop once this many unique articles have been kept
+
+        Returns:
+            Unique articles in descending score order
+        """
+        ranked = sorted(articles, key=lambda article: article.get('score', 0), reverse=True)
+        fingerprints = self.fingerprints(f"{a.get('title', '')} {a.get('content', '')}" for a in ranked)
+
+        kept: List[Dict[str, Any]] = []
+        kept_fingerprints = np.empty(len(ranked), dtype=np.uint64)
+        seen_urls = set()
+        duplicates = 0
+
+        for article, fingerprint in zip(ranked, fingerprints):
+            url = canonicalize_url(article.get('url', ''))
+            if not url:
+                continue
+            if url in seen_urls or (
+                    kept and _popcount(kept_fingerprints[:len(kept)] ^ fingerprint).min() <= self.max_distance):
+                duplicates += 1
+                continue
+            seen_urls.add(url)
+            kept_fingerprints[len(kept)] = fingerprint
+            kept.append(article)
+            if limit is not None and len(kept) >= limit:
+                break
+
+        if duplicates:
+            self.logger.info(f"Dropped {duplicates} duplicate articles")
+        return kept
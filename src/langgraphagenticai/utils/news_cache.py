@@ -0,0 +1,192 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Sequence, Tuple
+import logging
+
+DEFAULT_CACHE_PATH = os.path.join(".cache", "news_cache.sqlite3")
+
+
+class NewsCache:
+    """
+    Two-tier TTL cache for Tavily news search responses.
+
+    Entries live in an in-process LRU and in an on-disk SQLite table, so repeat
+    digests are served without network I/O and a restart does not start cold.
+    Expired entries are purged when the cache opens and every purge_every writes,
+    so the SQLite file does not keep growing.
+    """
+
+    def __init__(self, db_path: Optional[str] = DEFAULT_CACHE_PATH, ttl_seconds: float = 1800.0,
+                 max_memory_entries: int = 256, purge_every: int = 100):
+        """
+        Args:
+            db_path: SQLite file backing the disk tier, or None to keep the cache in memory only
+            ttl_seconds: How long a cached response stays valid
+            max_memory_entries: Size of the in-process LRU tier
+            purge_every: Writes between two purges of the expired entries, or 0 to only purge on open
+        """
+        self.db_path = db_path
+        self.ttl_seconds = ttl_seconds
+        self.max_memory_entries = max_memory_entries
+        self.purge_every = purge_every
+        self.logger = logging.getLogger(__name__)
+
+        self._memory: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0, "evictions": 0, "purges": 0}
+        self._conn = None
+        self._sets_since_purge = 0
+
+        if db_path:
+            try:
+                directory = os.path.dirname(db_path)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+                self._conn = sqlite3.connect(db_path, check_same_thread=False)
+                self._conn.execute(
+                    "CREATE TABLE IF NOT EXISTS news_cache ("
+                    "key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+                )
+                self._conn.execute("CREATE INDEX IF NOT EXISTS news_cache_expiry ON news_cache (expires_at)")
+                self._conn.commit()
+            except sqlite3.Error as e:
+                self.logger.warning(f"News cache disk tier disabled: {str(e)}")
+                self._conn = None
+            self.purge_expired()
+
+    @staticmethod
+    def make_key(query: str, days: int, domains: Sequence[str], max_results: int) -> str:
+        """
+        Build the cache key for one search request
+        """
+        return json.dumps([query, days, sorted(domains or []), max_results], separators=(",", ":"))
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Return the cached value for key, or None when missing or expired
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at > now:
+                    self._memory.move_to_end(key)
+                    self._stats["memory_hits"] += 1
+                    return value
+                del self._memory[key]
+                self._stats["evictions"] += 1
+
+            if self._conn is not None:
+                try:
+                    row = self._conn.execute(
+                        "SELECT value, expires_at FROM news_cache WHERE key = ?", (key,)
+                    ).fetchone()
+                    if row is not None:
+                        if row[1] > now:
+                            value = json.loads(row[0])
+                            self._remember(key, row[1], value)
+                            self._stats["disk_hits"] += 1
+                            return value
+                        self._conn.execute("DELETE FROM news_cache WHERE key = ?", (key,))
+                        self._conn.commit()
+                        self._stats["evictions"] += 1
+                except (sqlite3.Error, ValueError) as e:
+                    self.logger.warning(f"News cache read failed: {str(e)}")
+
+            self._stats["misses"] += 1
+            return None
+
+    def set(self, key: str, value: Any) -> None:
+        """
+        Store a JSON-serialisable value under key in both tiers
+        """
+        expires_at = time.time() + self.ttl_seconds
+        with self._lock:
+            self._remember(key, expires_at, value)
+            if self._conn is not None:
+                try:
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO news_cache (key, value, expires_at) VALUES (?, ?, ?)",
+                        (key, json.dumps(value), expires_at)
+                    )
+                    self._conn.commit()
+                except (sqlite3.Error, TypeError, ValueError) as e:
+                    self.logger.warning(f"News cache write failed: {str(e)}")
+            self._sets_since_purge += 1
+            purge = bool(self.purge_every) and self._sets_since_purge >= self.purge_every
+            if purge:
+                self._sets_since_purge = 0
+        if purge:
+            self.purge_expired()
+
+    def purge_expired(self) -> int:
+        """
+        Drop expired entries from both tiers and return how many were removed
+        """
+        now = time.time()
+        removed = 0
+        with self._lock:
+            for key in [k for k, (expires_at, _) in self._memory.items() if expires_at <= now]:
+                del self._memory[key]
+                removed += 1
+            if self._conn is not None:
+                try:
+                    cursor = self._conn.execute("DELETE FROM news_cache WHERE expires_at <= ?", (now,))
+                    self._conn.commit()
+                    removed += cursor.rowcount
+                except sqlite3.Error as e:
+                    self.logger.warning(f"News cache purge failed: {str(e)}")
+            self._stats["evictions"] += removed
+            self._stats["purges"] += 1
+        return removed
+
+    def clear(self) -> None:
+        """
+        Remove every entry from both tiers
+        """
+        with self._lock:
+            self._memory.clear()
+            if self._conn is not None:
+                self._conn.execute("DELETE FROM news_cache")
+                self._conn.commit()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return hit/miss counters and the current memory tier size
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats["memory_entries"] = len(self._memory)
+        lookups = stats["memory_hits"] + stats["disk_hits"] + stats["misses"]
+        stats["hit_rate"] = (stats["memory_hits"] + stats["disk_hits"]) / lookups if lookups else 0.0
+        return stats
+
+    def _remember(self, key: str, expires_at: float, value: Any) -> None:
+        self._memory[key] = (expires_at, value)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+            self._stats["evictions"] += 1
+
+
+_default_cache: Optional[NewsCache] = None
+_default_cache_lock = threading.Lock()
+
+
+def get_default_news_cache() -> NewsCache:
+    """
+    Return the process-wide news cache shared by every session
+    """
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = NewsCache(
+                db_path=os.getenv("NEWS_CACHE_PATH", DEFAULT_CACHE_PATH),
+                ttl_seconds=float(os.getenv("NEWS_CACHE_TTL_SECONDS", "1800"))
+            )
+        return _default_cache
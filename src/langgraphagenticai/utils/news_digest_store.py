@@ -0,0 +1,230 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from datetime import date, datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Iterable, List, Optional, Set
+import logging
+
+from src.langgraphagenticai.utils.near_duplicate import canonicalize_url
+
+DEFAULT_DIGEST_PATH = os.path.join(".cache", "news_digest.sqlite3")
+
+
+def article_id(article: Dict[str, Any]) -> str:
+    """
+    Stable ID of an article: a hash of its canonical URL, or of its title when it has none
+    """
+    key = canonicalize_url(article.get('url', '')) or (article.get('title') or '').strip().lower()
+    return hashlib.sha1(key.encode("utf-8")).hexdigest()[:20]
+
+
+def article_day(article: Dict[str, Any], default: Optional[date] = None) -> str:
+    """
+    Return the UTC publication day of an article as YYYY-MM-DD, or default
+    (today) when its published_date is missing or unparseable
+    """
+    published = (article.get('published_date') or '').strip()
+    parsed = None
+    if published:
+        try:
+            parsed = parsedate_to_datetime(published)
+        except (TypeError, ValueError):
+            try:
+                parsed = datetime.fromisoformat(published.replace('Z', '+00:00'))
+            except ValueError:
+                parsed = None
+    if parsed is not None:
+        if parsed.tzinfo is not None:
+            parsed = parsed.astimezone(timezone.utc)
+        return parsed.date().isoformat()
+    return (default or datetime.now(timezone.utc).date()).isoformat()
+
+
+class NewsDigestStore:
+    """
+    Persistent state of the incremental news digest.
+
+    Records the IDs of the articles already summarized, one partial summary
+    per publication day (its notes grouped by digest section), the fetch
+    watermark and the last digest rendered for each days option. A repeat
+    digest then only fetches and summarizes what is newer than the watermark.
+    """
+
+    def __init__(self, db_path: Optional[str] = DEFAULT_DIGEST_PATH, retention_days: int = 30):
+        """
+        Args:
+            db_path: SQLite file holding the digest state, or None to keep it in memory only
+            retention_days: Days of articles and partial summaries kept before they are pruned
+        """
+        self.db_path = db_path
+        self.retention_days = retention_days
+        self.logger = logging.getLogger(__name__)
+        self._lock = threading.Lock()
+
+        path = ":memory:"
+        if db_path:
+            try:
+                directory = os.path.dirname(db_path)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+                path = db_path
+            except OSError as e:
+                self.logger.warning(f"News digest store kept in memory: {str(e)}")
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.executescript(
+            "CREATE TABLE IF NOT EXISTS digest_articles ("
+            "id TEXT PRIMARY KEY, day TEXT NOT NULL, url TEXT, title TEXT, added_at REAL NOT NULL);"
+            "CREATE INDEX IF NOT EXISTS digest_articles_day ON digest_articles (day);"
+            "CREATE TABLE IF NOT EXISTS digest_partials ("
+            "day TEXT PRIMARY KEY, sections TEXT NOT NULL, article_count INTEGER NOT NULL, updated_at REAL NOT NULL);"
+            "CREATE TABLE IF NOT EXISTS digest_meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);"
+            "CREATE TABLE IF NOT EXISTS digests ("
+            "time_period TEXT PRIMARY KEY, content TEXT NOT NULL, article_count INTEGER NOT NULL, "
+            "created_at REAL NOT NULL);"
+        )
+        self._conn.commit()
+
+    def known_ids(self, ids: Iterable[str]) -> Set[str]:
+        """
+        Return the subset of ids whose articles were already summarized
+        """
+        ids = list(ids)
+        known = set()
+        with self._lock:
+            # Stay under SQLite's bound-parameter limit
+            for start in range(0, len(ids), 500):
+                chunk = ids[start:start + 500]
+                rows = self._conn.execute(
+                    f"SELECT id FROM digest_articles WHERE id IN ({','.join('?' * len(chunk))})", chunk
+                ).fetchall()
+                known.update(row[0] for row in rows)
+        return known
+
+    def merge_partial(self, day: str, sections: Dict[str, List[str]], articles: List[Dict[str, Any]]) -> None:
+        """
+        Add the notes of newly summarized articles to the partial summary of
+        their publication day and record the articles as summarized
+        """
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute("SELECT sections, article_count FROM digest_partials WHERE day = ?",
+                                     (day,)).fetchone()
+            merged, count = (json.loads(row[0]), row[1]) if row else ({}, 0)
+            for section, bullets in sections.items():
+                merged.setdefault(section, []).extend(bullets)
+            self._conn.execute(
+                "INSERT OR REPLACE INTO digest_partials (day, sections, article_count, updated_at) VALUES (?, ?, ?, ?)",
+                (day, json.dumps(merged), count + len(articles), now)
+            )
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO digest_articles (id, day, url, title, added_at) VALUES (?, ?, ?, ?, ?)",
+                [(article_id(article), day, article.get('url', ''), article.get('title', ''), now)
+                 for article in articles]
+            )
+            self._conn.commit()
+
+    def partials(self, since_day: str) -> List[Dict[str, Any]]:
+        """
+        Return the partial summaries of since_day and later, newest day first
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT day, sections, article_count FROM digest_partials WHERE day >= ? ORDER BY day DESC",
+                (since_day,)
+            ).fetchall()
+        return [{"day": day, "sections": json.loads(sections), "article_count": count}
+                for day, sections, count in rows]
+
+    def get_watermark(self) -> Dict[str, Any]:
+        """
+        Return the time of the last complete fetch ("fetched_at", epoch seconds)
+        and the earliest day every fetch since has covered ("covered_since")
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT key, value FROM digest_meta WHERE key IN ('fetched_at', 'covered_since')").fetchall()
+        meta = dict(rows)
+        return {"fetched_at": float(meta["fetched_at"]) if "fetched_at" in meta else None,
+                "covered_since": meta.get("covered_since")}
+
+    def set_watermark(self, fetched_at: float, covered_since: str) -> None:
+        with self._lock:
+            self._conn.executemany("INSERT OR REPLACE INTO digest_meta (key, value) VALUES (?, ?)",
+                                   [("fetched_at", repr(fetched_at)), ("covered_since", covered_since)])
+            self._conn.commit()
+
+    def save_digest(self, time_period: str, content: str, article_count: int) -> None:
+        """
+        Store the digest last rendered for a days option
+        """
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO digests (time_period, content, article_count, created_at) VALUES (?, ?, ?, ?)",
+                (time_period, content, article_count, time.time())
+            )
+            self._conn.commit()
+
+    def get_digest(self, time_period: str) -> Optional[Dict[str, Any]]:
+        """
+        Return the digest last rendered for a days option with its article
+        count and creation time, or None
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT content, article_count, created_at FROM digests WHERE time_period = ?", (time_period,)
+            ).fetchone()
+        if row is None:
+            return None
+        return {"content": row[0], "article_count": row[1], "created_at": row[2]}
+
+    def prune(self, before_day: Optional[str] = None) -> int:
+        """
+        Drop articles and partial summaries published before before_day
+        (default: retention_days ago) and return how many rows were removed
+        """
+        if before_day is None:
+            before_day = date.fromordinal(datetime.now(timezone.utc).date().toordinal()
+                                          - self.retention_days).isoformat()
+        with self._lock:
+            removed = self._conn.execute("DELETE FROM digest_articles WHERE day < ?", (before_day,)).rowcount
+            removed += self._conn.execute("DELETE FROM digest_partials WHERE day < ?", (before_day,)).rowcount
+            self._conn.commit()
+        return removed
+
+    def clear(self) -> None:
+        """
+        Forget every article, partial summary, watermark and digest
+        """
+        with self._lock:
+            for table in ("digest_articles", "digest_partials", "digest_meta", "digests"):
+                self._conn.execute(f"DELETE FROM {table}")
+            self._conn.commit()
+
+
+def incremental_digest_enabled() -> bool:
+    """
+    Tell whether the app builds the incremental news summarizer (NEWS_INCREMENTAL, on by default)
+    """
+    return os.getenv("NEWS_INCREMENTAL", "1").lower() not in ("0", "false", "no")
+
+
+_default_store: Optional[NewsDigestStore] = None
+_default_store_lock = threading.Lock()
+
+
+def get_default_news_digest_store() -> NewsDigestStore:
+    """
+    Return the process-wide incremental digest store shared by every session
+    """
+    global _default_store
+    with _default_store_lock:
+        if _default_store is None:
+            _default_store = NewsDigestStore(
+                db_path=os.getenv("NEWS_DIGEST_PATH", DEFAULT_DIGEST_PATH),
+                retention_days=int(os.getenv("NEWS_DIGEST_RETENTION_DAYS", "30"))
+            )
+        return _default_store
@@ -0,0 +1,195 @@
+import os
+import re
+import threading
+import time
+from typing import Any, Dict, List, Optional
+import logging
+
+from langchain_core.messages import HumanMessage
+
+from src.langgraphagenticai.ui.uiconfigfile import Config
+from src.langgraphagenticai.utils.news_digest_store import NewsDigestStore, get_default_news_digest_store
+
+DEFAULT_PREFETCH_INTERVAL = 900.0
+
+# Per-request controls that the prefetcher sets itself
+_REQUEST_CONTROLS = ("generate_news_summary", "selected_days", "refresh_news_digest")
+
+
+def prefetch_enabled() -> bool:
+    """
+    Tell whether the app refreshes news digests in the background (NEWS_PREFETCH, off by default;
+    the standalone news worker is the supported way to keep digests fresh)
+    """
+    return os.getenv("NEWS_PREFETCH", "0").lower() not in ("0", "false", "no")
+
+
+def prefetch_interval() -> float:
+    return float(os.getenv("NEWS_PREFETCH_INTERVAL_SECONDS", str(DEFAULT_PREFETCH_INTERVAL)))
+
+
+def max_digest_age() -> float:
+    """
+    Seconds a stored digest is served for (NEWS_DIGEST_MAX_AGE_SECONDS). The
+    default of two refresh intervals still serves a digest whose last
+    refresh failed; 0 always generates a new one.
+    """
+    return float(os.getenv("NEWS_DIGEST_MAX_AGE_SECONDS", str(2 * prefetch_interval())))
+
+
+class NewsPrefetcher:
+    """
+    Background scheduler that keeps the digest of every days option fresh.
+
+    The days options are a small fixed set, so every interval the prefetcher
+    runs the AI News Summarizer graph once per option with a refresh request.
+    The graph stores each finished digest, and a later "Generate" click is
+    answered from the store while the digest is younger than the graph's
+    max digest age. The widest option is refreshed first, so with the
+    incremental graph the narrower ones find no new articles and cost at
+    most one merge call each.
+    """
+
+    def __init__(self, days_options: Optional[List[str]] = None, interval_seconds: float = DEFAULT_PREFETCH_INTERVAL,
+                 store: Optional[NewsDigestStore] = None):
+        """
+        Args:
+            days_options: Days options to keep fresh, defaults to the UI's NEWS_DAYS_OPTIONS
+            interval_seconds: Seconds between refreshes of each option
+            store: Store the graph saves its digests to, defaults to the process-wide one
+        """
+        options = days_options or Config().get_news_days_options()
+        self.days_options = sorted(options, key=lambda option: max(map(int, re.findall(r"\d+", option)) or [0]),
+                                   reverse=True)
+        self.interval_seconds = interval_seconds
+        self.store = store or get_default_news_digest_store()
+        self.logger = logging.getLogger(__name__)
+
+        self._graph = None
+        self._user_controls: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._stats = {"refreshes": 0, "failures": 0, "last_refresh": {}}
+
+    def configure(self, graph: Any, user_controls: Dict[str, Any]) -> None:
+        """
+        Use graph, a compiled AI News Summarizer graph, and the provider and
+        Tavily credentials in user_controls for the next refreshes. Digests are
+        shared by every user, so pass operator-supplied environment keys (see
+        news_worker.get_worker_controls), never a session's.
+        """
+        controls = {key: value for key, value in user_controls.items() if key not in _REQUEST_CONTROLS}
+        with self._lock:
+            changed = graph is not self._graph
+            self._graph, self._user_controls = graph, controls
+        if changed:
+            # Refresh whatever is due with the new graph instead of waiting out the interval
+            self._wake.set()
+
+    def is_due(self, days_selection: str) -> bool:
+        """
+        Tell whether the stored digest of days_selection is missing or older than the interval
+        """
+        digest = self.store.get_digest(days_selection)
+        return digest is None or time.time() - digest["created_at"] >= self.interval_seconds
+
+    def refresh(self, days_selection: str) -> bool:
+        """
+        Generate and store a new digest for days_selection, returning whether one was stored
+        """
+        with self._lock:
+            graph, controls = self._graph, dict(self._user_controls)
+        if graph is None:
+            return False
+
+        started = time.time()
+        try:
+            graph.invoke({
+                "messages": [HumanMessage(content=f"Prefetch AI News Summary ({days_selection})")],
+                "user_controls": {**controls, "selected_days": days_selection,
+                                  "generate_news_summary": True, "refresh_news_digest": True},
+            })
+            digest = self.store.get_digest(days_selection)
+            stored = digest is not None and digest["created_at"] >= started
+        except Exception as e:
+            self.logger.warning(f"Prefetching the {days_selection} news digest failed: {str(e)}")
+            stored = False
+
+        with self._lock:
+            self._stats["refreshes" if stored else "failures"] += 1
+            if stored:
+                self._stats["last_refresh"][days_selection] = time.time()
+        self.logger.info(f"Prefetched the {days_selection} news digest in {time.time() - started:.1f}s"
+                         if stored else f"No {days_selection} news digest was stored by the prefetch run")
+        return stored
+
+    def refresh_due(self) -> int:
+        """
+        Refresh every days option whose digest is due and return how many were stored
+        """
+        return sum(self.refresh(option) for option in self.days_options
+                   if not self._stop.is_set() and self.is_due(option))
+
+    def run_forever(self) -> None:
+        """
+        Refresh the due digests every interval until stop() is called
+        """
+        while not self._stop.is_set():
+            self.refresh_due()
+            self._wake.wait(self.interval_seconds)
+            self._wake.clear()
+
+    def start(self) -> bool:
+        """
+        Run the scheduler on a daemon thread, unless it is already running.
+        Returns whether a thread was started.
+        """
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return False
+            self._stop.clear()
+            self._thread = threading.Thread(target=self.run_forever, name="news-prefetcher", daemon=True)
+            self._thread.start()
+        self.logger.info(f"News prefetcher refreshing {', '.join(self.days_options)} every {self.interval_seconds:.0f}s")
+        return True
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._wake.set()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return refresh counters and the age in seconds of each option's last refresh
+        """
+        now = time.time()
+        with self._lock:
+            stats = {"refreshes": self._stats["refreshes"], "failures": self._stats["failures"],
+                     "running": self._thread is not None and self._thread.is_alive()}
+            stats["age_seconds"] = {option: round(now - refreshed, 1)
+                                    for option, refreshed in self._stats["last_refresh"].items()}
+        return stats
+
+
+_default_prefetcher: Optional[NewsPrefetcher] = None
+_default_prefetcher_lock = threading.Lock()
+
+
+def get_news_prefetcher() -> NewsPrefetcher:
+    """
+    Return the process-wide news prefetcher
+    """
+    global _default_prefetcher
+    with _default_prefetcher_lock:
+        if _default_prefetcher is None:
+            _default_prefetcher = NewsPrefetcher(interval_seconds=prefetch_interval())
+        return _default_prefetcher
+
+
+def peek_news_prefetcher() -> Optional[NewsPrefetcher]:
+    """
+    Return the process-wide news prefetcher if it was created, without creating it
+    """
+    with _default_prefetcher_lock:
+        return _default_prefetcher
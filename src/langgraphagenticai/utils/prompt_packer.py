@@ -0,0 +1,223 @@
+import math
+import os
+import re
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+import logging
+
+# Input token budget per model for packed prompts. Sized to the model's
+# context window and, for Groq's free tier, its tokens-per-minute limit.
+MODEL_PROMPT_BUDGETS = {
+    "llama-3.1-8b-instant": 3500,
+    "openai/gpt-oss-20b": 6000,
+    "meta-llama/llama-guard-4-12b": 3000,
+    "gpt-3.5-turbo": 12000,
+    "gpt-4": 6000,
+    "gemini-2.5-pro": 60000,
+}
+DEFAULT_PROMPT_BUDGET = 6000
+
+# Characters per token by model family, for models without a local tokenizer
+_CHARS_PER_TOKEN = (("gpt", 4.0), ("llama", 3.6), ("gemini", 4.0))
+_DEFAULT_CHARS_PER_TOKEN = 3.5
+
+_SENTENCE_END = re.compile(r"(?<=[.!?])[\"')\]]*\s+(?=[A-Z0-9\"'(\[])")
+_BOILERPLATE = re.compile(
+    r"subscribe|sign up|newsletter|cookie|all rights reserved|click here|read more|advertisement|"
+    r"follow us|share this|related articles?|privacy policy|terms of (use|service)|log ?in|skip to",
+    re.IGNORECASE)
+_MARKUP = re.compile(r"!\[[^\]]*\]\([^)]*\)|\[([^\]]*)\]\([^)]*\)|<[^>]+>")
+_WHITESPACE = re.compile(r"\s+")
+
+_encodings: Dict[str, Any] = {}
+_encodings_lock = threading.Lock()
+
+
+def _tiktoken_encoding(model_name: str) -> Optional[Any]:
+    """
+    Return the tiktoken encoding for an OpenAI model, or None when tiktoken or
+    its encoding files are not available (e.g. offline). Failures are cached.
+    """
+    if not model_name.startswith("gpt"):
+        return None
+    with _encodings_lock:
+        if model_name not in _encodings:
+            try:
+                import tiktoken
+                _encodings[model_name] = tiktoken.encoding_for_model(model_name)
+            except Exception as e:
+                logging.getLogger(__name__).info(f"No tokenizer for {model_name}, estimating tokens: {str(e)}")
+                _encodings[model_name] = None
+        return _encodings[model_name]
+
+
+class TokenCounter:
+    """
+    Count prompt tokens for one model: exactly with tiktoken for OpenAI models
+    when it is available, otherwise from a characters-per-token ratio for the
+    model family that errs on the high side.
+    """
+
+    def __init__(self, model_name: Optional[str] = None):
+        self.model_name = model_name or ""
+        self.encoding = _tiktoken_encoding(self.model_name)
+        self.chars_per_token = next((ratio for family, ratio in _CHARS_PER_TOKEN if family in self.model_name),
+                                    _DEFAULT_CHARS_PER_TOKEN)
+
+    def count(self, text: str) -> int:
+        if not text:
+            return 0
+        if self.encoding is not None:
+            return len(self.encoding.encode(text, disallowed_special=()))
+        return math.ceil(len(text) / self.chars_per_token)
+
+
+def prompt_budget(model_names: Iterable[Optional[str]], override: Optional[int] = None,
+                  env_var: str = "NEWS_PROMPT_TOKEN_BUDGET") -> int:
+    """
+    Return the input token budget for a prompt that may go to any of model_names:
+    the override, else the env_var environment variable, else the smallest per-model budget
+    """
+    if override:
+        return override
+    if os.getenv(env_var):
+        return int(os.environ[env_var])
+    return min((MODEL_PROMPT_BUDGETS.get(name or "", DEFAULT_PROMPT_BUDGET) for name in model_names),
+               default=DEFAULT_PROMPT_BUDGET)
+
+
+def model_names(llm: Any) -> List[str]:
+    """
+    Return the model names behind a chat model, looking inside the latency router
+    """
+    inner = getattr(llm, "models", None)
+    models = list(inner.values()) if isinstance(inner, dict) else [llm]
+    return [getattr(model, "model_name", None) or getattr(model, "model", None) or "" for model in models]
+
+
+def split_sentences(text: str) -> List[str]:
+    return [sentence for sentence in _SENTENCE_END.split(text) if sentence]
+
+
+def clean_text(text: str) -> str:
+    """
+    Drop markup, navigation and boilerplate sentences (newsletter prompts,
+    cookie notices, "read more" links) and collapse whitespace
+    """
+    text = _MARKUP.sub(lambda match: match.group(1) or " ", text or "")
+    lines = (line.strip(" |•-") for line in re.split(r"[\r\n]+", text))
+    kept = []
+    for line in lines:
+        # Short link-like lines are menus and bylines rather than article text
+        if not line or (len(line) < 40 and not re.search(r"[.!?]$", line)):
+            continue
+        sentences = [s for s in split_sentences(_WHITESPACE.sub(" ", line))
+                     if not (_BOILERPLATE.search(s) and len(s) < 160)]
+        kept.extend(sentences)
+    return " ".join(kept)
+
+
+def lead_text(text: str, max_chars: int) -> str:
+    """
+    Return the leading sentences of text that fit in max_chars, cutting at a
+    sentence boundary rather than mid-word
+    """
+    if len(text) <= max_chars:
+        return text
+    lead = ""
+    for sentence in split_sentences(text):
+        if len(lead) + len(sentence) + 1 > max_chars:
+            break
+        lead = f"{lead} {sentence}" if lead else sentence
+    # A first sentence longer than max_chars is cut at a word boundary
+    return lead or text[:max_chars].rsplit(" ", 1)[0] + "..."
+
+
+def compress_text(text: str, max_chars: int) -> str:
+    """
+    Clean text and keep its lead sentences up to max_chars
+    """
+    return lead_text(clean_text(text) or (text or ""), max_chars)
+
+
+class PromptPacker:
+    """
+    Fill a prompt's input token budget with the highest-scoring articles.
+
+    Articles are cleaned of boilerplate, then taken in score order. Each is
+    added at its full (cleaned) length if it fits, otherwise as its lead
+    sentences, and skipped if even one sentence does not fit. Large budgets
+    therefore cover more articles in more depth, and small models get a
+    prompt that fits instead of a context-length error.
+    """
+
+    # Lead lengths tried, in sentences, when an article does not fit whole
+    LEAD_SENTENCES = (3, 1)
+
+    def __init__(self, counter: TokenCounter, budget: int, max_article_tokens: int = 400):
+        """
+        Args:
+            counter: Token counter of the model the prompt is for
+            budget: Input tokens the whole prompt may use
+            max_article_tokens: Cap on the tokens one article may take
+        """
+        self.counter = counter
+        self.budget = budget
+        self.max_article_tokens = max_article_tokens
+        self.logger = logging.getLogger(__name__)
+
+    @staticmethod
+    def _score(article: Dict[str, Any]) -> Tuple[float, int]:
+        return (article.get('score') or 0.0, article.get('keyword_matches') or 0)
+
+    def _variants(self, content: str) -> List[str]:
+        """
+        Return the versions of content to try, longest first
+        """
+        variants = [lead_text(content, int(self.max_article_tokens * self.counter.chars_per_token))]
+        sentences = split_sentences(variants[0])
+        for count in self.LEAD_SENTENCES:
+            if count < len(sentences):
+                variants.append(" ".join(sentences[:count]))
+        return variants
+
+    def pack(self, articles: List[Dict[str, Any]], render: Callable[[int, Dict[str, Any]], str],
+             overhead: str = "") -> Tuple[List[Dict[str, Any]], str]:
+        """
+        Select and compress articles to fit the budget.
+
+        Args:
+            articles: Articles with title, content, url, published_date and score
+            render: Renders one article, given its 1-based position, as prompt text
+            overhead: The rest of the prompt (instructions, format), counted against the budget
+
+        Returns:
+            The packed articles, in score order with compressed content, and their rendered text
+        """
+        remaining = self.budget - self.counter.count(overhead)
+        packed, parts = [], []
+        for article in sorted(articles, key=self._score, reverse=True):
+            content = clean_text(article.get('content', '')) or article.get('content', '')
+            for variant in self._variants(content):
+                candidate = {**article, 'content': variant}
+                text = render(len(packed) + 1, candidate)
+                tokens = self.counter.count(text)
+                if tokens <= remaining:
+                    packed.append(candidate)
+                    parts.append(text)
+                    remaining -= tokens
+                    break
+        if len(packed) < len(articles):
+            self.logger.info(f"Packed {len(packed)} of {len(articles)} articles into a "
+                             f"{self.budget}-token budget for {self.counter.model_name or 'the model'}")
+        return packed, "".join(parts)
+
+
+def is_context_overflow(error: Exception) -> bool:
+    """
+    Tell whether a provider error means the prompt was too long for the model or its rate limit
+    """
+    message = str(error).lower()
+    return any(marker in message for marker in (
+        "context length", "context_length", "maximum context", "too many tokens", "request too large",
+        "413", "prompt is too long", "input token count"))
@@ -0,0 +1,228 @@
+import asyncio
+import hashlib
+import os
+import threading
+import time
+from collections import deque
+from typing import Any, Dict, Optional, Tuple
+
+# Default (requests per minute, tokens per minute) budgets, overridable with
+# RATE_LIMIT_<PROVIDER>_RPM / RATE_LIMIT_<PROVIDER>_TPM
+DEFAULT_BUDGETS = {
+    'Groq': (30, 6000),
+    'OpenAI': (500, 30000),
+    'Gemini': (10, 250000),
+}
+FALLBACK_BUDGET = (60, 60000)
+
+
+class TokenBucket:
+    """
+    Token bucket that hands out reservations instead of refusing requests.
+
+    A reservation may take the level below zero; the caller then waits until
+    the bucket has refilled to where its reservation is covered. Because every
+    reservation lands behind the earlier ones, waiters are served in arrival
+    order without a separate queue. Not thread-safe on its own.
+    """
+
+    def __init__(self, capacity: float, per_minute: float):
+        self.capacity = float(capacity)
+        self.rate = per_minute / 60.0
+        self.level = float(capacity)
+        self._updated = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        self.level = min(self.capacity, self.level + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def reserve(self, amount: float, now: float) -> float:
+        """
+        Take amount from the bucket and return the seconds to wait until it is covered
+        """
+        self._refill(now)
+        self.level -= min(amount, self.capacity)
+        return max(0.0, -self.level / self.rate) if self.rate > 0 else 0.0
+
+    def refund(self, amount: float, now: float) -> None:
+        """
+        Give back amount (or take more when negative) after the real cost is known
+        """
+        self._refill(now)
+        self.level = min(self.capacity, self.level + amount)
+
+
+class RateLimiter:
+    """
+    Client-side requests-per-minute and tokens-per-minute budget for one
+    provider key and model, shared by every session using that key.
+
+    Callers reserve a request plus an estimate of its tokens and wait their
+    turn instead of failing. When the provider still answers with a rate
+    limit error, penalize() pauses every caller of this key for the
+    retry-after period. Wait times and queue depth are kept for stats().
+    """
+
+    def __init__(self, requests_per_minute: float, tokens_per_minute: float, window: int = 200):
+        """
+        Args:
+            requests_per_minute: Request budget, 0 for no limit
+            tokens_per_minute: Token budget (prompt plus completion), 0 for no limit
+            window: Number of recent waits kept for the wait-time percentiles
+        """
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self._requests = TokenBucket(requests_per_minute, requests_per_minute) if requests_per_minute else None
+        self._tokens = TokenBucket(tokens_per_minute, tokens_per_minute) if tokens_per_minute else None
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+        self._waits = deque(maxlen=window)
+        self._queue_depth = 0
+        self._stats = {"requests": 0, "queued": 0, "rate_limited": 0, "retries": 0, "max_queue_depth": 0,
+                       "total_wait": 0.0, "max_wait": 0.0}
+
+    def _reserve(self, tokens: int) -> float:
+        with self._lock:
+            now = time.monotonic()
+            wait = max(0.0, self._blocked_until - now)
+            if self._requests is not None:
+                wait = max(wait, self._requests.reserve(1, now))
+            if self._tokens is not None:
+                wait = max(wait, self._tokens.reserve(tokens, now))
+            self._stats["requests"] += 1
+            if wait > 0:
+                self._stats["queued"] += 1
+                self._queue_depth += 1
+                self._stats["max_queue_depth"] = max(self._stats["max_queue_depth"], self._queue_depth)
+            return wait
+
+    def _release(self, tokens: int) -> None:
+        with self._lock:
+            now = time.monotonic()
+            if self._requests is not None:
+                self._requests.refund(1, now)
+            if self._tokens is not None:
+                self._tokens.refund(tokens, now)
+
+    def _waited(self, wait: float) -> None:
+        with self._lock:
+            if wait > 0:
+                self._queue_depth -= 1
+            self._waits.append(wait)
+            self._stats["total_wait"] += wait
+            self._stats["max_wait"] = max(self._stats["max_wait"], wait)
+
+    def acquire(self, tokens: int = 0) -> float:
+        """
+        Block until a request of about `tokens` tokens fits the budget; return the seconds waited
+        """
+        wait = self._reserve(tokens)
+        if wait > 0:
+            time.sleep(wait)
+        self._waited(wait)
+        return wait
+
+    async def aacquire(self, tokens: int = 0) -> float:
+        """
+        Async variant of acquire; a cancelled waiter gives its reservation back
+        """
+        wait = self._reserve(tokens)
+        if wait > 0:
+            try:
+                await asyncio.sleep(wait)
+            except asyncio.CancelledError:
+                self._release(tokens)
+                with self._lock:
+                    self._queue_depth -= 1
+                raise
+        self._waited(wait)
+        return wait
+
+    def settle(self, estimated_tokens: int, actual_tokens: Optional[int]) -> None:
+        """
+        Correct the token budget once the real usage of a request is known
+        """
+        if actual_tokens is not None and self._tokens is not None:
+            with self._lock:
+                self._tokens.refund(estimated_tokens - actual_tokens, time.monotonic())
+
+    def penalize(self, retry_after: float) -> None:
+        """
+        Hold every new request for retry_after seconds after a rate limit response
+        """
+        with self._lock:
+            self._blocked_until = max(self._blocked_until, time.monotonic() + retry_after)
+            self._stats["rate_limited"] += 1
+
+    def record_retry(self) -> None:
+        with self._lock:
+            self._stats["retries"] += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return budgets, queue depth, wait-time percentiles and rate limit counters
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            waits = sorted(self._waits)
+            stats["queue_depth"] = self._queue_depth
+        stats.update({
+            "requests_per_minute": self.requests_per_minute,
+            "tokens_per_minute": self.tokens_per_minute,
+            "avg_wait": stats["total_wait"] / stats["requests"] if stats["requests"] else 0.0,
+            "p50_wait": waits[len(waits) // 2] if waits else 0.0,
+            "p95_wait": waits[min(len(waits) - 1, int(len(waits) * 0.95))] if waits else 0.0,
+        })
+        return stats
+
+
+class RateLimiterRegistry:
+    """
+    One RateLimiter per (provider, API key fingerprint, model). Raw keys are
+    never stored, only a short hash that tells keys apart.
+    """
+
+    def __init__(self):
+        self._limiters: Dict[Tuple[str, str, str], RateLimiter] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def fingerprint(api_key: Optional[str]) -> str:
+        return hashlib.sha256((api_key or "").encode()).hexdigest()[:12]
+
+    @staticmethod
+    def budget(provider: str) -> Tuple[float, float]:
+        """
+        Return the (requests per minute, tokens per minute) budget for provider
+        """
+        rpm, tpm = DEFAULT_BUDGETS.get(provider, FALLBACK_BUDGET)
+        prefix = f"RATE_LIMIT_{provider.upper()}"
+        return float(os.getenv(f"{prefix}_RPM", rpm)), float(os.getenv(f"{prefix}_TPM", tpm))
+
+    def get(self, provider: str, api_key: Optional[str], model: str) -> RateLimiter:
+        key = (provider, self.fingerprint(api_key), model)
+        with self._lock:
+            limiter = self._limiters.get(key)
+            if limiter is None:
+                limiter = self._limiters[key] = RateLimiter(*self.budget(provider))
+            return limiter
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            limiters = dict(self._limiters)
+        return {"/".join(key): limiter.stats() for key, limiter in limiters.items()}
+
+
+_default_registry: Optional[RateLimiterRegistry] = None
+_default_registry_lock = threading.Lock()
+
+
+def get_rate_limiter_registry() -> RateLimiterRegistry:
+    """
+    Return the process-wide rate limiter registry shared by every session
+    """
+    global _default_registry
+    with _default_registry_lock:
+        if _default_registry is None:
+            _default_registry = RateLimiterRegistry()
+        return _default_registry
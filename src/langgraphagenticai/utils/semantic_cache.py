@@ -0,0 +1,260 @@
+import json
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Optional
+import logging
+
+import faiss
+import numpy as np
+
+from src.langgraphagenticai.utils.embeddings import get_default_embedder
+
+DEFAULT_CACHE_DIR = os.path.join(".cache", "semantic_cache")
+
+# Saves run off the response path, one at a time, and a burst of stores is written once
+_save_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="semantic-cache-save")
+
+
+def semantic_cache_enabled() -> bool:
+    """
+    Tell whether chat replies are served from the semantic cache (SEMANTIC_CACHE).
+    By default it is only on when a neural embedder (LOCAL_EMBEDDING_MODEL) is
+    loaded, since the hashing embedder cannot tell "AMD stock" from "Nvidia stock".
+    """
+    setting = os.getenv("SEMANTIC_CACHE", "").lower()
+    if setting:
+        return setting not in ("0", "false", "no")
+    return not getattr(get_default_embedder(), "lexical", True)
+
+
+def normalize_prompt(prompt: str) -> str:
+    """
+    Return prompt lowercased, with runs of whitespace collapsed and surrounding punctuation dropped
+    """
+    return re.sub(r"\s+", " ", prompt.lower()).strip(" ?!.,;:")
+
+
+class SemanticCache:
+    """
+    Semantic cache of chatbot responses keyed by (prompt, model, scope).
+
+    Prompts are embedded and stored in one FAISS inner-product index per model
+    and scope, the tenant (e.g. the fingerprint of the API keys) the response
+    was generated for, so one user's answers are never served to another.
+    A lookup returns the cached response of the most similar prompt when its
+    cosine similarity reaches the threshold; with exact_match the normalized
+    prompt text must also be the same. Entries expire after ttl_seconds, the
+    least recently used ones are evicted beyond max_entries, and the cache is
+    persisted to disk in the background so it survives restarts.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = DEFAULT_CACHE_DIR, embedder: Any = None,
+                 similarity_threshold: float = 0.95, ttl_seconds: float = 6 * 3600, max_entries: int = 2000,
+                 exact_match: Optional[bool] = None):
+        """
+        Args:
+            cache_dir: Directory holding the persisted cache, or None to keep it in memory only
+            embedder: Object with embed(texts) -> unit vectors, defaults to the process-wide embedder
+            similarity_threshold: Minimum cosine similarity for a prompt to count as a repeat
+            ttl_seconds: How long a cached response stays valid
+            max_entries: Entries kept before the least recently used ones are evicted
+            exact_match: Only serve a response to the same normalized prompt, defaults to
+                on for lexical embedders such as the hashing embedder
+        """
+        self.cache_dir = cache_dir
+        self.embedder = embedder or get_default_embedder()
+        self.exact_match = getattr(self.embedder, "lexical", True) if exact_match is None else exact_match
+        self.similarity_threshold = similarity_threshold
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.logger = logging.getLogger(__name__)
+
+        self._lock = threading.Lock()
+        # Held while writing the files, so a flush() and a background save never interleave
+        self._save_lock = threading.Lock()
+        self._indexes: Dict[str, faiss.IndexIDMap2] = {}
+        # id -> entry, in least to most recently used order
+        self._entries: "OrderedDict[int, Dict[str, Any]]" = OrderedDict()
+        self._vectors: Dict[int, np.ndarray] = {}
+        self._next_id = 0
+        self._save_pending = False
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0}
+        self._load()
+
+    @staticmethod
+    def _index_key(model: str, scope: str) -> str:
+        return f"{model}\0{scope}"
+
+    def lookup(self, prompt: str, model: str, scope: str = "") -> Optional[str]:
+        """
+        Return the cached response for a prompt similar enough to one seen for model within scope
+        """
+        vector = self.embedder.embed([prompt])
+        now = time.time()
+        with self._lock:
+            index = self._indexes.get(self._index_key(model, scope))
+            if index is None or index.ntotal == 0:
+                self._stats["misses"] += 1
+                return None
+            scores, ids = index.search(vector, 1)
+            entry_id, score = int(ids[0][0]), float(scores[0][0])
+            entry = self._entries.get(entry_id)
+            if entry is not None and entry["expires_at"] <= now:
+                self._remove(entry_id)
+                self._stats["evictions"] += 1
+                entry = None
+            if (entry is None or score < self.similarity_threshold
+                    or (self.exact_match and entry["normalized"] != normalize_prompt(prompt))):
+                self._stats["misses"] += 1
+                return None
+            self._entries.move_to_end(entry_id)
+            self._stats["hits"] += 1
+            return entry["response"]
+
+    def store(self, prompt: str, model: str, response: str, scope: str = "") -> None:
+        """
+        Cache the response given by model for prompt within scope
+        """
+        vector = self.embedder.embed([prompt])
+        with self._lock:
+            self._add(prompt, model, scope, response, vector[0], time.time() + self.ttl_seconds)
+            while len(self._entries) > self.max_entries:
+                self._remove(next(iter(self._entries)))
+                self._stats["evictions"] += 1
+            self._schedule_save()
+
+    def purge_expired(self) -> int:
+        """
+        Drop expired entries and return how many were removed
+        """
+        now = time.time()
+        with self._lock:
+            expired = [entry_id for entry_id, entry in self._entries.items() if entry["expires_at"] <= now]
+            for entry_id in expired:
+                self._remove(entry_id)
+            self._stats["evictions"] += len(expired)
+            if expired:
+                self._schedule_save()
+        return len(expired)
+
+    def clear(self) -> None:
+        """
+        Remove every entry
+        """
+        with self._lock:
+            self._indexes.clear()
+            self._entries.clear()
+            self._vectors.clear()
+            self._schedule_save()
+
+    def flush(self) -> None:
+        """
+        Write the cache to disk now, e.g. before shutting down
+        """
+        self._save()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return hit/miss/eviction counters and the number of cached entries
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats["entries"] = len(self._entries)
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = stats["hits"] / lookups if lookups else 0.0
+        return stats
+
+    def _add(self, prompt: str, model: str, scope: str, response: str, vector: np.ndarray,
+             expires_at: float) -> None:
+        index_key = self._index_key(model, scope)
+        index = self._indexes.get(index_key)
+        if index is None:
+            index = self._indexes[index_key] = faiss.IndexIDMap2(faiss.IndexFlatIP(self.embedder.dimensions))
+        entry_id = self._next_id
+        self._next_id += 1
+        index.add_with_ids(vector.reshape(1, -1).astype(np.float32), np.array([entry_id], dtype=np.int64))
+        self._entries[entry_id] = {"prompt": prompt, "normalized": normalize_prompt(prompt), "model": model,
+                                   "scope": scope, "response": response, "expires_at": expires_at}
+        self._vectors[entry_id] = vector
+
+    def _remove(self, entry_id: int) -> None:
+        entry = self._entries.pop(entry_id)
+        self._vectors.pop(entry_id, None)
+        index = self._indexes.get(self._index_key(entry["model"], entry["scope"]))
+        if index is not None:
+            index.remove_ids(np.array([entry_id], dtype=np.int64))
+
+    def _paths(self):
+        return (os.path.join(self.cache_dir, "entries.json"), os.path.join(self.cache_dir, "vectors.npy"))
+
+    def _schedule_save(self) -> None:
+        # Called with the lock held; a save already queued will pick up this change
+        if self.cache_dir and not self._save_pending:
+            self._save_pending = True
+            _save_pool.submit(self._save)
+
+    def _save(self) -> None:
+        if not self.cache_dir:
+            return
+        with self._save_lock:
+            with self._lock:
+                self._save_pending = False
+                entries = list(self._entries.values())
+                vectors = (np.stack([self._vectors[entry_id] for entry_id in self._entries])
+                           if entries else np.zeros((0, self.embedder.dimensions), dtype=np.float32))
+            try:
+                os.makedirs(self.cache_dir, exist_ok=True)
+                entries_path, vectors_path = self._paths()
+                # Write to temporary files and swap them in so a crash never leaves a torn cache
+                with open(entries_path + ".tmp", "w", encoding="utf-8") as f:
+                    json.dump({"embedder": self.embedder.name, "entries": entries}, f)
+                with open(vectors_path + ".tmp", "wb") as f:
+                    np.save(f, vectors)
+                os.replace(vectors_path + ".tmp", vectors_path)
+                os.replace(entries_path + ".tmp", entries_path)
+            except (OSError, ValueError) as e:
+                self.logger.warning(f"Semantic cache save failed: {str(e)}")
+
+    def _load(self) -> None:
+        if not self.cache_dir:
+            return
+        entries_path, vectors_path = self._paths()
+        if not (os.path.exists(entries_path) and os.path.exists(vectors_path)):
+            return
+        try:
+            with open(entries_path, encoding="utf-8") as f:
+                data = json.load(f)
+            vectors = np.load(vectors_path)
+            if data.get("embedder") != self.embedder.name or len(vectors) != len(data["entries"]):
+                self.logger.info("Discarding semantic cache built with a different embedder")
+                return
+            now = time.time()
+            for entry, vector in zip(data["entries"], vectors):
+                # Entries saved before responses were scoped to a tenant are dropped
+                if entry["expires_at"] > now and "scope" in entry:
+                    self._add(entry["prompt"], entry["model"], entry["scope"], entry["response"], vector,
+                              entry["expires_at"])
+        except (OSError, ValueError, KeyError) as e:
+            self.logger.warning(f"Semantic cache load failed: {str(e)}")
+
+
+_default_cache: Optional[SemanticCache] = None
+_default_cache_lock = threading.Lock()
+
+
+def get_default_semantic_cache() -> SemanticCache:
+    """
+    Return the process-wide semantic response cache
+    """
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = SemanticCache(
+                cache_dir=os.getenv("SEMANTIC_CACHE_DIR", DEFAULT_CACHE_DIR),
+                similarity_threshold=float(os.getenv("SEMANTIC_CACHE_THRESHOLD", "0.95"))
+            )
+        return _default_cache
@@ -0,0 +1,224 @@
+import asyncio
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+import logging
+
+
+class _Flight:
+    """
+    One in-progress computation that concurrent callers for the same key wait on
+    """
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+# Result handed to async followers when their leader was cancelled, telling them to retry
+_LEADER_CANCELLED = object()
+
+
+class ToolResultCache:
+    """
+    In-process TTL cache for tool results shared by every session.
+
+    Entries expire after ttl_seconds and the least recently used ones are
+    evicted beyond max_entries. Identical calls that arrive while the first one
+    is still running wait for its result instead of running again
+    (single-flight), in both the threaded and the async path.
+    """
+
+    def __init__(self, ttl_seconds: float = 600.0, max_entries: int = 1024):
+        """
+        Args:
+            ttl_seconds: How long a cached result stays valid
+            max_entries: Entries kept before the least recently used ones are evicted
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.logger = logging.getLogger(__name__)
+
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._flights: Dict[str, _Flight] = {}
+        self._async_flights: Dict[Tuple[int, str], asyncio.Future] = {}
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "coalesced": 0, "evictions": 0, "uncacheable": 0}
+
+    @staticmethod
+    def make_key(namespace: str, arguments: Dict[str, Any]) -> str:
+        """
+        Build the cache key for one tool call. String arguments are lowercased
+        and their whitespace collapsed, so trivially different phrasings of the
+        same query share an entry.
+        """
+        normalized = {name: " ".join(value.lower().split()) if isinstance(value, str) else value
+                      for name, value in arguments.items()}
+        return json.dumps([namespace, normalized], sort_keys=True, separators=(",", ":"), default=str)
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Return the cached result for key, or None when missing or expired
+        """
+        with self._lock:
+            value = self._lookup(key)
+            if value is None:
+                self._stats["misses"] += 1
+            return value
+
+    def set(self, key: str, value: Any) -> None:
+        """
+        Store a result under key
+        """
+        with self._lock:
+            self._store(key, value)
+
+    def get_or_compute(self, key: str, compute: Callable[[], Any],
+                       cacheable: Callable[[Any], bool] = lambda value: True) -> Any:
+        """
+        Return the cached result for key, or run compute() once for all concurrent callers
+        """
+        with self._lock:
+            value = self._lookup(key)
+            if value is not None:
+                return value
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+            self._stats["misses" if leader else "coalesced"] += 1
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+
+        try:
+            flight.result = compute()
+            self._finish(key, flight.result, cacheable)
+            return flight.result
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                self._flights.pop(key, None)
+            flight.done.set()
+
+    async def aget_or_compute(self, key: str, compute: Callable[[], Awaitable[Any]],
+                              cacheable: Callable[[Any], bool] = lambda value: True) -> Any:
+        """
+        Async variant of get_or_compute; callers on the same event loop share one computation.
+        If the caller running it is cancelled, the others retry and one of them runs it instead.
+        """
+        flight_key = (id(asyncio.get_running_loop()), key)
+        first_attempt = True
+        while True:
+            with self._lock:
+                value = self._lookup(key)
+                if value is not None:
+                    return value
+                future = self._async_flights.get(flight_key)
+                leader = future is None
+                if leader:
+                    future = self._async_flights[flight_key] = asyncio.get_running_loop().create_future()
+                if first_attempt:
+                    self._stats["misses" if leader else "coalesced"] += 1
+                first_attempt = False
+
+            if leader:
+                break
+            # Shield so a cancelled follower does not cancel the shared result
+            value = await asyncio.shield(future)
+            if value is not _LEADER_CANCELLED:
+                return value
+
+        try:
+            value = await compute()
+            self._finish(key, value, cacheable)
+            future.set_result(value)
+            return value
+        except asyncio.CancelledError:
+            # Drop the flight before waking the followers, so one of them becomes the new leader
+            self._end_async_flight(flight_key, future)
+            future.set_result(_LEADER_CANCELLED)
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # Mark the exception as retrieved when no follower was waiting
+            future.exception()
+            raise
+        finally:
+            self._end_async_flight(flight_key, future)
+
+    def clear(self) -> None:
+        """
+        Remove every entry
+        """
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return hit/miss/coalescing counters and the number of cached entries
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats["entries"] = len(self._entries)
+        calls = stats["hits"] + stats["misses"] + stats["coalesced"]
+        stats["hit_rate"] = (stats["hits"] + stats["coalesced"]) / calls if calls else 0.0
+        return stats
+
+    def _lookup(self, key: str) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires_at, value = entry
+            if expires_at > time.time():
+                self._entries.move_to_end(key)
+                self._stats["hits"] += 1
+                return value
+            del self._entries[key]
+            self._stats["evictions"] += 1
+        return None
+
+    def _store(self, key: str, value: Any) -> None:
+        self._entries[key] = (time.time() + self.ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self._stats["evictions"] += 1
+
+    def _end_async_flight(self, flight_key: Tuple[int, str], future: asyncio.Future) -> None:
+        with self._lock:
+            if self._async_flights.get(flight_key) is future:
+                del self._async_flights[flight_key]
+
+    def _finish(self, key: str, value: Any, cacheable: Callable[[Any], bool]) -> None:
+        with self._lock:
+            if cacheable(value):
+                self._store(key, value)
+            else:
+                self._stats["uncacheable"] += 1
+
+
+_default_cache: Optional[ToolResultCache] = None
+_default_cache_lock = threading.Lock()
+
+
+def get_default_tool_cache() -> ToolResultCache:
+    """
+    Return the process-wide tool result cache shared by every session
+    """
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = ToolResultCache(
+                ttl_seconds=float(os.getenv("TOOL_CACHE_TTL_SECONDS", "600")),
+                max_entries=int(os.getenv("TOOL_CACHE_MAX_ENTRIES", "1024"))
+            )
+        return _default_cache
@@ -0,0 +1,410 @@
+import json
+import os
+import threading
+import time
+import uuid
+from collections import deque
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Iterator, List, Optional
+from uuid import UUID
+import logging
+
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.messages import BaseMessage, ToolMessage
+from langchain_core.outputs import LLMResult
+
+DEFAULT_TRACE_PATH = os.path.join(".cache", "traces.jsonl")
+
+# Upper bounds (seconds) of the span duration histogram buckets
+DURATION_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+def _payload_size(value: Any) -> int:
+    """
+    Approximate size in bytes of a node, model or tool payload
+    """
+    if value is None:
+        return 0
+    if isinstance(value, str):
+        return len(value.encode("utf-8", errors="ignore"))
+    if isinstance(value, BaseMessage):
+        return _payload_size(value.content)
+    if isinstance(value, dict):
+        return sum(_payload_size(v) for v in value.values())
+    if isinstance(value, (list, tuple)):
+        return sum(_payload_size(v) for v in value)
+    return len(str(value))
+
+
+class Trace:
+    """
+    Spans recorded for one conversation turn.
+
+    Spans are plain dicts with kind ("graph", "node", "llm", "tool", "build",
+    "render"), name, start time, duration, status, error, payload sizes and,
+    for model calls, token counts. Spans from LangChain callbacks come from
+    callback_handler(); anything else is timed with span() or add_span().
+    """
+
+    def __init__(self, collector: "TraceCollector", usecase: str, thread_id: Optional[str] = None):
+        self.collector = collector
+        self.trace_id = uuid.uuid4().hex
+        self.usecase = usecase
+        self.thread_id = thread_id
+        self.started_at = time.time()
+        self.spans: List[Dict[str, Any]] = []
+        self.finished = False
+        self._lock = threading.Lock()
+
+    def new_span(self, kind: str, name: str, parent_id: Optional[str] = None, **fields: Any) -> Dict[str, Any]:
+        return {"trace_id": self.trace_id, "span_id": uuid.uuid4().hex[:16], "parent_id": parent_id,
+                "kind": kind, "name": name, "start": time.time(), "_perf": time.perf_counter(),
+                "duration": None, "status": "ok", "error": None, **fields}
+
+    def end_span(self, span: Dict[str, Any], error: Optional[BaseException] = None, **fields: Any) -> None:
+        span["duration"] = time.perf_counter() - span.pop("_perf")
+        if error is not None:
+            span["status"], span["error"] = "error", repr(error)
+        span.update(fields)
+        with self._lock:
+            self.spans.append(span)
+
+    def add_span(self, kind: str, name: str, duration: float, **fields: Any) -> None:
+        """
+        Record a span measured elsewhere, e.g. time accumulated across several UI updates
+        """
+        span = self.new_span(kind, name, **fields)
+        span.pop("_perf")
+        span.update(start=time.time() - duration, duration=duration)
+        with self._lock:
+            self.spans.append(span)
+
+    @contextmanager
+    def span(self, kind: str, name: str, **fields: Any) -> Iterator[Dict[str, Any]]:
+        """
+        Time the enclosed block as one span
+        """
+        span = self.new_span(kind, name, **fields)
+        try:
+            yield span
+        except BaseException as e:
+            self.end_span(span, error=e)
+            raise
+        self.end_span(span)
+
+    def callback_handler(self) -> "TracingCallbackHandler":
+        return TracingCallbackHandler(self)
+
+    def with_callbacks(self, config: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Return a copy of a graph run config that also reports to this trace
+        """
+        config = dict(config or {})
+        config["callbacks"] = list(config.get("callbacks") or []) + [self.callback_handler()]
+        return config
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Return total time per span kind, token counts and errors for this turn
+        """
+        with self._lock:
+            spans = list(self.spans)
+        by_kind: Dict[str, float] = {}
+        for span in spans:
+            by_kind[span["kind"]] = by_kind.get(span["kind"], 0.0) + (span["duration"] or 0.0)
+        return {
+            "trace_id": self.trace_id,
+            "usecase": self.usecase,
+            "started_at": self.started_at,
+            "spans": len(spans),
+            "duration_by_kind": by_kind,
+            "total_tokens": sum(span.get("total_tokens") or 0 for span in spans),
+            "errors": sum(span["status"] == "error" for span in spans),
+        }
+
+    def finish(self) -> None:
+        """
+        Hand the trace to its collector for export; later calls do nothing
+        """
+        with self._lock:
+            if self.finished:
+                return
+            self.finished = True
+        self.collector.record(self)
+
+
+class TracingCallbackHandler(BaseCallbackHandler):
+    """
+    LangChain callback handler that turns graph, node, chat model and tool
+    runs into spans of a Trace. Runs that are neither (e.g. the runnables
+    inside a node) are not recorded, but their children are attached to the
+    nearest recorded ancestor.
+    """
+
+    # Only updates in-memory state, so it is safe to call inline from the event loop
+    run_inline = True
+
+    def __init__(self, trace: Trace):
+        self.trace = trace
+        self._open: Dict[UUID, Dict[str, Any]] = {}
+        self._parents: Dict[UUID, Optional[UUID]] = {}
+        self._lock = threading.Lock()
+
+    def _parent_span(self, parent_run_id: Optional[UUID]) -> Optional[Dict[str, Any]]:
+        while parent_run_id is not None:
+            span = self._open.get(parent_run_id)
+            if span is not None:
+                return span
+            parent_run_id = self._parents.get(parent_run_id)
+        return None
+
+    def _start(self, run_id: UUID, parent_run_id: Optional[UUID], kind: Optional[str], name: str,
+               **fields: Any) -> None:
+        with self._lock:
+            self._parents[run_id] = parent_run_id
+            parent = self._parent_span(parent_run_id)
+            # A node's own runnable runs inside the node run under the same name
+            if kind is None or (parent is not None and (parent["kind"], parent["name"]) == (kind, name)):
+                return
+            self._open[run_id] = self.trace.new_span(kind, name, parent["span_id"] if parent else None, **fields)
+
+    def _end(self, run_id: UUID, error: Optional[BaseException] = None, **fields: Any) -> None:
+        with self._lock:
+            self._parents.pop(run_id, None)
+            span = self._open.pop(run_id, None)
+        if span is not None:
+            self.trace.end_span(span, error=error, **fields)
+
+    def on_chain_start(self, serialized: Optional[Dict[str, Any]], inputs: Any, *, run_id: UUID,
+                       parent_run_id: Optional[UUID] = None, metadata: Optional[Dict[str, Any]] = None,
+                       **kwargs: Any) -> None:
+        name = kwargs.get("name") or (serialized or {}).get("name") or "chain"
+        node = (metadata or {}).get("langgraph_node")
+        if parent_run_id is None:
+            kind = "graph"
+        elif node is not None and name == node:
+            kind = "node"
+        else:
+            kind = None
+        self._start(run_id, parent_run_id, kind, name, input_bytes=_payload_size(inputs))
+
+    def on_chain_end(self, outputs: Any, *, run_id: UUID, **kwargs: Any) -> None:
+        self._end(run_id, output_bytes=_payload_size(outputs))
+
+    def on_chain_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any) -> None:
+        self._end(run_id, error=error)
+
+    def on_chat_model_start(self, serialized: Optional[Dict[str, Any]], messages: List[List[BaseMessage]], *,
+                            run_id: UUID, parent_run_id: Optional[UUID] = None,
+                            metadata: Optional[Dict[str, Any]] = None, **kwargs: Any) -> None:
+        metadata = metadata or {}
+        provider = metadata.get("ls_provider") or "llm"
+        model = metadata.get("ls_model_name") or kwargs.get("name") or "model"
+        self._start(run_id, parent_run_id, "llm", f"{provider}/{model}", input_bytes=_payload_size(messages))
+
+    def on_llm_end(self, response: LLMResult, *, run_id: UUID, **kwargs: Any) -> None:
+        generation = response.generations[0][0] if response.generations and response.generations[0] else None
+        message = getattr(generation, "message", None)
+        usage = getattr(message, "usage_metadata", None) or {}
+        fields = {
+            "output_bytes": _payload_size(message) if message is not None else _payload_size(generation and generation.text),
+            "prompt_tokens": usage.get("input_tokens"),
+            "completion_tokens": usage.get("output_tokens"),
+            "total_tokens": usage.get("total_tokens"),
+        }
+        routed_to = (getattr(message, "response_metadata", None) or {}).get("routed_to")
+        if routed_to:
+            fields["routed_to"] = routed_to
+        self._end(run_id, **fields)
+
+    def on_llm_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any) -> None:
+        self._end(run_id, error=error)
+
+    def on_tool_start(self, serialized: Optional[Dict[str, Any]], input_str: str, *, run_id: UUID,
+                      parent_run_id: Optional[UUID] = None, **kwargs: Any) -> None:
+        name = kwargs.get("name") or (serialized or {}).get("name") or "tool"
+        self._start(run_id, parent_run_id, "tool", name, input_bytes=_payload_size(input_str))
+
+    def on_tool_end(self, output: Any, *, run_id: UUID, **kwargs: Any) -> None:
+        failed = isinstance(output, ToolMessage) and output.status == "error"
+        self._end(run_id, output_bytes=_payload_size(output),
+                  **({"status": "error", "error": str(output.content)[:200]} if failed else {}))
+
+    def on_tool_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any) -> None:
+        self._end(run_id, error=error)
+
+
+class TraceCollector:
+    """
+    Process-wide sink for finished traces.
+
+    Keeps the last `keep` traces in memory for the UI, appends every span to
+    a JSONL file (rotated to <file>.1 once it reaches max_bytes) and aggregates span counts, duration histograms, errors and
+    token totals for the Prometheus text format.
+    """
+
+    def __init__(self, jsonl_path: Optional[str] = DEFAULT_TRACE_PATH, keep: int = 50,
+                 max_bytes: Optional[int] = 10 * 1024 * 1024):
+        """
+        Args:
+            jsonl_path: File the spans are appended to, or None to keep them in memory only
+            keep: Number of recent traces kept for recent()
+            max_bytes: Size at which the file is moved to <jsonl_path>.1, replacing the previous
+                one, so at most about twice this is kept on disk; None for no limit
+        """
+        self.jsonl_path = jsonl_path
+        self.max_bytes = max_bytes
+        self.logger = logging.getLogger(__name__)
+        self._recent = deque(maxlen=keep)
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._traces_total: Dict[str, int] = {}
+        self._spans: Dict[tuple, Dict[str, Any]] = {}
+        self._tokens: Dict[tuple, int] = {}
+
+    def start_trace(self, usecase: str, thread_id: Optional[str] = None) -> Trace:
+        return Trace(self, usecase, thread_id)
+
+    def record(self, trace: Trace) -> None:
+        with trace._lock:
+            spans = sorted(trace.spans, key=lambda span: span["start"])
+        with self._lock:
+            self._recent.append(trace)
+            self._traces_total[trace.usecase] = self._traces_total.get(trace.usecase, 0) + 1
+            for span in spans:
+                self._aggregate(span)
+        self._export(trace, spans)
+
+    def _aggregate(self, span: Dict[str, Any]) -> None:
+        metric = self._spans.setdefault((span["kind"], span["name"]), {
+            "count": 0, "errors": 0, "sum": 0.0, "buckets": [0] * len(DURATION_BUCKETS)})
+        duration = span["duration"] or 0.0
+        metric["count"] += 1
+        metric["errors"] += span["status"] == "error"
+        metric["sum"] += duration
+        for i, bound in enumerate(DURATION_BUCKETS):
+            if duration <= bound:
+                metric["buckets"][i] += 1
+        if span["kind"] == "llm":
+            for token_type in ("prompt", "completion"):
+                count = span.get(f"{token_type}_tokens")
+                if count:
+                    key = (span["name"], token_type)
+                    self._tokens[key] = self._tokens.get(key, 0) + count
+
+    def _export(self, trace: Trace, spans: List[Dict[str, Any]]) -> None:
+        if not self.jsonl_path:
+            return
+        lines = "".join(json.dumps({**span, "usecase": trace.usecase, "thread_id": trace.thread_id},
+                                   default=str) + "\n" for span in spans)
+        try:
+            with self._write_lock:
+                os.makedirs(os.path.dirname(self.jsonl_path) or ".", exist_ok=True)
+                if (self.max_bytes and os.path.exists(self.jsonl_path)
+                        and os.path.getsize(self.jsonl_path) + len(lines) > self.max_bytes):
+                    os.replace(self.jsonl_path, self.jsonl_path + ".1")
+                with open(self.jsonl_path, "a", encoding="utf-8") as f:
+                    f.write(lines)
+        except OSError as e:
+            self.logger.warning(f"Could not write traces to {self.jsonl_path}: {str(e)}")
+
+    def recent(self, n: int = 10, thread_id: Optional[str] = None) -> List[Trace]:
+        """
+        Return the last n finished traces, newest first, only those of thread_id when given
+        """
+        with self._lock:
+            traces = [trace for trace in self._recent if thread_id is None or trace.thread_id == thread_id]
+        return traces[-n:][::-1]
+
+    def prometheus_text(self) -> str:
+        """
+        Render the aggregated metrics in the Prometheus text exposition format
+        """
+        def labels(**values: Any) -> str:
+            escaped = (str(v).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") for v in values.values())
+            return "{" + ",".join(f'{k}="{v}"' for k, v in zip(values, escaped)) + "}"
+
+        with self._lock:
+            traces_total = dict(self._traces_total)
+            spans = {key: {**m, "buckets": list(m["buckets"])} for key, m in self._spans.items()}
+            tokens = dict(self._tokens)
+
+        lines = ["# HELP agentic_traces_total Conversation turns traced.", "# TYPE agentic_traces_total counter"]
+        lines += [f"agentic_traces_total{labels(usecase=u)} {n}" for u, n in sorted(traces_total.items())]
+        lines += ["# HELP agentic_span_duration_seconds Duration of graph, node, model and tool spans.",
+                  "# TYPE agentic_span_duration_seconds histogram"]
+        for (kind, name), m in sorted(spans.items()):
+            for bound, count in zip(DURATION_BUCKETS, m["buckets"]):
+                lines.append(f"agentic_span_duration_seconds_bucket{labels(kind=kind, name=name, le=bound)} {count}")
+            lines.append(f"agentic_span_duration_seconds_bucket{labels(kind=kind, name=name, le='+Inf')} {m['count']}")
+            lines.append(f"agentic_span_duration_seconds_sum{labels(kind=kind, name=name)} {m['sum']:.6f}")
+            lines.append(f"agentic_span_duration_seconds_count{labels(kind=kind, name=name)} {m['count']}")
+        lines += ["# HELP agentic_span_errors_total Spans that ended in an error.",
+                  "# TYPE agentic_span_errors_total counter"]
+        lines += [f"agentic_span_errors_total{labels(kind=kind, name=name)} {m['errors']}"
+                  for (kind, name), m in sorted(spans.items())]
+        lines += ["# HELP agentic_llm_tokens_total Tokens reported by model calls.",
+                  "# TYPE agentic_llm_tokens_total counter"]
+        lines += [f"agentic_llm_tokens_total{labels(model=model, type=token_type)} {n}"
+                  for (model, token_type), n in sorted(tokens.items())]
+        return "\n".join(lines) + "\n"
+
+
+_default_collector: Optional[TraceCollector] = None
+_default_collector_lock = threading.Lock()
+
+
+def get_trace_collector() -> TraceCollector:
+    """
+    Return the process-wide trace collector. Spans go to TRACE_JSONL_PATH
+    (default .cache/traces.jsonl), rotated at TRACE_JSONL_MAX_MB (default 10, 0 for
+    no limit); set the path to an empty string to keep them in memory only.
+    """
+    global _default_collector
+    with _default_collector_lock:
+        if _default_collector is None:
+            _default_collector = TraceCollector(
+                jsonl_path=os.getenv("TRACE_JSONL_PATH", DEFAULT_TRACE_PATH) or None,
+                keep=int(os.getenv("TRACE_KEEP", "50")),
+                max_bytes=int(float(os.getenv("TRACE_JSONL_MAX_MB", "10")) * 1024 * 1024) or None
+            )
+        return _default_collector
+
+
+_metrics_server: Optional[ThreadingHTTPServer] = None
+_metrics_server_lock = threading.Lock()
+
+
+def start_metrics_server(port: int, host: str = "0.0.0.0") -> Optional[ThreadingHTTPServer]:
+    """
+    Serve the collector's Prometheus metrics on http://host:port/metrics from a
+    daemon thread, for deployments without the HTTP API. Started once per process;
+    returns None when the port cannot be bound.
+    """
+    global _metrics_server
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?")[0] != "/metrics":
+                self.send_error(404)
+                return
+            body = get_trace_collector().prometheus_text().encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    with _metrics_server_lock:
+        if _metrics_server is None:
+            try:
+                _metrics_server = ThreadingHTTPServer((host, port), MetricsHandler)
+            except OSError as e:
+                logging.getLogger(__name__).warning(f"Could not serve metrics on port {port}: {str(e)}")
+                return None
+            threading.Thread(target=_metrics_server.serve_forever, name="metrics-server", daemon=True).start()
+        return _metrics_server
@@ -0,0 +1,93 @@
+from langchain_core.messages import AIMessage, HumanMessage, RemoveMessage, SystemMessage, ToolMessage
+
+from benchmarks.fakes import FakeChatModel
+from src.langgraphagenticai.utils.history_compactor import HistoryCompactor, split_turns
+
+CONFIG = {"configurable": {"thread_id": "t1"}}
+
+
+def conversation(turns, words=60):
+    messages = []
+    for i in range(turns):
+        messages.append(HumanMessage(content=f"question {i} " + "word " * words, id=f"h{i}"))
+        messages.append(AIMessage(content=f"answer {i} " + "word " * words, id=f"a{i}"))
+    return messages
+
+
+def make_compactor(**kwargs):
+    options = {"keep_turns": 2, "token_budget": 400}
+    options.update(kwargs)
+    return HistoryCompactor(FakeChatModel(response="The user asked about words."), **options)
+
+
+def wait_for_summary(compactor, thread_id="t1"):
+    compactor._pending[thread_id].result(timeout=5)
+
+
+def test_split_turns_keeps_tool_calls_with_their_results():
+    messages = [HumanMessage(content="q"), AIMessage(content="", tool_calls=[{"name": "search", "args": {}, "id": "c"}]),
+                ToolMessage(content="r", tool_call_id="c"), AIMessage(content="a"), HumanMessage(content="q2")]
+    assert [len(turn) for turn in split_turns(messages)] == [4, 1]
+
+
+def test_short_history_is_sent_unchanged():
+    compactor = make_compactor(token_budget=10000)
+    messages = conversation(2)
+    assert compactor.prompt({"messages": messages}) == messages
+    assert compactor.compact({"messages": messages}, CONFIG) == {}
+    assert not compactor._pending
+
+
+def test_over_budget_prompt_drops_the_oldest_turns_and_keeps_the_current_one():
+    compactor = make_compactor()
+    messages = conversation(6)
+    prompt = compactor.prompt({"messages": messages})
+    assert compactor.count_tokens(prompt) <= compactor.token_budget
+    assert prompt[-2:] == messages[-2:]
+    assert messages[0] not in prompt
+
+
+def test_over_budget_prompt_shortens_older_tool_results():
+    compactor = make_compactor(max_tool_chars=50, token_budget=600)
+    messages = [HumanMessage(content="search", id="h0"),
+                AIMessage(content="", tool_calls=[{"name": "search", "args": {}, "id": "c"}], id="a0"),
+                ToolMessage(content="result " * 400, tool_call_id="c", name="search", id="t0"),
+                AIMessage(content="done", id="a1"),
+                HumanMessage(content="and now?", id="h1")]
+    prompt = compactor.prompt({"messages": messages})
+    tool_result = next(message for message in prompt if isinstance(message, ToolMessage))
+    assert tool_result.content.endswith("[truncated]")
+    assert prompt[-1] == messages[-1]
+
+
+def test_old_turns_are_summarized_and_removed_on_the_next_turn():
+    compactor = make_compactor()
+    messages = conversation(6)
+    # The first turn over the threshold only starts the summary
+    assert compactor.compact({"messages": messages}, CONFIG) == {}
+    wait_for_summary(compactor)
+
+    update = compactor.compact({"messages": messages}, CONFIG)
+    assert update["history_summary"] == "The user asked about words."
+    removed = {message.id for message in update["messages"]}
+    assert all(isinstance(message, RemoveMessage) for message in update["messages"])
+    # The last keep_turns turns stay verbatim
+    assert removed == {message.id for message in messages[:-4]}
+
+    prompt = compactor.prompt({"messages": messages[-4:], "history_summary": update["history_summary"]})
+    assert isinstance(prompt[0], SystemMessage) and "The user asked about words." in prompt[0].content
+
+
+def test_summary_is_dropped_when_the_conversation_changed_under_it():
+    compactor = make_compactor()
+    messages = conversation(6)
+    compactor.compact({"messages": messages}, CONFIG)
+    wait_for_summary(compactor)
+    # Another turn applied a different summary meanwhile
+    assert compactor.compact({"messages": messages, "history_summary": "other"}, CONFIG) == {}
+
+
+def test_nothing_is_compacted_without_a_thread():
+    compactor = make_compactor()
+    assert compactor.compact({"messages": conversation(6)}, {}) == {}
+    assert not compactor._pending
@@ -0,0 +1,66 @@
+import sqlite3
+import time
+
+from src.langgraphagenticai.utils.news_cache import NewsCache
+
+
+def disk_rows(path):
+    with sqlite3.connect(path) as conn:
+        return conn.execute("SELECT COUNT(*) FROM news_cache").fetchone()[0]
+
+
+def test_make_key_ignores_domain_order():
+    assert NewsCache.make_key("ai", 3, ["b.com", "a.com"], 5) == NewsCache.make_key("ai", 3, ["a.com", "b.com"], 5)
+    assert NewsCache.make_key("ai", 3, [], 5) != NewsCache.make_key("ai", 7, [], 5)
+
+
+def test_memory_tier_serves_until_the_ttl():
+    cache = NewsCache(db_path=None, ttl_seconds=0.05)
+    cache.set("k", {"results": [1]})
+    assert cache.get("k") == {"results": [1]}
+    time.sleep(0.1)
+    assert cache.get("k") is None
+    stats = cache.stats()
+    assert stats["memory_hits"] == 1 and stats["misses"] == 1 and stats["evictions"] == 1
+
+
+def test_disk_tier_survives_a_restart(tmp_path):
+    path = str(tmp_path / "news.sqlite3")
+    NewsCache(db_path=path).set("k", {"results": [1]})
+    reopened = NewsCache(db_path=path)
+    assert reopened.get("k") == {"results": [1]}
+    assert reopened.stats()["disk_hits"] == 1
+    # The disk hit is promoted to the memory tier
+    assert reopened.get("k") == {"results": [1]}
+    assert reopened.stats()["memory_hits"] == 1
+
+
+def test_memory_tier_evicts_the_least_recently_used_entry(tmp_path):
+    cache = NewsCache(db_path=None, max_memory_entries=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1 and cache.get("c") == 3
+
+
+def test_expired_entries_are_purged_on_open(tmp_path):
+    path = str(tmp_path / "news.sqlite3")
+    NewsCache(db_path=path, ttl_seconds=0.05).set("k", 1)
+    time.sleep(0.1)
+    assert disk_rows(path) == 1
+    NewsCache(db_path=path)
+    assert disk_rows(path) == 0
+
+
+def test_expired_entries_are_purged_every_purge_every_writes(tmp_path):
+    path = str(tmp_path / "news.sqlite3")
+    cache = NewsCache(db_path=path, ttl_seconds=0.05, purge_every=3)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    time.sleep(0.1)
+    cache.set("c", 3)
+    assert disk_rows(path) == 1
+    assert cache.get("c") == 3
+    assert cache.stats()["purges"] == 2
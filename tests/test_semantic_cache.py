@@ -0,0 +1,61 @@
+import time
+
+from src.langgraphagenticai.utils.embeddings import HashingEmbedder
+from src.langgraphagenticai.utils.semantic_cache import SemanticCache, normalize_prompt
+
+
+def make_cache(**kwargs):
+    return SemanticCache(cache_dir=None, embedder=HashingEmbedder(), **kwargs)
+
+
+def test_normalize_prompt():
+    assert normalize_prompt("  What is   LangGraph?? ") == "what is langgraph"
+
+
+def test_same_prompt_is_served_from_the_cache():
+    cache = make_cache()
+    cache.store("What is LangGraph?", "llama", "A graph library")
+    assert cache.lookup("what is  langgraph", "llama") == "A graph library"
+    assert cache.stats()["hits"] == 1
+
+
+def test_exact_match_rejects_a_different_prompt():
+    cache = make_cache(similarity_threshold=0.0)
+    cache.store("AMD stock price", "llama", "AMD answer")
+    assert cache.lookup("Nvidia stock price", "llama") is None
+    assert cache.stats()["misses"] == 1
+
+
+def test_responses_are_kept_per_model_and_scope():
+    cache = make_cache()
+    cache.store("hello", "llama", "from tenant a", scope="a")
+    assert cache.lookup("hello", "llama", scope="b") is None
+    assert cache.lookup("hello", "gpt", scope="a") is None
+    assert cache.lookup("hello", "llama", scope="a") == "from tenant a"
+
+
+def test_entries_expire_after_the_ttl():
+    cache = make_cache(ttl_seconds=0.05)
+    cache.store("hello", "llama", "hi")
+    time.sleep(0.1)
+    assert cache.lookup("hello", "llama") is None
+    assert cache.stats()["evictions"] == 1
+
+
+def test_least_recently_used_entries_are_evicted():
+    cache = make_cache(max_entries=2)
+    cache.store("first", "llama", "1")
+    cache.store("second", "llama", "2")
+    assert cache.lookup("first", "llama") == "1"
+    cache.store("third", "llama", "3")
+    assert cache.lookup("second", "llama") is None
+    assert cache.lookup("first", "llama") == "1" and cache.lookup("third", "llama") == "3"
+    assert cache.stats()["entries"] == 2
+
+
+def test_cache_is_persisted_and_reloaded(tmp_path):
+    cache = SemanticCache(cache_dir=str(tmp_path), embedder=HashingEmbedder())
+    cache.store("hello", "llama", "hi", scope="a")
+    cache.flush()
+    reloaded = SemanticCache(cache_dir=str(tmp_path), embedder=HashingEmbedder())
+    assert reloaded.lookup("hello", "llama", scope="a") == "hi"
@@ -0,0 +1,165 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from src.langgraphagenticai.utils.tool_cache import ToolResultCache
+
+
+def test_make_key_normalizes_string_arguments():
+    assert (ToolResultCache.make_key("search", {"query": "  AI   News "})
+            == ToolResultCache.make_key("search", {"query": "ai news"}))
+    assert ToolResultCache.make_key("search", {"query": "ai"}) != ToolResultCache.make_key("other", {"query": "ai"})
+
+
+def test_concurrent_threads_share_one_computation():
+    cache = ToolResultCache()
+    calls = []
+    release = threading.Event()
+
+    def compute():
+        calls.append(1)
+        release.wait(5)
+        return "result"
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(cache.get_or_compute("k", compute)))
+               for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    # Let every thread join the flight before the leader finishes
+    time.sleep(0.1)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert results == ["result"] * 5
+    assert len(calls) == 1
+    stats = cache.stats()
+    assert stats["misses"] == 1 and stats["coalesced"] == 4
+
+
+def test_thread_followers_get_the_leaders_error():
+    cache = ToolResultCache()
+    started = threading.Event()
+
+    def compute():
+        started.set()
+        time.sleep(0.1)
+        raise ValueError("boom")
+
+    errors = []
+
+    def call():
+        try:
+            cache.get_or_compute("k", compute)
+        except ValueError as e:
+            errors.append(str(e))
+
+    leader = threading.Thread(target=call)
+    leader.start()
+    started.wait(5)
+    follower = threading.Thread(target=call)
+    follower.start()
+    leader.join(5)
+    follower.join(5)
+
+    assert errors == ["boom", "boom"]
+    assert cache.stats()["entries"] == 0
+
+
+def test_async_callers_share_one_computation():
+    cache = ToolResultCache()
+    calls = []
+
+    async def compute():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return "result"
+
+    async def main():
+        return await asyncio.gather(*(cache.aget_or_compute("k", compute) for _ in range(5)))
+
+    assert asyncio.run(main()) == ["result"] * 5
+    assert len(calls) == 1
+    assert cache.stats()["coalesced"] == 4
+
+
+def test_cancelled_async_leader_hands_over_to_a_follower():
+    cache = ToolResultCache()
+    calls = []
+
+    async def compute():
+        calls.append(1)
+        await asyncio.sleep(0.1)
+        return f"result {len(calls)}"
+
+    async def main():
+        leader = asyncio.ensure_future(cache.aget_or_compute("k", compute))
+        await asyncio.sleep(0.01)
+        followers = [asyncio.ensure_future(cache.aget_or_compute("k", compute)) for _ in range(3)]
+        await asyncio.sleep(0.01)
+        leader.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        return await asyncio.gather(*followers)
+
+    # One follower recomputes and the others share its result
+    assert asyncio.run(main()) == ["result 2"] * 3
+    assert len(calls) == 2
+    assert cache.stats()["entries"] == 1
+
+
+def test_cancelled_async_follower_does_not_cancel_the_leader():
+    cache = ToolResultCache()
+
+    async def compute():
+        await asyncio.sleep(0.05)
+        return "result"
+
+    async def main():
+        leader = asyncio.ensure_future(cache.aget_or_compute("k", compute))
+        await asyncio.sleep(0.01)
+        follower = asyncio.ensure_future(cache.aget_or_compute("k", compute))
+        await asyncio.sleep(0.01)
+        follower.cancel()
+        return await leader
+
+    assert asyncio.run(main()) == "result"
+
+
+def test_entries_expire_after_the_ttl():
+    cache = ToolResultCache(ttl_seconds=0.05)
+    cache.set("k", "value")
+    assert cache.get("k") == "value"
+    time.sleep(0.1)
+    assert cache.get("k") is None
+    assert cache.stats()["evictions"] == 1
+    assert cache.get_or_compute("k", lambda: "fresh") == "fresh"
+
+
+def test_least_recently_used_entries_are_evicted():
+    cache = ToolResultCache(max_entries=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    # Reading "a" makes "b" the least recently used entry
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1 and cache.get("c") == 3
+    assert cache.stats()["evictions"] == 1
+
+
+def test_uncacheable_results_are_returned_but_not_stored():
+    cache = ToolResultCache()
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return "error"
+
+    for _ in range(2):
+        assert cache.get_or_compute("k", compute, cacheable=lambda value: value != "error") == "error"
+    assert len(calls) == 2
+    assert cache.stats()["uncacheable"] == 2